@@ -0,0 +1,455 @@
+"""
+Toplu (Headless) Rota Planlama
+Manifestteki örnekleri süreç havuzunda çözer, sonuçları JSON Lines olarak yazar
+
+Kullanım:
+    python batch.py manifest.json --output sonuclar.jsonl --workers 4
+    python batch.py bolgeler.jsonl --offline --profile
+
+Manifest (JSON):
+    {
+        "defaults": {"params": {"strategy": "mmas"}, "seeds": [0, 1],
+                     "matrix": {"knn": null, "compact": false}},
+        "instances": [
+            {"name": "ankara", "locations": "data/ankara.csv",
+             "params": [{"n_ants": 30}, {"n_ants": 60}], "seeds": [0, 1, 2],
+             "matrix": {"road_network": "ankara_yollar.npz"}, "time_budget": 60},
+            {"name": "konya", "locations": "data/konya.geojson",
+             "start": ["Konya Müdürlüğü", 37.87, 32.49]}
+        ]
+    }
+
+"start" verilmezse Streamlit ile aynı başlangıç noktası eklenir; null ise
+dosyanın ilk satırı başlangıçtır; [ad, lat, lng] ile koordinatı da verilebilir.
+
+.jsonl manifestlerde her satır bir örnektir (varsayılanlar kullanılmaz).
+Göreli dosya yolları manifest dosyasının dizinine göre çözülür.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import time
+import multiprocessing as mp
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from dotenv import load_dotenv
+
+from config import ACOConfig, CacheConfig
+from data.coordinates import baslangic_noktasi
+
+
+# Manifestte belirtilmeyen ACO parametreleri (Streamlit varsayılanlarıyla aynı)
+DEFAULT_PARAMS = {
+    'n_ants': ACOConfig.N_ANTS,
+    'n_iterations': ACOConfig.N_ITERATIONS,
+    'alpha': ACOConfig.ALPHA,
+    'beta': ACOConfig.BETA,
+    'evaporation_rate': ACOConfig.EVAPORATION_RATE,
+    'Q': ACOConfig.Q,
+    'strategy': ACOConfig.STRATEGY,
+    'patience': ACOConfig.PATIENCE or None
+}
+
+# params içinde verilemeyen anahtarlar (pipeline.solve() bunları ayrıca geçirir;
+# tohumlar 'seeds' listesiyle verilir)
+RESERVED_PARAMS = ('distance_matrix', 'seed', 'instrumentation')
+
+# create_distance_matrix() seçenekleri
+MATRIX_OPTIONS = ('use_api', 'compact', 'knn', 'road_network')
+
+# İşçi süreç başına bellekte tutulan hazır örnek sayısı (bir örneğin işleri
+# birlikte kuyruğa girdiğinden birkaç örnek yeterlidir)
+PREPARED_CACHE_SIZE = 4
+
+# İşçi süreç başına paylaşılan kaynaklar (_init_worker ile kurulur)
+_worker = {}
+
+
+def _resolve(path, base):
+    return path if path is None or os.path.isabs(path) else os.path.join(base, path)
+
+
+def load_manifest(path):
+    """
+    Manifesti oku ve örnekleri varsayılanlarla tamamla
+    
+    Args:
+        path: .json veya .jsonl manifest dosyası
+    
+    Returns:
+        list: [{'name', 'locations', 'start', 'params' (liste), 'seeds',
+                'matrix', 'time_budget'}, ...]
+    
+    Raises:
+        ValueError: Tekrarlanan örnek adı, bilinmeyen matris seçeneği veya
+                    params içinde ayrılmış anahtar (seed, instrumentation) varsa
+    """
+    base = os.path.dirname(os.path.abspath(path))
+    with open(path, encoding='utf-8') as f:
+        if path.lower().endswith(('.jsonl', '.ndjson')):
+            defaults = {}
+            entries = [json.loads(line) for line in f if line.strip()]
+        else:
+            manifest = json.load(f)
+            defaults = manifest.get('defaults', {})
+            entries = manifest['instances']
+    
+    instances = []
+    names = set()
+    for number, entry in enumerate(entries, 1):
+        name = entry.get('name') or f"instance-{number}"
+        if name in names:
+            raise ValueError(f"Manifestte tekrarlanan örnek adı: {name}")
+        names.add(name)
+        
+        params = entry.get('params', [{}])
+        params = params if isinstance(params, list) else [params]
+        reserved = set(defaults.get('params', {})).union(*params) & set(RESERVED_PARAMS)
+        if reserved:
+            raise ValueError(f"{name}: params içinde kullanılamayan anahtarlar {sorted(reserved)} "
+                             f"(tohumlar için 'seeds' kullanın)")
+        matrix = {**defaults.get('matrix', {}), **entry.get('matrix', {})}
+        unknown = set(matrix) - set(MATRIX_OPTIONS)
+        if unknown:
+            raise ValueError(f"{name}: bilinmeyen matris seçenekleri {sorted(unknown)}")
+        matrix['road_network'] = _resolve(matrix.get('road_network'), base)
+        
+        locations = _resolve(entry.get('locations', defaults.get('locations')), base)
+        start = entry.get('start', defaults.get('start', baslangic_noktasi))
+        if locations is None and not isinstance(start, str):
+            raise ValueError(f"{name}: lokasyon dosyası olmadan 'start' bir ad olmalı")
+        
+        instances.append({
+            'name': name,
+            'locations': locations,
+            'start': start,
+            'params': [{**DEFAULT_PARAMS, **defaults.get('params', {}), **item}
+                       for item in params],
+            'seeds': entry.get('seeds', defaults.get('seeds', [None])),
+            'matrix': matrix,
+            'time_budget': entry.get('time_budget', defaults.get('time_budget'))
+        })
+    return instances
+
+
+def _init_worker(api_key, cache_dir, spill_dir=None):
+    """
+    İşçi sürecin Google Maps istemcisini ve disk önbelleklerini kur
+    
+    Args:
+        api_key: Google Maps API anahtarı (None ise istemci kurulmaz)
+        cache_dir: Geocoding / matris önbellek dizini
+        spill_dir: Hazır örnek matrislerinin süreçler arası paylaşıldığı
+                   çalıştırma dizini (None: havuzsuz çalıştırma, paylaşım yok)
+    """
+    from core.geocache import GeocodeCache
+    from core.matrix_store import MatrixStore
+    
+    _worker['gmaps'] = None
+    if api_key:
+        import googlemaps
+        _worker['gmaps'] = googlemaps.Client(key=api_key)
+    _worker['geocode_cache'] = GeocodeCache(
+        cache_dir,
+        ttl=CacheConfig.GEOCODE_TTL_DAYS * 24 * 3600,
+        max_entries=CacheConfig.GEOCODE_MAX_ENTRIES,
+        memory_size=CacheConfig.GEOCODE_MEMORY_SIZE
+    )
+    _worker['matrix_store'] = MatrixStore(
+        os.path.join(cache_dir, CacheConfig.MATRIX_DIR),
+        max_entries=CacheConfig.MATRIX_MAX_ENTRIES,
+        ttl=CacheConfig.MATRIX_TTL_DAYS * 24 * 3600
+    )
+    _worker['road_networks'] = {}
+    _worker['spill'] = MatrixStore(spill_dir, max_entries=None) if spill_dir else None
+    _worker['prepared'] = OrderedDict()
+
+
+def _road_network(path):
+    """Yol ağını işçi süreç başına bir kez yükle"""
+    from core.road_network import RoadNetwork, RoadNetworkFetcher
+    
+    if path not in _worker['road_networks']:
+        _worker['road_networks'][path] = RoadNetworkFetcher(RoadNetwork.load(path))
+    return _worker['road_networks'][path]
+
+
+def _instance_key(name):
+    return hashlib.sha256(name.encode('utf-8')).hexdigest()
+
+
+def _remember(key, matrices):
+    """Hazır matrisleri süreç içi önbelleğe ekle (en eski kullanılan çıkar)"""
+    prepared = _worker['prepared']
+    prepared[key] = matrices
+    prepared.move_to_end(key)
+    while len(prepared) > PREPARED_CACHE_SIZE:
+        prepared.popitem(last=False)
+
+
+def _spill(key, distance_matrix, time_matrix):
+    """Matrisleri diğer işçilerin yükleyebileceği çalıştırma dizinine yaz"""
+    import numpy as np
+    from core.compact import is_packed
+    
+    spill = _worker['spill']
+    if spill is None:
+        return
+    if isinstance(distance_matrix, np.ndarray) or is_packed(distance_matrix):
+        spill.put(key, distance_matrix, time_matrix)
+    else:
+        # KNNGraph gibi dizi olmayan gösterimler bir kez pickle'lanır
+        with open(os.path.join(spill.directory, key + '.pickle'), 'wb') as f:
+            pickle.dump((distance_matrix, time_matrix), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _load_matrices(key):
+    """
+    Örneğin matrislerini bu süreçte bul
+    
+    Önce süreç içi önbelleğe, sonra çalıştırma dizinine bakılır; diziler
+    bellek eşlemeli açıldığından aynı makinedeki işçiler veriyi kopyalamaz.
+    """
+    if key in _worker['prepared']:
+        _worker['prepared'].move_to_end(key)
+        return _worker['prepared'][key]
+    
+    spill = _worker['spill']
+    if spill is None:
+        raise KeyError(f"Hazır örnek bu süreçte bulunamadı: {key[:12]}")
+    matrices = spill.get(key)
+    if matrices is None:
+        with open(os.path.join(spill.directory, key + '.pickle'), 'rb') as f:
+            matrices = pickle.load(f)
+    _remember(key, matrices)
+    return matrices
+
+
+def prepare_instance(instance):
+    """
+    Örneğin koordinatlarını ve matrislerini hazırla (işçi süreçte)
+    
+    Aynı örneğin tüm parametre / tohum işleri bu çıktıyı paylaşır; böylece
+    geocoding ve matris (API veya yol ağı) her örnek için bir kez yapılır.
+    Matrisler ana sürece dönmez: hazırlayan işçinin belleğinde ve çalıştırma
+    dizininde kalır, işlere yalnızca örnek anahtarı gönderilir.
+    
+    Returns:
+        dict: {'key', 'names', 'timings'}
+    """
+    from core import pipeline
+    from data.coordinates import get_catalog
+    
+    timings = {}
+    started = time.perf_counter()
+    catalog = get_catalog(instance['locations'], start=instance['start'])
+    coordinates = pipeline.geocode(catalog, _worker['gmaps'], _worker['geocode_cache'])
+    timings['geocode'] = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    options = {key: value for key, value in instance['matrix'].items() if value is not None}
+    if 'road_network' in options:
+        options['road_network'] = _road_network(options['road_network'])
+    distance_matrix, time_matrix = pipeline.build_matrices(
+        coordinates, _worker['gmaps'], _worker['matrix_store'], **options
+    )
+    timings['matrix'] = time.perf_counter() - started
+    
+    key = _instance_key(instance['name'])
+    _spill(key, distance_matrix, time_matrix)
+    _remember(key, (distance_matrix, time_matrix))
+    
+    return {
+        'key': key,
+        'names': catalog.names.tolist(),
+        'timings': timings
+    }
+
+
+def solve_job(prepared, job, profile=False):
+    """
+    Tek parametre / tohum işini çöz (işçi süreçte)
+    
+    Args:
+        prepared: prepare_instance() çıktısı (matrisler anahtarla yüklenir)
+        job: expand_jobs() işi
+        profile: Kayda aşama ölçümlerini ekle
+    
+    Returns:
+        dict: JSON Lines kaydı
+    """
+    from core import pipeline
+    from core.instrumentation import Instrumentation
+    
+    distance_matrix, time_matrix = _load_matrices(prepared['key'])
+    instrumentation = Instrumentation() if profile else None
+    started = time.perf_counter()
+    result = pipeline.solve(distance_matrix, time_matrix, prepared['names'], job['params'],
+                            job['seed'], job['time_budget'], instrumentation)
+    
+    record = _job_record(job, status='ok')
+    record.update({
+        'n_locations': len(prepared['names']),
+        'total_distance': result['total_distance'],
+        'total_time': result['total_time'],
+        'iterations': result['iterations'],
+        'stop_reason': result['stop_reason'],
+        'route': result['route'],
+        'route_names': result['route_names'],
+        'timings': {**prepared['timings'], 'optimize': time.perf_counter() - started}
+    })
+    if profile:
+        record['profile'] = instrumentation.to_dict()
+    return record
+
+
+def expand_jobs(instance):
+    """Örneği (parametre seti x tohum) işlerine aç"""
+    return [{'instance': instance['name'], 'params_index': index, 'params': params,
+             'seed': seed, 'time_budget': instance['time_budget']}
+            for index, params in enumerate(instance['params'])
+            for seed in instance['seeds']]
+
+
+def _job_record(job, status, error=None):
+    record = {'instance': job['instance'], 'params_index': job['params_index'],
+              'seed': job['seed'], 'params': job['params'], 'status': status}
+    if error is not None:
+        record['error'] = f"{type(error).__name__}: {error}"
+    return record
+
+
+def run_batch(instances, output, workers=None, api_key=None, cache_dir=CacheConfig.CACHE_DIR,
+              profile=False, verbose=True):
+    """
+    Tüm örnekleri çöz ve sonuçları JSON Lines olarak yaz
+    
+    Örnek hazırlıkları (geocoding + matris) ve çözüm işleri aynı süreç
+    havuzunda çalışır; bir örnek hazır olur olmaz işleri kuyruğa eklenir.
+    Kayıtlar tamamlanma sırasıyla yazılır ve hemen diske aktarılır. Hata
+    veren örnek / iş diğerlerini durdurmaz, 'status': 'error' kaydı üretir.
+    
+    Args:
+        instances: load_manifest() çıktısı
+        output: Sonuç dosyası (.jsonl)
+        workers: İşçi süreç sayısı (1: havuzsuz, aynı süreçte)
+        api_key: Google Maps API anahtarı (None ise önbellek + Haversine)
+        cache_dir: Geocoding / matris önbellek dizini
+        profile: Kayıtlara aşama ölçümlerini ekle
+        verbose: Her işi yazdır
+    
+    Returns:
+        dict: {'jobs', 'failed', 'wall_time'}
+    """
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+    summary = {'jobs': 0, 'failed': 0}
+    
+    with open(output, 'w', encoding='utf-8') as f:
+        def emit(record):
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            f.flush()
+            summary['jobs'] += 1
+            if record['status'] != 'ok':
+                summary['failed'] += 1
+            if verbose:
+                label = f"{record['instance']} p{record['params_index']}"
+                if record['seed'] is not None:
+                    label += f" s{record['seed']}"
+                if record['status'] == 'ok':
+                    timings = record['timings']
+                    print(f"{label:<32} {record['total_distance']:10.2f} km  "
+                          f"geocode {timings['geocode']:6.2f}s  matris {timings['matrix']:6.2f}s  "
+                          f"aco {timings['optimize']:6.2f}s")
+                else:
+                    print(f"{label:<32} HATA {record['error']}")
+        
+        if workers <= 1:
+            _init_worker(api_key, cache_dir)
+            for instance in instances:
+                try:
+                    prepared = prepare_instance(instance)
+                except Exception as e:
+                    for job in expand_jobs(instance):
+                        emit(_job_record(job, 'error', e))
+                    continue
+                for job in expand_jobs(instance):
+                    try:
+                        emit(solve_job(prepared, job, profile))
+                    except Exception as e:
+                        emit(_job_record(job, 'error', e))
+        else:
+            # Hazır matrisler bu dizin üzerinden işçiler arasında paylaşılır
+            os.makedirs(cache_dir, exist_ok=True)
+            spill_dir = tempfile.mkdtemp(prefix='batch-', dir=cache_dir)
+            try:
+                _run_pool(instances, emit, workers, api_key, cache_dir, spill_dir, profile)
+            finally:
+                shutil.rmtree(spill_dir, ignore_errors=True)
+    
+    summary['wall_time'] = time.perf_counter() - started
+    return summary
+
+
+def _run_pool(instances, emit, workers, api_key, cache_dir, spill_dir, profile):
+    """Hazırlık ve çözüm işlerini süreç havuzunda çalıştır, kayıtları emit() ile yaz"""
+    with ProcessPoolExecutor(workers, mp_context=mp.get_context(),
+                             initializer=_init_worker,
+                             initargs=(api_key, cache_dir, spill_dir)) as executor:
+        pending = {executor.submit(prepare_instance, instance): ('prepare', instance)
+                   for instance in instances}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                kind, item = pending.pop(future)
+                error = future.exception()
+                if kind == 'prepare':
+                    for job in expand_jobs(item):
+                        if error is not None:
+                            emit(_job_record(job, 'error', error))
+                        else:
+                            pending[executor.submit(solve_job, future.result(), job,
+                                                    profile)] = ('solve', job)
+                else:
+                    emit(future.result() if error is None
+                         else _job_record(item, 'error', error))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manifestteki örnekleri toplu çöz")
+    parser.add_argument('manifest', help=".json veya .jsonl manifest dosyası")
+    parser.add_argument('--output', default='batch_results.jsonl')
+    parser.add_argument('--workers', type=int, default=None,
+                        help="İşçi süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument('--api-key', default=None,
+                        help="Google Maps API anahtarı (varsayılan: GOOGLE_MAPS_API_KEY)")
+    parser.add_argument('--offline', action='store_true',
+                        help="API kullanma (önbellek, dosya koordinatları ve Haversine)")
+    parser.add_argument('--cache-dir', default=CacheConfig.CACHE_DIR)
+    parser.add_argument('--profile', action='store_true',
+                        help="Kayıtlara aşama ölçümlerini ekle")
+    parser.add_argument('--quiet', action='store_true')
+    args = parser.parse_args(argv)
+    
+    load_dotenv()
+    api_key = None if args.offline else (args.api_key or os.getenv('GOOGLE_MAPS_API_KEY'))
+    
+    instances = load_manifest(args.manifest)
+    summary = run_batch(instances, args.output, workers=args.workers, api_key=api_key,
+                        cache_dir=args.cache_dir, profile=args.profile, verbose=not args.quiet)
+    
+    print(f"{summary['jobs']} iş ({summary['failed']} hatalı) {summary['wall_time']:.1f} s "
+          f"içinde tamamlandı: {args.output}")
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
@@ -0,0 +1,2 @@
+"""Benchmark modülü - ACO performans ölçümleri"""
+
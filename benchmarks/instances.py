@@ -0,0 +1,174 @@
+"""
+Benchmark Örnekleri
+Tohumlu sentetik örnekler ve TSPLIB dosyaları
+"""
+
+import math
+import os
+
+import numpy as np
+
+from core.haversine import haversine_matrix
+
+
+# Ankara il sınırlarını kapsayan dikdörtgen (lat, lng)
+ANKARA_BBOX = ((39.20, 31.60), (40.65, 33.95))
+
+# Türkiye'yi kapsayan dikdörtgen (uniform / clustered örnekler için)
+TURKEY_BBOX = ((36.0, 26.0), (42.0, 45.0))
+
+KINDS = ('uniform', 'clustered', 'ankara')
+
+# Yaygın TSPLIB örneklerinin bilinen optimum tur uzunlukları
+KNOWN_OPTIMA = {
+    'eil51': 426, 'berlin52': 7542, 'st70': 675, 'eil76': 538, 'pr76': 108159,
+    'rat99': 1211, 'kroA100': 21282, 'lin105': 14379, 'ch130': 6110,
+    'ch150': 6528, 'a280': 2579
+}
+
+
+def generate_instance(kind, n, seed=0):
+    """
+    Tohumlu sentetik örnek üret
+    
+    Args:
+        kind: 'uniform' (Türkiye geneli), 'clustered' (Türkiye geneli,
+              Gauss kümeleri) veya 'ankara' (Ankara sınırları içinde)
+        n: Nokta sayısı
+        seed: Rastgele sayı üreteci tohumu
+    
+    Returns:
+        dict: {'name', 'coordinates', 'distance_matrix', 'optimum' (None)}
+    """
+    if kind not in KINDS:
+        raise ValueError(f"Bilinmeyen örnek türü: {kind} (seçenekler: {KINDS})")
+    
+    rng = np.random.default_rng(seed)
+    (lat_min, lng_min), (lat_max, lng_max) = ANKARA_BBOX if kind == 'ankara' else TURKEY_BBOX
+    low, high = np.array([lat_min, lng_min]), np.array([lat_max, lng_max])
+    
+    if kind == 'clustered':
+        n_clusters = max(1, int(round(math.sqrt(n) / 2)))
+        centers = rng.uniform(low, high, size=(n_clusters, 2))
+        spread = (high - low) / (4 * math.sqrt(n_clusters))
+        members = rng.integers(0, n_clusters, size=n)
+        coordinates = np.clip(centers[members] + rng.normal(0, 1, (n, 2)) * spread, low, high)
+    else:
+        coordinates = rng.uniform(low, high, size=(n, 2))
+    
+    return {
+        'name': f"{kind}-{n}-s{seed}",
+        'coordinates': coordinates,
+        'distance_matrix': haversine_matrix(coordinates),
+        'optimum': None
+    }
+
+
+def _tsplib_distances(kind, coordinates):
+    """TSPLIB EDGE_WEIGHT_TYPE kurallarına göre tamsayı mesafe matrisi"""
+    x, y = coordinates[:, 0], coordinates[:, 1]
+    dx, dy = x[:, None] - x[None, :], y[:, None] - y[None, :]
+    
+    if kind == 'EUC_2D':
+        return np.floor(np.sqrt(dx ** 2 + dy ** 2) + 0.5)
+    if kind == 'CEIL_2D':
+        return np.ceil(np.sqrt(dx ** 2 + dy ** 2))
+    if kind == 'ATT':
+        r = np.sqrt((dx ** 2 + dy ** 2) / 10.0)
+        t = np.floor(r + 0.5)
+        return np.where(t < r, t + 1, t)
+    if kind == 'GEO':
+        # Derece.dakika biçimi -> radyan
+        degrees = np.trunc(coordinates)
+        radians = np.pi * (degrees + 5.0 * (coordinates - degrees) / 3.0) / 180.0
+        lat, lng = radians[:, 0], radians[:, 1]
+        q1 = np.cos(lng[:, None] - lng[None, :])
+        q2 = np.cos(lat[:, None] - lat[None, :])
+        q3 = np.cos(lat[:, None] + lat[None, :])
+        distances = np.floor(6378.388 * np.arccos(
+            np.clip(0.5 * ((1 + q1) * q2 - (1 - q1) * q3), -1, 1)) + 1.0)
+        np.fill_diagonal(distances, 0)
+        return distances
+    raise ValueError(f"Desteklenmeyen EDGE_WEIGHT_TYPE: {kind}")
+
+
+def _explicit_matrix(fmt, values, n):
+    """EXPLICIT EDGE_WEIGHT_SECTION değerlerinden NxN matris"""
+    matrix = np.zeros((n, n))
+    if fmt == 'FULL_MATRIX':
+        return np.asarray(values[:n * n], dtype=float).reshape(n, n)
+    
+    # *_COL biçimleri karşı üçgenin satır sırasıyla aynıdır (matris simetrik)
+    if fmt in ('UPPER_ROW', 'LOWER_COL'):
+        rows, cols = np.triu_indices(n, 1)
+    elif fmt in ('LOWER_ROW', 'UPPER_COL'):
+        rows, cols = np.tril_indices(n, -1)
+    elif fmt in ('UPPER_DIAG_ROW', 'LOWER_DIAG_COL'):
+        rows, cols = np.triu_indices(n)
+    elif fmt in ('LOWER_DIAG_ROW', 'UPPER_DIAG_COL'):
+        rows, cols = np.tril_indices(n)
+    else:
+        raise ValueError(f"Desteklenmeyen EDGE_WEIGHT_FORMAT: {fmt}")
+    
+    matrix[rows, cols] = values[:len(rows)]
+    matrix[cols, rows] = values[:len(rows)]
+    return matrix
+
+
+def load_tsplib(path, optimum=None):
+    """
+    TSPLIB .tsp dosyasını yükle
+    
+    EUC_2D, CEIL_2D, ATT, GEO ve EXPLICIT (tam / üçgen) mesafe türleri
+    desteklenir. Bilinen optimum verilmezse KNOWN_OPTIMA tablosundan alınır.
+    
+    Args:
+        path: .tsp dosyası
+        optimum: Bilinen optimum tur uzunluğu (opsiyonel)
+    
+    Returns:
+        dict: {'name', 'coordinates' (veya None), 'distance_matrix', 'optimum'}
+    """
+    header = {}
+    coordinates = []
+    weights = []
+    section = None
+    
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line == 'EOF':
+                continue
+            if line.endswith('_SECTION'):
+                section = line
+                continue
+            if ':' in line:
+                # Başlık satırı (sayısal bölümlerde ':' bulunmaz)
+                key, _, value = line.partition(':')
+                header[key.strip()] = value.strip()
+                section = None
+                continue
+            if section == 'NODE_COORD_SECTION':
+                _, x, y = line.split()[:3]
+                coordinates.append((float(x), float(y)))
+            elif section == 'EDGE_WEIGHT_SECTION':
+                weights.extend(float(value) for value in line.split())
+    
+    name = header.get('NAME', os.path.splitext(os.path.basename(path))[0])
+    n = int(header['DIMENSION'])
+    kind = header.get('EDGE_WEIGHT_TYPE', 'EUC_2D')
+    coordinates = np.array(coordinates, dtype=float) if coordinates else None
+    
+    if kind == 'EXPLICIT':
+        distance_matrix = _explicit_matrix(header.get('EDGE_WEIGHT_FORMAT', 'FULL_MATRIX'),
+                                           np.asarray(weights), n)
+    else:
+        distance_matrix = _tsplib_distances(kind, coordinates)
+    
+    return {
+        'name': name,
+        'coordinates': coordinates,
+        'distance_matrix': distance_matrix,
+        'optimum': optimum if optimum is not None else KNOWN_OPTIMA.get(name)
+    }
+
@@ -0,0 +1,369 @@
+"""
+ACO Benchmark Çalıştırıcı
+Sentetik ve TSPLIB örneklerinde süre, hedefe ulaşma, boşluk ve bellek ölçümü
+
+Kullanım:
+    python -m benchmarks.run --suite quick
+    python -m benchmarks.run --suite full --tsplib berlin52.tsp eil51.tsp
+    python -m benchmarks.run --suite quick --save-baseline
+    python -m benchmarks.run --sizes 1000 --no-baseline
+    python -m benchmarks.run --sizes 500 --configs mmas-cand --profile profile.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from core.ant_algorithm import AntColonyOptimizer
+from core.instrumentation import Instrumentation
+from core.local_search import LocalSearch
+
+from .instances import KINDS, generate_instance, load_tsplib
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+# Tüm konfigürasyonlarda ortak ACO parametreleri
+BASE_PARAMS = {'n_ants': 20, 'alpha': 1.0, 'beta': 3.0, 'evaporation_rate': 0.3, 'Q': 100}
+
+# Konfigürasyon adı -> AntColonyOptimizer parametreleri
+# ('local_search': True ise LocalSearch örneğe göre kurulur)
+CONFIGS = {
+    'as': {'strategy': 'as'},
+    'mmas': {'strategy': 'mmas'},
+    'acs': {'strategy': 'acs'},
+    'mmas-cand': {'strategy': 'mmas', 'n_candidates': 15},
+    'acs-cand': {'strategy': 'acs', 'n_candidates': 15},
+    'mmas-cand-ls': {'strategy': 'mmas', 'n_candidates': 15, 'local_search': True}
+}
+
+# Paket adı -> örnek boyutları, konfigürasyonlar, iterasyon ve süre sınırları
+SUITES = {
+    'quick': {'sizes': (10, 50, 200), 'configs': ('as', 'mmas', 'acs', 'mmas-cand'),
+              'n_iterations': 100, 'time_budget': 5.0},
+    'full': {'sizes': (10, 100, 500, 1000, 2000, 5000),
+             'configs': ('mmas-cand', 'acs-cand', 'mmas-cand-ls'),
+             'n_iterations': 500, 'time_budget': 60.0}
+}
+
+# Karşılaştırmada metrik -> (daha iyi yön, tolerans türü)
+METRICS = {
+    'wall_time': ('lower', 'relative'),
+    'time_to_target': ('lower', 'relative'),
+    'iterations_per_second': ('higher', 'relative'),
+    'gap': ('lower', 'absolute'),
+    'peak_memory_mb': ('lower', 'relative')
+}
+
+# Bellek ölçümünde çalıştırılan iterasyon sayısı (tepe bellek yapı kurulumu ve ilk
+# iterasyonlarda oluşur; izleme yavaş olduğundan zamanlanan çalıştırmadan ayrıdır)
+MEMORY_ITERATIONS = 3
+
+# Kısa ölçümlerde (min_duration altında) karşılaştırılmayan zamanlama metrikleri
+TIMING_METRICS = ('wall_time', 'time_to_target', 'iterations_per_second')
+
+
+def reference_length(distance_matrix):
+    """
+    Optimumu bilinmeyen örnekler için referans tur uzunluğu
+    
+    En yakın komşu turu 2-opt / Or-opt ile yerel optimuma taşınır.
+    """
+    n = len(distance_matrix)
+    route = [0]
+    unvisited = np.ones(n, dtype=bool)
+    unvisited[0] = False
+    for _ in range(1, n):
+        next_city = int(np.argmin(np.where(unvisited, distance_matrix[route[-1]], np.inf)))
+        route.append(next_city)
+        unvisited[next_city] = False
+    
+    local_search = LocalSearch(distance_matrix)
+    route, _ = local_search.improve(route)
+    return local_search.route_length(route)
+
+
+def _create_optimizer(matrix, config, seed, n_iterations, instrumentation=None):
+    params = {**BASE_PARAMS, **CONFIGS[config], 'n_iterations': n_iterations, 'seed': seed}
+    if params.pop('local_search', False):
+        params['local_search'] = LocalSearch(matrix)
+    return AntColonyOptimizer(matrix, instrumentation=instrumentation, **params)
+
+
+def peak_memory(matrix, config, seed=0, n_iterations=MEMORY_ITERATIONS):
+    """
+    Optimizer kurulumu ve ilk iterasyonların tepe bellek kullanımı
+    
+    tracemalloc her ayırmayı izleyip çalışmayı yavaşlattığından zaman
+    ölçümlerinden ayrı, kısa bir çalıştırmada ölçülür.
+    
+    Returns:
+        float: MB cinsinden tepe bellek
+    """
+    tracemalloc.start()
+    try:
+        optimizer = _create_optimizer(matrix, config, seed, n_iterations)
+        for _ in optimizer.iterate():
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 2 ** 20
+
+
+def run_case(instance, config, seed=0, n_iterations=100, time_budget=None, target_gap=0.05,
+             profile=False):
+    """
+    Tek örnek / konfigürasyon ölçümü
+    
+    Zamanlama metrikleri izleme kapalıyken ölçülür; tepe bellek ayrı bir
+    kısa çalıştırmada (peak_memory()) ölçülür.
+    
+    Args:
+        instance: generate_instance() veya load_tsplib() çıktısı
+                  ('reference' anahtarı yoksa hesaplanır)
+        config: CONFIGS anahtarı
+        seed: Optimizer tohumu
+        n_iterations: En fazla iterasyon
+        time_budget: Saniye cinsinden süre bütçesi (opsiyonel)
+        target_gap: Hedef; optimum (veya referans) üzerinde bu orana inilmesi
+        profile: Aşama ölçümlerini kayda ekle ('profile' anahtarı)
+    
+    Returns:
+        dict: Ölçüm kaydı
+    """
+    matrix = instance['distance_matrix']
+    reference = instance.get('optimum') or instance.get('reference')
+    if reference is None:
+        reference = instance['reference'] = reference_length(matrix)
+    target = reference * (1 + target_gap)
+    
+    started = time.perf_counter()
+    optimizer = _create_optimizer(matrix, config, seed, n_iterations,
+                                  instrumentation=Instrumentation() if profile else None)
+    
+    time_to_target = None
+    iterations = 0
+    for snapshot in optimizer.iterate(time_budget=time_budget):
+        iterations = snapshot['iteration']
+        if time_to_target is None and snapshot['best_distance'] <= target:
+            time_to_target = time.perf_counter() - started
+    
+    wall_time = time.perf_counter() - started
+    
+    record = {
+        'instance': instance['name'],
+        'n': len(matrix),
+        'config': config,
+        'seed': seed,
+        'iterations': iterations,
+        'stop_reason': optimizer.stop_reason,
+        'wall_time': wall_time,
+        'time_to_target': time_to_target,
+        'iterations_per_second': iterations / wall_time if wall_time > 0 else None,
+        'best_distance': float(optimizer.best_distance),
+        'reference': float(reference),
+        'reference_kind': 'optimum' if instance.get('optimum') else 'nn+local_search',
+        'gap': float(optimizer.best_distance / reference - 1),
+        'peak_memory_mb': peak_memory(matrix, config, seed, min(n_iterations, MEMORY_ITERATIONS))
+    }
+    if profile:
+        record['profile'] = optimizer.instrumentation.to_dict()
+    return record
+
+
+def run_suite(suite='quick', kinds=KINDS, seeds=(0,), tsplib=(), sizes=None, configs=None,
+              target_gap=0.05, profile=False, verbose=True):
+    """
+    Benchmark paketini çalıştır
+    
+    Args:
+        suite: SUITES anahtarı
+        kinds: Sentetik örnek türleri
+        seeds: Örnek ve optimizer tohumları
+        tsplib: TSPLIB .tsp dosya yolları
+        sizes: Paket boyutlarının yerine kullanılacak boyutlar (opsiyonel)
+        configs: Paket konfigürasyonlarının yerine kullanılacaklar (opsiyonel)
+        target_gap: Hedefe ulaşma süresi için boşluk oranı
+        profile: Her ölçüme aşama dökümü ekle
+        verbose: Her ölçümü yazdır
+    
+    Returns:
+        dict: {'meta': {...}, 'results': [...]}
+    """
+    settings = SUITES[suite]
+    sizes = sizes or settings['sizes']
+    configs = configs or settings['configs']
+    
+    instances = [generate_instance(kind, n, seed)
+                 for kind in kinds for n in sizes for seed in seeds]
+    instances += [load_tsplib(path) for path in tsplib]
+    
+    results = []
+    for instance in instances:
+        for config in configs:
+            for seed in seeds:
+                result = run_case(instance, config, seed=seed,
+                                  n_iterations=settings['n_iterations'],
+                                  time_budget=settings['time_budget'], target_gap=target_gap,
+                                  profile=profile)
+                results.append(result)
+                if verbose:
+                    ttt = result['time_to_target']
+                    print(f"{result['instance']:<24} {config:<14} "
+                          f"{result['wall_time']:8.2f}s  "
+                          f"hedef {'-' if ttt is None else f'{ttt:.2f}s':>7}  "
+                          f"boşluk {result['gap'] * 100:6.2f}%  "
+                          f"{result['iterations_per_second']:7.1f} it/s  "
+                          f"{result['peak_memory_mb']:8.1f} MB")
+                    if profile:
+                        print("    " + ", ".join(
+                            f"{row['phase']} {row['share'] * 100:.0f}%"
+                            for row in result['profile']['phases']))
+    
+    return {
+        'meta': {
+            'suite': suite,
+            'seeds': list(seeds),
+            'target_gap': target_gap,
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S')
+        },
+        'results': results
+    }
+
+
+def compare(results, baseline, tolerance=0.2, gap_tolerance=0.01, min_duration=0.5):
+    """
+    Sonuçları taban çizgisiyle karşılaştır
+    
+    Aynı (örnek, konfigürasyon, tohum) ölçümleri eşleştirilir. Süre, hız ve
+    bellek için göreli, boşluk için mutlak tolerans kullanılır. Taban
+    çizgisinde min_duration saniyeden kısa süren ölçümlerin zamanlamaları
+    gürültüye çok açık olduğundan karşılaştırılmaz.
+    
+    Args:
+        results: run_suite() çıktısı
+        baseline: Önceki run_suite() çıktısı
+        tolerance: Göreli tolerans (0.2 = %20 kötüleşmeye izin)
+        gap_tolerance: Boşlukta izin verilen mutlak kötüleşme
+        min_duration: Zamanlama karşılaştırması için en kısa taban süre (saniye)
+    
+    Returns:
+        list: [{'instance', 'config', 'seed', 'metric', 'baseline', 'current'}, ...]
+              gerilemeler
+    """
+    def key(record):
+        return record['instance'], record['config'], record['seed']
+    
+    previous = {key(record): record for record in baseline['results']}
+    regressions = []
+    
+    for record in results['results']:
+        old = previous.get(key(record))
+        if old is None:
+            continue
+        
+        for metric, (better, kind) in METRICS.items():
+            current, reference = record.get(metric), old.get(metric)
+            if reference is None:
+                continue
+            if metric in TIMING_METRICS and old['wall_time'] < min_duration:
+                continue
+            if current is None:
+                # Önceden hedefe ulaşılıyordu, artık ulaşılamıyor
+                worse = True
+            elif kind == 'absolute':
+                worse = current - reference > gap_tolerance
+            elif better == 'lower':
+                worse = current > reference * (1 + tolerance)
+            else:
+                worse = current < reference * (1 - tolerance)
+            
+            if worse:
+                regressions.append({'instance': record['instance'], 'config': record['config'],
+                                    'seed': record['seed'], 'metric': metric,
+                                    'baseline': reference, 'current': current})
+    
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ACO benchmark paketi")
+    parser.add_argument('--suite', choices=sorted(SUITES), default='quick')
+    parser.add_argument('--kinds', nargs='+', choices=KINDS, default=list(KINDS))
+    parser.add_argument('--sizes', nargs='+', type=int)
+    parser.add_argument('--configs', nargs='+', choices=sorted(CONFIGS))
+    parser.add_argument('--seeds', nargs='+', type=int, default=[0])
+    parser.add_argument('--tsplib', nargs='*', default=[], help=".tsp dosyaları")
+    parser.add_argument('--target-gap', type=float, default=0.05)
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="Sonuçları taban çizgisi olarak kaydet")
+    parser.add_argument('--no-baseline', action='store_true',
+                        help="Taban çizgisi karşılaştırmasını atla")
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    parser.add_argument('--gap-tolerance', type=float, default=0.01)
+    parser.add_argument('--min-duration', type=float, default=0.5)
+    parser.add_argument('--profile', nargs='?', const='', metavar='JSON',
+                        help="Aşama dökümünü yazdır (dosya verilirse JSON olarak kaydet)")
+    args = parser.parse_args(argv)
+    
+    # Taban çizgisi yoksa karşılaştırma sessizce atlanmaz; paket çalışmadan hata verilir
+    compare_baseline = not (args.save_baseline or args.no_baseline)
+    if compare_baseline and not os.path.exists(args.baseline):
+        print(f"Taban çizgisi bulunamadı: {args.baseline} "
+              f"(--save-baseline ile oluşturun veya --no-baseline ile atlayın)")
+        return 1
+    
+    profile = args.profile is not None
+    results = run_suite(args.suite, kinds=args.kinds, seeds=args.seeds, tsplib=args.tsplib,
+                        sizes=args.sizes, configs=args.configs, target_gap=args.target_gap,
+                        profile=profile)
+    
+    if args.profile:
+        with open(args.profile, 'w', encoding='utf-8') as f:
+            json.dump([{'instance': r['instance'], 'config': r['config'], 'seed': r['seed'],
+                        **r.pop('profile')} for r in results['results']], f, indent=2)
+        print(f"Aşama ölçümleri kaydedildi: {args.profile}")
+    elif profile:
+        for record in results['results']:
+            record.pop('profile')
+    
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"Sonuçlar kaydedildi: {args.output}")
+    
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Taban çizgisi kaydedildi: {args.baseline}")
+        return 0
+    
+    if not compare_baseline:
+        print("Taban çizgisi karşılaştırması atlandı")
+        return 0
+    
+    with open(args.baseline, encoding='utf-8') as f:
+        regressions = compare(results, json.load(f), args.tolerance, args.gap_tolerance,
+                              args.min_duration)
+    
+    for item in regressions:
+        print(f"GERİLEME {item['instance']} {item['config']} (tohum {item['seed']}) "
+              f"{item['metric']}: {item['baseline']} -> {item['current']}")
+    print(f"{len(regressions)} gerileme bulundu")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
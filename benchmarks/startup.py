@@ -0,0 +1,182 @@
+"""
+Açılış (Cold-Start) Benchmark'ı
+Giriş noktalarının `python -X importtime` toplamlarını ölçer ve bütçeyi denetler
+
+Kullanım:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --entries core batch --repeat 5
+    python -m benchmarks.startup --budget-scale 1.5    # yavaş CI makineleri için
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Giriş noktası -> ('module', içe aktarılan modül) veya ('script', çalıştırılan betik)
+# (main.py Streamlit sunucusu olmadan "bare" modda ilk sayfa çizimine kadar çalışır)
+ENTRY_POINTS = {
+    'core': ('module', 'core.ant_algorithm'),
+    'pipeline': ('module', 'core.pipeline'),
+    'jobs': ('module', 'core.jobs'),
+    'batch': ('module', 'batch'),
+    'benchmarks': ('module', 'benchmarks.run'),
+    'app': ('script', 'main.py')
+}
+
+# Giriş noktası -> import süresi bütçesi (ms, importtime self sürelerinin toplamı)
+BUDGETS_MS = {
+    'core': 400,
+    'pipeline': 450,
+    'jobs': 450,
+    'batch': 500,
+    'benchmarks': 450,
+    'app': 1500
+}
+
+# Yalnızca ilk kullanıldıkları yerde yüklenmesi gereken ağır bağımlılıklar
+HEAVY = ('googlemaps', 'folium', 'streamlit_folium', 'matplotlib', 'pandas', 'streamlit')
+
+# Giriş noktası -> açılışta yüklenmemesi gereken paketler
+# (Streamlit sürümüne göre pandas'ı kendisi yükleyebildiğinden app için denetlenmez)
+FORBIDDEN = {
+    'core': HEAVY,
+    'pipeline': HEAVY,
+    'jobs': HEAVY,
+    'batch': HEAVY,
+    'benchmarks': HEAVY,
+    'app': ('googlemaps', 'folium', 'streamlit_folium', 'matplotlib')
+}
+
+
+def parse_importtime(stderr):
+    """
+    -X importtime çıktısını ayrıştır
+    
+    Returns:
+        list: [(modül, self_us, cumulative_us, derinlik), ...]
+    """
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        records.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return records
+
+
+def measure(entry, repeat=3):
+    """
+    Giriş noktasını yeni bir yorumlayıcıda repeat kez başlat
+    
+    Her çalıştırmada import süresi (importtime self toplamı) ve süreç duvar
+    saati ölçülür; en düşük değer raporlanır (gürültü en aza iner).
+    
+    Args:
+        entry: ENTRY_POINTS anahtarı
+        repeat: Tekrar sayısı
+    
+    Returns:
+        dict: {'entry', 'target', 'import_ms', 'wall_ms', 'modules', 'heavy',
+               'heaviest'}
+    """
+    kind, target = ENTRY_POINTS[entry]
+    command = [sys.executable, '-X', 'importtime']
+    command += ['-c', f'import {target}'] if kind == 'module' else [target]
+    
+    best = None
+    fastest = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        completed = subprocess.run(command, cwd=ROOT, capture_output=True, text=True)
+        wall_ms = (time.perf_counter() - started) * 1000
+        if completed.returncode != 0:
+            raise RuntimeError(f"{entry} başlatılamadı:\n{completed.stderr[-2000:]}")
+        
+        records = parse_importtime(completed.stderr)
+        import_ms = sum(self_us for _, self_us, _, _ in records) / 1000
+        if best is None or import_ms < best[0]:
+            best = (import_ms, records)
+        fastest = wall_ms if fastest is None else min(fastest, wall_ms)
+    
+    import_ms, records = best
+    packages = {name.split('.')[0] for name, _, _, _ in records}
+    top_level = sorted(((name, cumulative / 1000) for name, _, cumulative, depth in records
+                        if depth == 0), key=lambda item: item[1], reverse=True)
+    
+    return {
+        'entry': entry,
+        'target': target,
+        'import_ms': import_ms,
+        'wall_ms': fastest,
+        'modules': len(records),
+        'heavy': sorted(packages & set(HEAVY)),
+        'heaviest': top_level[:10]
+    }
+
+
+def check(result, budget_scale=1.0):
+    """
+    Bütçe ve yasaklı paket ihlalleri
+    
+    Returns:
+        list: İhlal açıklamaları
+    """
+    entry = result['entry']
+    violations = []
+    budget = BUDGETS_MS[entry] * budget_scale
+    if result['import_ms'] > budget:
+        violations.append(f"{entry}: import süresi {result['import_ms']:.0f} ms > "
+                          f"bütçe {budget:.0f} ms")
+    loaded = sorted(set(result['heavy']) & set(FORBIDDEN.get(entry, ())))
+    if loaded:
+        violations.append(f"{entry}: açılışta yüklenmemesi gereken paketler: {', '.join(loaded)}")
+    return violations
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Giriş noktası açılış süresi benchmark'ı")
+    parser.add_argument('--entries', nargs='+', choices=list(ENTRY_POINTS),
+                        default=list(ENTRY_POINTS))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--budget-scale', type=float, default=1.0,
+                        help="Bütçe çarpanı (yavaş makineler için > 1)")
+    parser.add_argument('--output', default='startup_results.json')
+    parser.add_argument('--verbose', action='store_true',
+                        help="En ağır üst düzey importları yazdır")
+    args = parser.parse_args(argv)
+    
+    results = []
+    violations = []
+    for entry in args.entries:
+        result = measure(entry, repeat=args.repeat)
+        results.append(result)
+        violations += check(result, args.budget_scale)
+        
+        budget = BUDGETS_MS[entry] * args.budget_scale
+        print(f"{entry:<12} {result['import_ms']:8.1f} ms import  "
+              f"{result['wall_ms']:8.1f} ms süreç  bütçe {budget:6.0f} ms  "
+              f"{result['modules']:5d} modül  ağır: {', '.join(result['heavy']) or '-'}")
+        if args.verbose:
+            for name, cumulative in result['heaviest']:
+                print(f"    {name:<40} {cumulative:8.1f} ms")
+    
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({'python': sys.version.split()[0], 'budget_scale': args.budget_scale,
+                   'results': results}, f, indent=2)
+    print(f"Sonuçlar kaydedildi: {args.output}")
+    
+    for violation in violations:
+        print(f"BÜTÇE AŞIMI {violation}")
+    return 1 if violations else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
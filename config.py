@@ -30,11 +30,56 @@ class ACOConfig:
     # Karıncaların bırakacağı feromon miktarını belirler
     Q = 100
     
+    # Feromon stratejisi
+    # 'as'   -> Ant System (tüm karıncalar feromon bırakır)
+    # 'mmas' -> MAX-MIN Ant System (sınırlı feromon, en iyi karınca bırakır)
+    # 'acs'  -> Ant Colony System (q0 kuralı, yerel feromon güncellemesi)
+    STRATEGY = 'as'
+    
+    # Erken durma: bu kadar iterasyon boyunca iyileşme olmazsa algoritma durur
+    # 0 -> kapalı (tüm iterasyonlar çalışır)
+    PATIENCE = 0
+    
+    # Sunucuda aynı anda çalışan en fazla optimizasyon (tüm oturumlar)
+    # 0 -> CPU sayısı; fazlası sırada bekler
+    MAX_CONCURRENT_RUNS = 0
+    
+    # Arka plan işinin ilerlemesi bu aralıkla yoklanır (saniye)
+    POLL_INTERVAL = 0.5
+    
     # Harita merkezi (Ankara koordinatları)
     MAP_CENTER = [39.9334, 32.8597]
     MAP_ZOOM = 10
 
 
+class CacheConfig:
+    """Önbellek Ayarları"""
+    
+    # Önbellek dizini (.gitignore içinde)
+    CACHE_DIR = '.cache'
+    
+    # Geocoding kayıtlarının ömrü (gün)
+    GEOCODE_TTL_DAYS = 90
+    
+    # Diskte tutulacak en fazla geocoding kaydı
+    GEOCODE_MAX_ENTRIES = 10000
+    
+    # Bellek içi LRU katmanının kapasitesi
+    GEOCODE_MEMORY_SIZE = 256
+    
+    # Mesafe / süre matrisi deposu (CACHE_DIR altında)
+    MATRIX_DIR = 'matrices'
+    
+    # Depoda tutulacak en fazla matris çifti
+    MATRIX_MAX_ENTRIES = 32
+    
+    # Matris kayıtlarının ömrü (gün) - API süreleri zamanla değişebilir
+    MATRIX_TTL_DAYS = 30
+    
+    # Uygulama belleğinde tutulacak en fazla matris çifti (oturumlar arası paylaşılır)
+    MATRIX_MEMORY_ENTRIES = 8
+
+
 class VisualizationConfig:
     """Görselleştirme Ayarları"""
     
@@ -3,8 +3,94 @@ Karınca Kolonisi Optimizasyonu (ACO) Algoritması
 Ant Colony Optimization for Traveling Salesman Problem (TSP)
 """
 
+import math
+import time
+from functools import partial
+
 import numpy as np
 
+from .compact import (TriangularMatrix, is_packed, elementwise, add_at, compact_matrix,
+                      row_blocks)
+from .spatial import CandidatePheromone, is_graph
+from .instrumentation import NULL_PHASE
+
+
+def roulette_select(weights, random_values):
+    """
+    Toplu rulet tekerleği seçimi
+    
+    Her satır bir karıncadır; her satırdan ağırlıklarla orantılı
+    olasılıkla bir sütun (şehir) seçilir.
+    
+    Args:
+        weights: (m, n) negatif olmayan ağırlık matrisi
+        random_values: [0, 1) aralığında m adet rastgele sayı
+    
+    Returns:
+        numpy.ndarray: Seçilen sütun indeksleri (m,)
+    """
+    cumulative = np.cumsum(weights, axis=1)
+    thresholds = random_values * cumulative[:, -1]
+    
+    # Kümülatif toplamı eşiği geçen ilk sütun seçilir
+    chosen = (cumulative <= thresholds[:, None]).sum(axis=1)
+    
+    # Yuvarlama nedeniyle eşik toplama eşit çıkarsa son pozitif sütunu al
+    overflow = chosen >= weights.shape[1]
+    if overflow.any():
+        reversed_positive = weights[overflow, ::-1] > 0
+        chosen[overflow] = weights.shape[1] - 1 - np.argmax(reversed_positive, axis=1)
+    
+    return chosen
+
+
+def nearest_neighbors(distance_matrix, k, chunk_size=1024):
+    """
+    Her şehir için en yakın k komşunun listesini çıkar
+    
+    Matris satır blokları halinde işlenir; böylece geçici bellek
+    kullanımı chunk_size x N ile sınırlı kalır.
+    
+    Args:
+        distance_matrix: NxN mesafe matrisi
+        k: Komşu sayısı (en fazla N-1)
+        chunk_size: Aynı anda işlenecek satır sayısı
+    
+    Returns:
+        numpy.ndarray: (N, k) komşu indeksleri, yakından uzağa sıralı
+    """
+    n = len(distance_matrix)
+    k = min(k, n - 1)
+    neighbors = np.empty((n, max(k, 0)), dtype=np.intp)
+    if k <= 0:
+        return neighbors
+    
+    for start in range(0, n, chunk_size):
+        rows = np.arange(start, min(start + chunk_size, n))
+        block = np.array(distance_matrix[rows], dtype=float)
+        
+        # Şehrin kendisi komşu listesine girmesin
+        block[np.arange(len(rows)), rows] = np.inf
+        
+        nearest = np.argpartition(block, k - 1, axis=1)[:, :k]
+        order = np.argsort(np.take_along_axis(block, nearest, axis=1), axis=1, kind='stable')
+        neighbors[rows] = np.take_along_axis(nearest, order, axis=1)
+    
+    return neighbors
+
+
+# Desteklenen feromon güncelleme stratejileri
+STRATEGIES = ('as', 'mmas', 'acs')
+
+# λ-dallanma faktörü eşik oranı
+BRANCHING_LAMBDA = 0.05
+
+
+def _inverse_power(values, beta):
+    """(1/mesafe) ^ beta; sıfır mesafeler (köşegen) için 0"""
+    inverse = np.divide(1.0, values, out=np.zeros_like(values), where=values > 0)
+    return inverse ** beta
+
 
 class AntColonyOptimizer:
     """
@@ -12,21 +98,95 @@ class AntColonyOptimizer:
     
     Karıncalar, feromon izleri bırakarak en kısa yolu keşfeder.
     Kısa yollar daha fazla kullanıldığı için daha fazla feromon birikir.
+    
+    Stratejiler:
+        'as':   Ant System - tüm karıncalar feromon bırakır (varsayılan)
+        'mmas': MAX-MIN Ant System - yalnızca en iyi karınca feromon bırakır,
+                feromon [τmin, τmax] aralığında tutulur, durağanlıkta sıfırlanır
+        'acs':  Ant Colony System - sözde rastgele orantılı seçim kuralı (q0),
+                yerel feromon güncellemesi ve en iyi rota ile global güncelleme
     """
     
     def __init__(self, distance_matrix, n_ants=30, n_iterations=100,
-                 alpha=1.0, beta=2.0, evaporation_rate=0.5, Q=100):
+                 alpha=1.0, beta=2.0, evaporation_rate=0.5, Q=100,
+                 vectorized=True, seed=None, n_candidates=None,
+                 local_search=None, local_search_scope='best',
+                 strategy='as', p_best=0.05, best_so_far_interval=10,
+                 restart_patience=None, q0=0.9, local_evaporation=0.1,
+                 patience=None, min_branching_factor=None, branching_warmup=None,
+                 symmetric=True, compact=False, instrumentation=None):
         """
         Args:
-            distance_matrix: NxN mesafe matrisi
+            distance_matrix: NxN mesafe matrisi veya seyrek KNNGraph. Grafik
+                             verilirse aday listeleri grafiğin komşu listeleridir
+                             ve feromon yalnızca aday kenarlarda tutulur
+                             (CandidatePheromone); hiçbir NxN dizi oluşturulmaz
             n_ants: Karınca sayısı
             n_iterations: İterasyon sayısı
             alpha: Feromon önem katsayısı (α)
             beta: Mesafe önem katsayısı (β)
             evaporation_rate: Feromon buharlaşma oranı (ρ)
             Q: Feromon yoğunluğu sabiti
+            vectorized: True ise bir iterasyondaki tüm karıncalar NumPy
+                        dizileriyle birlikte ilerletilir, False ise her
+                        karınca tek tek kurulur (AS/MMAS'de aynı tohumla
+                        aynı sonuç; ACS'de yerel güncelleme sırası farklıdır)
+            seed: Rastgele sayı üreteci tohumu (opsiyonel)
+            n_candidates: Aday liste boyutu k (opsiyonel). Verilirse karıncalar
+                          yalnızca en yakın k ziyaret edilmemiş komşu arasından
+                          seçim yapar; hepsi ziyaret edildiyse tüm şehirlere döner
+            local_search: Yerel arama nesnesi (opsiyonel, örn. LocalSearch).
+                          improve(route) -> (route, gain) arayüzü yeterlidir
+            local_search_scope: 'best' ise yalnızca iterasyonun en iyi rotası,
+                                'all' ise tüm rotalar iyileştirilir
+            strategy: Feromon stratejisi ('as', 'mmas' veya 'acs')
+            p_best: MMAS - τmin hesabında kullanılan olasılık
+            best_so_far_interval: MMAS - kaç iterasyonda bir iterasyonun en
+                                  iyisi yerine şimdiye kadarki en iyi rota
+                                  feromon bırakır (0: hiçbir zaman)
+            restart_patience: MMAS - bu kadar iterasyon iyileşme olmazsa
+                              feromon τmax'a sıfırlanır (opsiyonel)
+            q0: ACS - en iyi şehrin doğrudan seçilme olasılığı
+            local_evaporation: ACS - yerel feromon güncelleme oranı (ξ)
+            patience: Bu kadar iterasyon iyileşme olmazsa erken dur (opsiyonel)
+            min_branching_factor: Ortalama λ-dallanma faktörü bu değerin altına
+                                  düşerse erken dur (opsiyonel; simetrik
+                                  birikimde yakınsamış matris için ~2)
+            branching_warmup: Başlangıçtan (veya MMAS yeniden başlatmasından)
+                              sonra dallanma faktörünün denetlenmediği
+                              iterasyon sayısı. Varsayılan: dokunulmamış bir
+                              izin buharlaşmayla λ oranına inmesi için gereken
+                              iterasyon, ceil(log λ / log(1 - ρ)); öncesinde
+                              faktör ilk birikimleri yansıtır (MMAS'de ilk
+                              iterasyondan sonra ~2)
+            symmetric: True ise feromon her kenarın iki yönüne birden bırakılır,
+                       False ise yalnızca gidilen yöne (asimetrik matrisler)
+            compact: True ise matrisler float32 tutulur; simetrik mesafe ve
+                     feromon matrisleri paketlenmiş üst üçgen (TriangularMatrix)
+                     olarak saklanır, rotalar int32 dizilerdir. Mesafe matrisi
+                     zaten TriangularMatrix ise otomatik etkinleşir
+            instrumentation: Instrumentation (opsiyonel); aşama süreleri,
+                             sayaçlar ve iterasyon istatistikleri kaydedilir.
+                             Verilmezse ölçümleme maliyeti yok denecek kadar azdır
         """
-        self.distance_matrix = distance_matrix
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Bilinmeyen strateji: {strategy} (seçenekler: {STRATEGIES})")
+        
+        self.graph = is_graph(distance_matrix)
+        self.compact = compact or is_packed(distance_matrix)
+        if self.graph:
+            self.distance_matrix = distance_matrix
+        elif self.compact:
+            if not is_packed(distance_matrix):
+                distance_matrix = np.asarray(distance_matrix)
+                distance_matrix = compact_matrix(
+                    distance_matrix, symmetric=bool(np.allclose(distance_matrix, distance_matrix.T))
+                )
+            self.distance_matrix = distance_matrix
+        else:
+            self.distance_matrix = np.asarray(distance_matrix, dtype=float)
+        self.dtype = np.float32 if self.compact else np.float64
+        self.index_dtype = np.int32 if self.compact else np.intp
         self.n_cities = len(distance_matrix)
         self.n_ants = n_ants
         self.n_iterations = n_iterations
@@ -34,14 +194,112 @@ class AntColonyOptimizer:
         self.beta = beta
         self.evaporation_rate = evaporation_rate
         self.Q = Q
+        self.vectorized = vectorized
+        self.rng = np.random.default_rng(seed)
+        self.local_search = local_search
+        self.local_search_scope = local_search_scope
+        self.strategy = strategy
+        self.p_best = p_best
+        self.best_so_far_interval = best_so_far_interval
+        self.restart_patience = restart_patience
+        self.q0 = q0 if strategy == 'acs' else 0.0
+        self.local_evaporation = local_evaporation
+        self.patience = patience
+        self.min_branching_factor = min_branching_factor
+        if branching_warmup is None:
+            branching_warmup = 1
+            if 0 < evaporation_rate < 1:
+                branching_warmup = math.ceil(math.log(BRANCHING_LAMBDA)
+                                             / math.log(1 - evaporation_rate))
+        self.branching_warmup = branching_warmup
+        self.symmetric = symmetric
+        self.instrumentation = instrumentation
+        
+        # Seyrek grafikte aday listeleri her zaman kullanılır (en fazla grafiğin k'sı)
+        if self.graph:
+            n_candidates = min(n_candidates or distance_matrix.k, distance_matrix.k)
         
         # Feromon matrisi (başlangıçta tüm yollar eşit feromon içerir)
-        self.pheromone = np.ones((self.n_cities, self.n_cities)) / self.n_cities
+        if self.graph:
+            self.pheromone = CandidatePheromone(
+                distance_matrix.neighbors[:, :n_candidates].astype(self.index_dtype),
+                1.0 / self.n_cities, self.dtype
+            )
+        elif is_packed(self.distance_matrix) and symmetric:
+            # Asimetrik matris compact=True ile yoğun float32 kalır; feromon da yoğun tutulur
+            self.pheromone = TriangularMatrix.full(self.n_cities, 1.0 / self.n_cities, self.dtype)
+        else:
+            self.pheromone = np.full((self.n_cities, self.n_cities), 1.0 / self.n_cities,
+                                     dtype=self.dtype)
+        
+        # Mesafe heuristiği (1/mesafe) ^ beta - iterasyonlar boyunca sabit
+        if self.graph:
+            # Grafikte satırlar istendiğinde hesaplanır
+            self.heuristic = self.distance_matrix.map(partial(_inverse_power, beta=self.beta))
+        else:
+            self.heuristic = elementwise(
+                self.distance_matrix, lambda values: _inverse_power(values, self.beta)
+            )
+        
+        # Aday listeleri (en yakın k komşu) - k >= N-1 ise tam arama ile aynıdır
+        self.candidates = None
+        if self.graph:
+            self.candidates = self.pheromone.candidates
+            self.candidate_heuristic = _inverse_power(
+                self.distance_matrix.neighbor_distances[:, :n_candidates].astype(float), self.beta
+            )
+        elif n_candidates is not None and n_candidates < self.n_cities - 1:
+            self.candidates = nearest_neighbors(
+                self.distance_matrix, n_candidates
+            ).astype(self.index_dtype)
+            self.candidate_heuristic = self.heuristic[
+                np.arange(self.n_cities)[:, None], self.candidates
+            ]
         
         # En iyi çözüm
         self.best_route = None
         self.best_distance = float('inf')
         self.best_distance_history = []
+        
+        # Durağanlık takibi (erken durma ve MMAS yeniden başlatma)
+        self.last_improvement = 0
+        self.last_restart = 0
+        self.converged = False
+        self.stop_reason = None
+        
+        # MMAS ve ACS başlangıç feromonu en yakın komşu turundan hesaplanır
+        self.tau_max = self.tau_min = self.tau0 = None
+        if strategy != 'as' and self.n_cities > 1:
+            nn_distance = self.calculate_route_distance(self.nearest_neighbor_tour())
+            if strategy == 'mmas':
+                self._update_trail_limits(nn_distance)
+                self.pheromone.fill(self.tau_max)
+            else:
+                self.tau0 = self.Q / (self.n_cities * nn_distance)
+                self.pheromone.fill(self.tau0)
+    
+    def _phase(self, name):
+        """Ölçümleme açıksa aşama zamanlayıcısı, değilse boş bağlam"""
+        if self.instrumentation is None:
+            return NULL_PHASE
+        return self.instrumentation.phase(name)
+    
+    def _count(self, name, value=1):
+        if self.instrumentation is not None:
+            self.instrumentation.count(name, value)
+    
+    def get_state(self):
+        """
+        Optimizer durumunun kopyası (örn. sonraki bir çalıştırmayı ısıtmak için)
+        
+        Returns:
+            dict: {'pheromone', 'best_route', 'best_distance'}
+        """
+        return {
+            'pheromone': self.pheromone.copy(),
+            'best_route': list(self.best_route) if self.best_route is not None else None,
+            'best_distance': self.best_distance
+        }
     
     def calculate_route_distance(self, route):
         """
@@ -55,119 +313,639 @@ class AntColonyOptimizer:
         """
         distance = 0
         for i in range(len(route) - 1):
-            distance += self.distance_matrix[route[i]][route[i+1]]
+            distance += self.distance_matrix[route[i], route[i+1]]
         
         # Başlangıca dön
-        distance += self.distance_matrix[route[-1]][route[0]]
+        distance += self.distance_matrix[route[-1], route[0]]
         
         return distance
     
-    def construct_solution(self, start_city=0):
+    def calculate_route_distances(self, routes):
+        """
+        Tüm karıncaların rota mesafelerini tek seferde hesapla
+        
+        Args:
+            routes: (karınca sayısı, N) rota dizisi
+        
+        Returns:
+            numpy.ndarray: Her rotanın toplam mesafesi (başlangıca dönüş dahil)
+        """
+        routes = np.asarray(routes)
+        next_cities = np.roll(routes, -1, axis=1)
+        return self.distance_matrix[routes, next_cities].sum(axis=1)
+    
+    def nearest_neighbor_tour(self, start_city=0):
+        """
+        Açgözlü en yakın komşu turu (başlangıç feromonu tahmini için)
+        
+        Args:
+            start_city: Başlangıç şehri indeksi
+        
+        Returns:
+            list: Rota (başlangıca dönüş hariç)
+        """
+        route = [start_city]
+        unvisited = np.ones(self.n_cities, dtype=bool)
+        unvisited[start_city] = False
+        
+        for _ in range(1, self.n_cities):
+            # Grafikte önce (yakından uzağa sıralı) komşulara bakılır; satır
+            # yalnızca tüm komşular ziyaret edildiyse hesaplanır
+            if self.graph:
+                neighbors = self.candidates[route[-1]]
+                open_neighbors = neighbors[unvisited[neighbors]]
+                if len(open_neighbors):
+                    next_city = int(open_neighbors[0])
+                    route.append(next_city)
+                    unvisited[next_city] = False
+                    continue
+            
+            distances = np.where(unvisited, self.distance_matrix[route[-1]], np.inf)
+            next_city = int(np.argmin(distances))
+            route.append(next_city)
+            unvisited[next_city] = False
+        
+        return route
+    
+    def choice_matrix(self):
+        """
+        Seçim matrisi: feromon ^ alpha * (1/mesafe) ^ beta
+        
+        Bir iterasyon boyunca feromon değişmediği için iterasyon başına
+        bir kez hesaplanır ve tüm karıncalar tarafından paylaşılır.
+        Aday listeleri kullanılıyorsa yalnızca aday kenarlar hesaplanır.
+        
+        Returns:
+            numpy.ndarray: NxN (veya aday listeleriyle N x k) seçim ağırlıkları
+        """
+        if self.graph:
+            return self.pheromone.data ** self.alpha * self.candidate_heuristic
+        
+        if self.candidates is not None:
+            pheromone = self.pheromone[np.arange(self.n_cities)[:, None], self.candidates]
+            return pheromone ** self.alpha * self.candidate_heuristic
+        
+        return self.pheromone ** self.alpha * self.heuristic
+    
+    def _select_next(self, weights, unvisited, random_values):
+        """
+        Ziyaret edilmemiş şehirler arasından rulet tekerleği ile seçim yap
+        
+        Tüm ağırlıkları sıfır olan satırlarda (örn. çakışan koordinatlar)
+        ziyaret edilmemiş şehirler arasından eşit olasılıkla seçilir.
+        
+        ACS'de (q0 > 0) aynı rastgele sayı iki iş görür: u < q0 ise en yüksek
+        ağırlıklı şehir seçilir, değilse (u - q0) / (1 - q0) ile rulet çevrilir.
+        """
+        empty = ~(weights > 0).any(axis=1)
+        if empty.any():
+            weights[empty] = unvisited[empty]
+        
+        if not self.q0:
+            return roulette_select(weights, random_values)
+        
+        exploit = random_values < self.q0
+        explore_values = np.where(exploit, 0.0, (random_values - self.q0) / (1 - self.q0))
+        chosen = roulette_select(weights, explore_values)
+        if exploit.any():
+            chosen[exploit] = np.argmax(weights[exploit], axis=1)
+        
+        return chosen
+    
+    def _next_cities(self, current, unvisited, random_values, choice):
+        """
+        Bir grup karınca için bir sonraki şehirleri seç
+        
+        Args:
+            current: Karıncaların bulunduğu şehirler (m,)
+            unvisited: (m, N) ziyaret edilmemiş şehir maskesi
+            random_values: Karınca başına [0, 1) rastgele sayılar (m,)
+            choice: choice_matrix() çıktısı
+        
+        Returns:
+            numpy.ndarray: Seçilen şehirler (m,)
+        """
+        if self.candidates is None:
+            weights = choice[current] * unvisited
+            return self._select_next(weights, unvisited, random_values)
+        
+        # Önce en yakın k komşudan ziyaret edilmemiş olanlar arasından seç
+        ants = np.arange(len(current))
+        candidates = self.candidates[current]
+        available = unvisited[ants[:, None], candidates]
+        has_candidate = available.any(axis=1)
+        
+        next_cities = np.empty(len(current), dtype=self.index_dtype)
+        if has_candidate.any():
+            weights = choice[current[has_candidate]] * available[has_candidate]
+            chosen = self._select_next(
+                weights, available[has_candidate], random_values[has_candidate]
+            )
+            next_cities[has_candidate] = candidates[has_candidate, chosen]
+        
+        # Tüm adaylar ziyaret edildiyse tüm şehirler arasından seç
+        fallback = ~has_candidate
+        if fallback.any():
+            rows = current[fallback]
+            weights = (self.pheromone[rows] ** self.alpha * self.heuristic[rows]
+                       * unvisited[fallback])
+            next_cities[fallback] = self._select_next(
+                weights, unvisited[fallback], random_values[fallback]
+            )
+        
+        return next_cities
+    
+    def _local_update(self, from_cities, to_cities, choice):
+        """
+        ACS yerel feromon güncellemesi: τ = (1 - ξ) τ + ξ τ0
+        
+        Karıncaların az önce geçtiği kenarlar güncellenir; aynı iterasyonda
+        sonraki adımlar için seçim matrisindeki ilgili değerler de yenilenir.
+        Aynı adımda aynı kenarı kullanan karıncalar tek güncelleme yapar.
+        Paketlenmiş feromonda iki yön aynı hücrededir; tek kez güncellenir.
+        """
+        xi = self.local_evaporation
+        directions = [(from_cities, to_cities)]
+        if self.symmetric:
+            directions.append((to_cities, from_cities))
+        
+        for direction, (rows, cols) in enumerate(directions):
+            if direction == 0 or not is_packed(self.pheromone):
+                self.pheromone[rows, cols] = ((1 - xi) * self.pheromone[rows, cols]
+                                              + xi * self.tau0)
+            
+            if self.candidates is None:
+                choice[rows, cols] = self.pheromone[rows, cols] ** self.alpha * self.heuristic[rows, cols]
+                continue
+            
+            # Aday listesi modunda kenarın aday sırası bulunur
+            matches = self.candidates[rows] == cols[:, None]
+            found = matches.any(axis=1)
+            slots = np.argmax(matches, axis=1)[found]
+            rows, cols = rows[found], cols[found]
+            choice[rows, slots] = (self.pheromone[rows, cols] ** self.alpha
+                                   * self.candidate_heuristic[rows, slots])
+    
+    def construct_solution(self, start_city=0, random_values=None, choice=None):
         """
         Bir karınca için rota oluştur (olasılıksal seçim)
         
         Args:
             start_city: Başlangıç şehri indeksi
+            random_values: Her adım için [0, 1) rastgele sayılar (opsiyonel)
+            choice: Önceden hesaplanmış seçim matrisi (opsiyonel)
         
         Returns:
             list: Oluşturulan rota
         """
+        if random_values is None:
+            random_values = self.rng.random(self.n_cities - 1)
+        if choice is None:
+            choice = self.choice_matrix()
+        
         route = [start_city]
-        unvisited = set(range(self.n_cities)) - {start_city}
+        unvisited = np.ones(self.n_cities, dtype=bool)
+        unvisited[start_city] = False
         
-        while unvisited:
+        for step in range(1, self.n_cities):
             current_city = route[-1]
             
-            # Her ziyaret edilmemiş şehir için olasılık hesapla
-            probabilities = []
-            for city in unvisited:
-                # Feromon seviyesi ^ alpha
-                pheromone_value = self.pheromone[current_city][city] ** self.alpha
-                
-                # Mesafe heuristik (1/mesafe) ^ beta
-                # Yakın şehirler daha yüksek değer alır
-                distance_value = (1.0 / self.distance_matrix[current_city][city]) ** self.beta
-                
-                probabilities.append(pheromone_value * distance_value)
-            
-            # Olasılıkları normalize et
-            probabilities = np.array(probabilities)
-            probabilities = probabilities / probabilities.sum()
-            
-            # Olasılıklara göre bir şehir seç
-            next_city = np.random.choice(list(unvisited), p=probabilities)
+            # Ağırlıklara göre bir şehir seç
+            next_city = int(self._next_cities(
+                np.array([current_city]), unvisited[None, :],
+                random_values[step - 1:step], choice
+            )[0])
             
             route.append(next_city)
-            unvisited.remove(next_city)
+            unvisited[next_city] = False
+            if self.strategy == 'acs':
+                self._local_update(np.array([current_city]), np.array([next_city]), choice)
+        
+        # ACS: başlangıca dönüş kenarı da yerel olarak güncellenir
+        if self.strategy == 'acs' and self.n_cities > 1:
+            self._local_update(np.array([route[-1]]), np.array([start_city]), choice)
         
         return route
     
+    def construct_solutions(self, start_city=0, random_values=None):
+        """
+        Bir iterasyondaki tüm karıncaların rotalarını oluştur
+        
+        Vektörel modda karıncalar birlikte ilerler: ziyaret maskeleri
+        (karınca x şehir) tek bir boolean dizide tutulur ve her adımda
+        tüm karıncalar için seçim tek bir rulet tekerleği çağrısıyla yapılır.
+        
+        Args:
+            start_city: Başlangıç şehri indeksi
+            random_values: (karınca sayısı, N-1) rastgele sayılar (opsiyonel)
+        
+        Returns:
+            numpy.ndarray: (karınca sayısı, N) rota dizisi
+        """
+        if random_values is None:
+            random_values = self.rng.random((self.n_ants, self.n_cities - 1))
+        n_ants = len(random_values)
+        choice = self.choice_matrix()
+        
+        if not self.vectorized:
+            routes = [self.construct_solution(start_city, random_values[ant], choice)
+                      for ant in range(n_ants)]
+            return np.array(routes, dtype=self.index_dtype).reshape(n_ants, self.n_cities)
+        
+        routes = np.empty((n_ants, self.n_cities), dtype=self.index_dtype)
+        routes[:, 0] = start_city
+        unvisited = np.ones((n_ants, self.n_cities), dtype=bool)
+        unvisited[:, start_city] = False
+        ants = np.arange(n_ants)
+        
+        for step in range(1, self.n_cities):
+            next_cities = self._next_cities(
+                routes[:, step - 1], unvisited, random_values[:, step - 1], choice
+            )
+            
+            routes[:, step] = next_cities
+            unvisited[ants, next_cities] = False
+            
+            if self.strategy == 'acs':
+                self._local_update(routes[:, step - 1], next_cities, choice)
+        
+        # ACS: başlangıca dönüş kenarı da yerel olarak güncellenir
+        if self.strategy == 'acs' and self.n_cities > 1:
+            self._local_update(routes[:, -1], routes[:, 0], choice)
+        
+        return routes
+    
+    def _construct_population(self, start_city):
+        """
+        Bir iterasyonun tüm rotalarını ve mesafelerini üret
+        
+        Alt sınıflar (örn. paralel çalıştırma) bu adımı değiştirebilir.
+        
+        Returns:
+            tuple: (all_routes, all_distances)
+        """
+        with self._phase('construct'):
+            all_routes = self.construct_solutions(start_city)
+        self._count('ants_built', len(all_routes))
+        
+        with self._phase('evaluate'):
+            all_distances = self.calculate_route_distances(all_routes)
+        return all_routes, all_distances
+    
+    def _apply_local_search(self, all_routes, all_distances):
+        """
+        Rotaları yerel arama ile yerinde iyileştir
+        
+        Args:
+            all_routes: (karınca sayısı, N) rota dizisi
+            all_distances: Rota mesafeleri (güncellenir)
+        """
+        if self.local_search_scope == 'all':
+            ants = range(len(all_routes))
+        else:
+            ants = [int(np.argmin(all_distances))]
+        
+        for ant in ants:
+            route, gain = self.local_search.improve(all_routes[ant].tolist())
+            if gain > 0:
+                all_routes[ant] = route
+                all_distances[ant] = self.calculate_route_distances(all_routes[ant:ant + 1])[0]
+    
+    def route_edges(self, routes):
+        """
+        Rotaları kenar indeks dizilerine dönüştür
+        
+        Args:
+            routes: (rota sayısı, N) rota dizisi veya tek rota
+        
+        Returns:
+            tuple: (from_cities, to_cities) - başlangıca dönüş kenarları dahil,
+                   rota rota ardışık düzlenmiş indeks dizileri
+        """
+        routes = np.atleast_2d(np.asarray(routes))
+        return routes.ravel(), np.roll(routes, -1, axis=1).ravel()
+    
+    def _deposit(self, routes, amounts):
+        """
+        Rotalar boyunca (başlangıca dönüş dahil) feromon bırak
+        
+        Tüm kenarlar tek bir np.add.at çağrısıyla işlenir; aynı kenarı
+        kullanan rotaların katkıları doğru şekilde toplanır. Paketlenmiş
+        (simetrik) feromonda her kenar tek hücre olduğundan bir kez eklenir.
+        
+        Args:
+            routes: (rota sayısı, N) rota dizisi veya tek rota
+            amounts: Rota başına kenar başına bırakılacak feromon
+        """
+        routes = np.atleast_2d(np.asarray(routes))
+        from_cities, to_cities = self.route_edges(routes)
+        weights = np.repeat(np.broadcast_to(amounts, (len(routes),)), routes.shape[1])
+        
+        add_at(self.pheromone, from_cities, to_cities, weights)
+        if self.symmetric and not is_packed(self.pheromone):
+            add_at(self.pheromone, to_cities, from_cities, weights)
+        self._count('edges_deposited', len(from_cities))
+    
+    def _update_trail_limits(self, best_distance):
+        """MMAS feromon sınırlarını (τmax, τmin) en iyi mesafeye göre güncelle"""
+        self.tau_max = self.Q / (self.evaporation_rate * best_distance)
+        
+        p_decision = self.p_best ** (1.0 / self.n_cities)
+        avg_choices = self.n_cities / 2.0
+        if avg_choices > 1:
+            self.tau_min = self.tau_max * (1 - p_decision) / ((avg_choices - 1) * p_decision)
+        else:
+            self.tau_min = 0.0
+        self.tau_min = min(self.tau_min, self.tau_max)
+    
     def update_pheromones(self, all_routes, all_distances):
         """
         Feromon matrisini güncelle
         
-        1. Önce tüm feromonları buharlaştır
-        2. Sonra karıncaların rotalarına göre yeni feromon ekle
+        AS: Tüm feromonlar buharlaşır, tüm karıncalar Q/mesafe bırakır
+        MMAS: Buharlaşma sonrası yalnızca iterasyonun (veya şimdiye kadarki)
+              en iyi rotası feromon bırakır, değerler [τmin, τmax] ile sınırlanır
+        ACS: Yalnızca şimdiye kadarki en iyi rotanın kenarlarında
+             τ = (1 - ρ) τ + ρ Q / L_best güncellemesi yapılır
         
         Args:
-            all_routes: Tüm karıncaların rotaları
+            all_routes: Tüm karıncaların rotaları ((karınca sayısı, N) dizi
+                        veya rota listesi)
             all_distances: Tüm rotaların mesafeleri
         """
-        # Buharlaşma (evaporation)
-        self.pheromone *= (1 - self.evaporation_rate)
+        # Tek şehirde tur uzunluğu 0'dır; öğrenilecek kenar yoktur
+        if self.n_cities <= 1:
+            return
         
-        # Her karınca için feromon ekle
-        for route, distance in zip(all_routes, all_distances):
-            # Daha kısa rotalar daha fazla feromon bırakır
-            pheromone_deposit = self.Q / distance
+        rho = self.evaporation_rate
+        
+        if self.strategy == 'acs':
+            from_cities, to_cities = self.route_edges(self.best_route)
+            edges = [(from_cities, to_cities)]
+            if self.symmetric and not is_packed(self.pheromone):
+                edges.append((to_cities, from_cities))
             
-            # Rota boyunca feromon bırak
-            for i in range(len(route) - 1):
-                self.pheromone[route[i]][route[i+1]] += pheromone_deposit
-                self.pheromone[route[i+1]][route[i]] += pheromone_deposit  # Simetrik
+            for rows, cols in edges:
+                self.pheromone[rows, cols] = ((1 - rho) * self.pheromone[rows, cols]
+                                              + rho * self.Q / self.best_distance)
+            return
+        
+        # Buharlaşma (evaporation) - yerinde
+        self.pheromone *= (1 - rho)
+        
+        if self.strategy == 'mmas':
+            iteration = len(self.best_distance_history) + 1
+            if self.best_so_far_interval and iteration % self.best_so_far_interval == 0:
+                route, distance = self.best_route, self.best_distance
+            else:
+                iteration_best = int(np.argmin(all_distances))
+                route, distance = all_routes[iteration_best], all_distances[iteration_best]
             
-            # Başlangıca dönüş
-            self.pheromone[route[-1]][route[0]] += pheromone_deposit
-            self.pheromone[route[0]][route[-1]] += pheromone_deposit
+            self._deposit(route, self.Q / distance)
+            self._update_trail_limits(self.best_distance)
+            np.clip(self.pheromone, self.tau_min, self.tau_max, out=self.pheromone)
+            return
+        
+        # Her karınca için feromon ekle - daha kısa rotalar daha fazla bırakır
+        self._deposit(all_routes, self.Q / np.asarray(all_distances, dtype=float))
     
-    def optimize(self, start_city=0, progress_callback=None):
+    def branching_factor(self, lam=BRANCHING_LAMBDA):
+        """
+        Ortalama λ-dallanma faktörü
+        
+        Her şehir için feromonu τmin_i + λ (τmax_i - τmin_i) eşiğinin üzerinde
+        olan kenar sayısı sayılır ve ortalaması alınır (seyrek grafikte
+        yalnızca aday kenarlar). Değer düştükçe koloni tek bir tura
+        yakınsamış demektir. Yoğun / paketlenmiş feromon satır bloklarıyla
+        işlenir; NxN kopya oluşturulmaz.
+        
+        Args:
+            lam: λ eşik oranı
+        
+        Returns:
+            float: Ortalama dallanma faktörü (tek şehirde 0)
+        """
+        if self.n_cities <= 1:
+            return 0.0
+        
+        if self.graph:
+            # Seyrek feromonda yalnızca aday kenarlar sayılır
+            blocks = [(None, np.asarray(self.pheromone.data, dtype=float))]
+        else:
+            blocks = row_blocks(self.pheromone)
+        
+        total = 0
+        for start, trails in blocks:
+            if start is not None:
+                rows = np.arange(len(trails))
+                trails[rows, start + rows] = np.nan
+            row_min = np.nanmin(trails, axis=1)
+            row_max = np.nanmax(trails, axis=1)
+            thresholds = row_min + lam * (row_max - row_min)
+            with np.errstate(invalid='ignore'):
+                total += int((trails >= thresholds[:, None]).sum())
+        return total / self.n_cities
+    
+    def _check_stagnation(self):
+        """
+        Durağanlık kontrolü: MMAS yeniden başlatma ve erken durma
+        
+        Returns:
+            bool: Arama yakınsadıysa True
+        """
+        iteration = len(self.best_distance_history)
+        stagnant = iteration - max(self.last_improvement, self.last_restart)
+        
+        if (self.strategy == 'mmas' and self.restart_patience
+                and stagnant >= self.restart_patience):
+            self.pheromone.fill(self.tau_max)
+            self.last_restart = iteration
+        
+        if self.patience and iteration - self.last_improvement >= self.patience:
+            return True
+        
+        # Isınma süresince faktör başlangıç feromonunu yansıtır, denetlenmez
+        if (self.min_branching_factor is not None
+                and iteration - self.last_restart >= self.branching_warmup
+                and self.branching_factor() < self.min_branching_factor):
+            return True
+        
+        return False
+    
+    def run_iteration(self, start_city=0):
+        """
+        Tek bir ACO iterasyonu çalıştır
+        
+        Tüm karıncalar rota kurar, en iyi çözüm ve feromonlar güncellenir.
+        
+        Args:
+            start_city: Başlangıç şehri indeksi
+        
+        Returns:
+            tuple: (all_routes, all_distances)
+        """
+        # Her karınca bir rota oluşturur
+        all_routes, all_distances = self._construct_population(start_city)
+        
+        # Feromon güncellemesinden önce yerel arama
+        if self.local_search is not None:
+            with self._phase('local_search'):
+                self._apply_local_search(all_routes, all_distances)
+        
+        # En iyi rotayı güncelle
+        iteration_best = int(np.argmin(all_distances))
+        if all_distances[iteration_best] < self.best_distance:
+            self.best_distance = float(all_distances[iteration_best])
+            self.best_route = all_routes[iteration_best].tolist()
+            self.last_improvement = len(self.best_distance_history) + 1
+        
+        # Feromonları güncelle
+        with self._phase('pheromone'):
+            self.update_pheromones(all_routes, all_distances)
+        
+        # Geçmişi kaydet
+        self.best_distance_history.append(self.best_distance)
+        
+        # Durağanlık / erken durma
+        with self._phase('stagnation'):
+            self.converged = self._check_stagnation()
+        
+        return all_routes, all_distances
+    
+    def iterate(self, start_city=0, time_budget=None, target_distance=None,
+                cancel_token=None):
+        """
+        ACO'yu adım adım çalıştıran üreteç (anytime kullanım)
+        
+        Her iterasyondan sonra o ana kadarki en iyi çözümün anlık görüntüsü
+        üretilir; çağıran taraf istediği an döngüyü bırakabilir. Aşağıdaki
+        koşullardan biri sağlanınca durulur ve neden stop_reason'a yazılır:
+        
+        - 'iterations': n_iterations tamamlandı
+        - 'converged': erken durma ölçütü sağlandı (patience, dallanma faktörü)
+        - 'time_budget': bir sonraki iterasyon süre bütçesini aşacak
+        - 'target': en iyi mesafe hedefe ulaştı
+        - 'cancelled': iptal belirteci tetiklendi
+        
+        Args:
+            start_city: Başlangıç şehri indeksi
+            time_budget: Saniye cinsinden süre bütçesi (opsiyonel). Ortalama
+                         iterasyon süresine göre bütçeyi aşacak iterasyon
+                         başlatılmaz; en az bir iterasyon her zaman çalışır
+            target_distance: Bu mesafeye ulaşılınca dur (opsiyonel)
+            cancel_token: is_set() metodu olan nesne, örn. threading.Event
+        
+        Yields:
+            dict: {
+                'iteration': iterasyon numarası (1'den başlar),
+                'best_route': [başlangıç, ..., başlangıç] en iyi rota,
+                'best_distance': en iyi mesafe,
+                'iteration_best': iterasyondaki en kısa rota mesafesi,
+                'iteration_mean': iterasyondaki ortalama rota mesafesi,
+                'iteration_worst': iterasyondaki en uzun rota mesafesi,
+                'elapsed': başlangıçtan beri geçen süre (saniye)
+            }
+        """
+        started = time.perf_counter()
+        self.stop_reason = 'iterations'
+        if self.instrumentation is not None:
+            # Kayıtlar ve dış bileşen sayaçları bu çalıştırmaya göre ölçülür
+            self.instrumentation.start()
+            self._stats_baseline = self._component_stats()
+        
+        try:
+            for iteration in range(1, self.n_iterations + 1):
+                if cancel_token is not None and cancel_token.is_set():
+                    self.stop_reason = 'cancelled'
+                    break
+                
+                elapsed = time.perf_counter() - started
+                if time_budget is not None and iteration > 1:
+                    average = elapsed / (iteration - 1)
+                    if elapsed + average > time_budget:
+                        self.stop_reason = 'time_budget'
+                        break
+                
+                _, all_distances = self.run_iteration(start_city)
+                if self.instrumentation is not None:
+                    self.instrumentation.record_iteration(iteration, all_distances,
+                                                          self.best_distance, self.pheromone)
+                
+                yield {
+                    'iteration': iteration,
+                    'best_route': self.best_route + [start_city],
+                    'best_distance': self.best_distance,
+                    'iteration_best': float(np.min(all_distances)),
+                    'iteration_mean': float(np.mean(all_distances)),
+                    'iteration_worst': float(np.max(all_distances)),
+                    'elapsed': time.perf_counter() - started
+                }
+                
+                if target_distance is not None and self.best_distance <= target_distance:
+                    self.stop_reason = 'target'
+                    break
+                
+                if self.converged:
+                    self.stop_reason = 'converged'
+                    break
+        finally:
+            # Çağıran döngüyü erken bıraksa da ölçümleme kapatılır
+            if self.instrumentation is not None:
+                self._finish_instrumentation()
+    
+    def _component_stats(self):
+        """Mesafe önbelleği ve yerel arama bileşenlerinin birikimli sayaçları"""
+        stats = {}
+        if self.graph:
+            for name, value in self.distance_matrix.cache_stats.items():
+                stats[f'distance_cache_{name}'] = value
+        if self.local_search is not None and hasattr(self.local_search, 'stats'):
+            local_search = self.local_search.stats()
+            stats['local_search_calls'] = local_search['calls']
+            stats['local_search_moves'] = local_search['moves']
+        return stats
+    
+    def _finish_instrumentation(self):
+        """Dış bileşen istatistiklerini sayaçlara aktar ve kaydı kapat"""
+        baseline = self._stats_baseline
+        for name, value in self._component_stats().items():
+            self.instrumentation.set(name, value - baseline.get(name, 0))
+        self.instrumentation.finish()
+    
+    def optimize(self, start_city=0, progress_callback=None, time_budget=None,
+                 target_distance=None, cancel_token=None):
         """
         ACO algoritmasını çalıştır
         
+        iterate() üzerine kuruludur: erken durma ölçütlerinden biri sağlanırsa,
+        süre bütçesi dolarsa, hedef mesafeye ulaşılırsa veya iptal edilirse
+        n_iterations dolmadan durulur (neden: stop_reason).
+        
         Args:
             start_city: Başlangıç şehri indeksi
             progress_callback: İlerleme callback fonksiyonu (opsiyonel)
                                callback(iteration, total, best_distance)
+            time_budget: Saniye cinsinden süre bütçesi (opsiyonel)
+            target_distance: Hedef tur uzunluğu (opsiyonel)
+            cancel_token: İptal belirteci, örn. threading.Event (opsiyonel)
         
         Returns:
-            tuple: (best_route, best_distance)
+            tuple: (best_route, best_distance); ilk iterasyon tamamlanmadan
+                   iptal edilirse (None, inf)
         """
-        for iteration in range(self.n_iterations):
-            all_routes = []
-            all_distances = []
-            
-            # Her karınca bir rota oluşturur
-            for ant in range(self.n_ants):
-                route = self.construct_solution(start_city)
-                distance = self.calculate_route_distance(route)
-                
-                all_routes.append(route)
-                all_distances.append(distance)
-                
-                # En iyi rotayı güncelle
-                if distance < self.best_distance:
-                    self.best_distance = distance
-                    self.best_route = route[:]
-            
-            # Feromonları güncelle
-            self.update_pheromones(all_routes, all_distances)
-            
-            # Geçmişi kaydet
-            self.best_distance_history.append(self.best_distance)
-            
+        snapshots = self.iterate(start_city, time_budget=time_budget,
+                                 target_distance=target_distance,
+                                 cancel_token=cancel_token)
+        
+        for snapshot in snapshots:
             # Progress callback
             if progress_callback:
-                progress_callback(iteration + 1, self.n_iterations, self.best_distance)
+                progress_callback(snapshot['iteration'], self.n_iterations,
+                                  snapshot['best_distance'])
+        
+        # İlk iterasyondan önce iptal edildiyse henüz rota yok
+        if self.best_route is None:
+            return None, self.best_distance
         
         # Başlangıca dönüşü ekle
         final_route = self.best_route + [start_city]
@@ -0,0 +1,237 @@
+"""
+Kompakt Matris Gösterimi
+Simetrik matrisler için paketlenmiş üst üçgen (float32) depolama
+"""
+
+import numpy as np
+
+
+class TriangularMatrix:
+    """
+    Simetrik NxN matrisin paketlenmiş üst üçgen gösterimi
+    
+    Köşegen dahil üst üçgen tek boyutlu bir dizide satır satır tutulur
+    (N(N+1)/2 eleman). Haversine mesafeleri gibi simetrik veriler için
+    bellek yarıya iner; float32 ile birlikte float64 yoğun matrisin
+    dörtte birine düşer.
+    
+    NumPy dizisinin optimizer, rota detayları ve görselleştirme tarafından
+    kullanılan arayüzünü taklit eder:
+        m[i, j]      -> tek eleman veya (dizi indekslerle) eleman grubu
+        m[i]         -> i. satır (yoğun), m[[i, k]] -> satır grubu
+        m[i, j] = v  -> eleman(lar)ı yaz (simetrik: (j, i) de değişir)
+        m *= s, m += s / m, m ** p, m * m, fill(), clip(), copy()
+        np.asarray(m) -> yoğun NxN matris
+    """
+    
+    ndim = 2
+    
+    def __init__(self, n, data=None, dtype=np.float32):
+        """
+        Args:
+            n: Matris boyutu
+            data: Paketlenmiş veri (opsiyonel, uzunluk N(N+1)/2)
+            dtype: Veri tipi (data verilmezse)
+        """
+        self.n = n
+        if data is None:
+            data = np.zeros(n * (n + 1) // 2, dtype=dtype)
+        self.data = data
+        
+        # (i, j), i <= j elemanının konumu: offsets[i] + j
+        rows = np.arange(n, dtype=np.int64)
+        self._offsets = rows * n - rows * (rows - 1) // 2 - rows
+    
+    @classmethod
+    def from_dense(cls, matrix, dtype=np.float32):
+        """Yoğun simetrik matristen oluştur (satır satır, ek NxN bellek olmadan)"""
+        n = len(matrix)
+        packed = cls(n, dtype=dtype)
+        for i in range(n):
+            start = packed._offsets[i] + i
+            packed.data[start:start + n - i] = matrix[i][i:]
+        return packed
+    
+    @classmethod
+    def full(cls, n, value, dtype=np.float32):
+        """Tüm elemanları value olan matris"""
+        return cls(n, data=np.full(n * (n + 1) // 2, value, dtype=dtype))
+    
+    @property
+    def shape(self):
+        return (self.n, self.n)
+    
+    @property
+    def dtype(self):
+        return self.data.dtype
+    
+    @property
+    def nbytes(self):
+        return self.data.nbytes
+    
+    def __len__(self):
+        return self.n
+    
+    def index(self, rows, cols):
+        """(rows, cols) çiftlerinin paketlenmiş dizideki konumları"""
+        rows, cols = np.asarray(rows), np.asarray(cols)
+        low, high = np.minimum(rows, cols), np.maximum(rows, cols)
+        return self._offsets[low] + high
+    
+    def rows(self, rows):
+        """
+        Satırları yoğun dizi olarak döndür
+        
+        Args:
+            rows: Satır indeksi veya indeks dizisi
+        
+        Returns:
+            numpy.ndarray: (N,) veya (len(rows), N)
+        """
+        rows = np.asarray(rows)
+        columns = np.arange(self.n)
+        return self.data[self.index(rows[..., None], columns)]
+    
+    def __getitem__(self, key):
+        if isinstance(key, tuple) and len(key) == 2:
+            i, j = key
+            if isinstance(i, (int, np.integer)) and isinstance(j, (int, np.integer)):
+                if i > j:
+                    i, j = j, i
+                return self.data[self._offsets[i] + j]
+            return self.data[self.index(i, j)]
+        return self.rows(key)
+    
+    def __setitem__(self, key, value):
+        if isinstance(key, tuple) and len(key) == 2:
+            self.data[self.index(*key)] = value
+        elif key is Ellipsis or (isinstance(key, slice) and key == slice(None)):
+            if np.ndim(value) == 0:
+                self.data[...] = value
+            else:
+                self.data[...] = TriangularMatrix.from_dense(value, self.dtype).data
+        else:
+            raise IndexError("TriangularMatrix yalnızca (i, j) ve [...] atamalarını destekler")
+    
+    def add_at(self, rows, cols, values):
+        """np.add.at karşılığı: tekrarlanan (i, j) çiftlerinin katkıları toplanır"""
+        np.add.at(self.data, self.index(rows, cols), values)
+    
+    def fill(self, value):
+        self.data.fill(value)
+    
+    def clip(self, min=None, max=None, out=None):
+        if out is self:
+            np.clip(self.data, min, max, out=self.data)
+            return self
+        return TriangularMatrix(self.n, data=np.clip(self.data, min, max))
+    
+    def copy(self):
+        return TriangularMatrix(self.n, data=self.data.copy())
+    
+    def to_dense(self, dtype=None):
+        """Yoğun NxN matrise dönüştür"""
+        return self.rows(np.arange(self.n)).astype(dtype or self.dtype, copy=False)
+    
+    def __array__(self, dtype=None, copy=None):
+        return self.to_dense(dtype)
+    
+    def _values(self, other):
+        return other.data if isinstance(other, TriangularMatrix) else other
+    
+    def __imul__(self, other):
+        self.data *= self._values(other)
+        return self
+    
+    def __iadd__(self, other):
+        self.data += self._values(other)
+        return self
+    
+    def __mul__(self, other):
+        return TriangularMatrix(self.n, data=self.data * self._values(other))
+    
+    __rmul__ = __mul__
+    
+    def __add__(self, other):
+        return TriangularMatrix(self.n, data=self.data + self._values(other))
+    
+    __radd__ = __add__
+    
+    def __pow__(self, exponent):
+        return TriangularMatrix(self.n, data=self.data ** exponent)
+
+
+def row_blocks(matrix, max_elements=2 ** 20, dtype=float):
+    """
+    Yoğun veya paketlenmiş matrisi satır blokları halinde gez
+    
+    Satır bazlı istatistikler (entropi, dallanma faktörü) tüm matrisin
+    yoğun bir kopyası yerine en fazla max_elements elemanlık bloklarla
+    hesaplanır; paketlenmiş matris bellekte açılmaz.
+    
+    Args:
+        matrix: NxN numpy array veya TriangularMatrix
+        max_elements: Blok başına en fazla eleman
+        dtype: Blokların veri tipi
+    
+    Yields:
+        tuple: (ilk satır indeksi, (satır sayısı, N) blok)
+    """
+    n = len(matrix)
+    block_rows = max(1, max_elements // max(n, 1))
+    for start in range(0, n, block_rows):
+        stop = min(start + block_rows, n)
+        block = matrix.rows(np.arange(start, stop)) if is_packed(matrix) else matrix[start:stop]
+        yield start, np.array(block, dtype=dtype)
+
+
+def is_packed(matrix):
+    """Matris paketlenmiş (TriangularMatrix) mi?"""
+    return isinstance(matrix, TriangularMatrix)
+
+
+def elementwise(matrix, func):
+    """
+    Matrisin tüm elemanlarına func uygula, aynı gösterimi koru
+    
+    Args:
+        matrix: numpy.ndarray veya TriangularMatrix
+        func: Dizi alıp aynı boyutta dizi döndüren fonksiyon
+    
+    Returns:
+        matrix ile aynı tipte yeni matris
+    """
+    if is_packed(matrix):
+        return TriangularMatrix(matrix.n, data=func(matrix.data))
+    return func(matrix)
+
+
+def add_at(matrix, rows, cols, values):
+    """Yoğun, paketlenmiş veya aday (seyrek) matriste np.add.at"""
+    if not isinstance(matrix, np.ndarray):
+        matrix.add_at(rows, cols, values)
+    else:
+        np.add.at(matrix, (rows, cols), values)
+
+
+def compact_matrix(matrix, symmetric=True, dtype=np.float32):
+    """
+    Matrisi kompakt gösterime dönüştür
+    
+    Simetrik matrisler paketlenmiş üst üçgene, asimetrik matrisler yoğun
+    float32 diziye çevrilir.
+    
+    Args:
+        matrix: NxN matris
+        symmetric: Matris simetrik kabul edilsin mi
+        dtype: Hedef veri tipi
+    
+    Returns:
+        TriangularMatrix veya numpy.ndarray
+    """
+    if is_packed(matrix):
+        return matrix
+    if symmetric:
+        return TriangularMatrix.from_dense(matrix, dtype)
+    return np.asarray(matrix, dtype=dtype)
+
@@ -0,0 +1,239 @@
+"""
+Döşemeli (Tiled) Eşzamanlı Distance Matrix Sorguları
+Hız sınırlayıcı, yeniden deneme ve eleman bazlı Haversine yedeği
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .haversine import haversine_pairs
+
+
+# Google Distance Matrix API istek başına sınırları
+MAX_ORIGINS = 25
+MAX_DESTINATIONS = 25
+MAX_ELEMENTS = 100
+
+# Tekrar denemenin anlamsız olduğu üst düzey yanıt durumları
+NON_RETRYABLE_STATUSES = ('INVALID_REQUEST', 'MAX_ELEMENTS_EXCEEDED',
+                          'MAX_DIMENSIONS_EXCEEDED', 'REQUEST_DENIED')
+
+
+class TokenBucket:
+    """
+    Jeton kovası hız sınırlayıcı
+    
+    Kova saniyede rate jeton dolar ve en fazla capacity jeton tutar.
+    acquire(k) yeterli jeton birikene kadar bekler; birden fazla iş
+    parçacığından güvenle çağrılabilir.
+    """
+    
+    def __init__(self, rate, capacity=None):
+        """
+        Args:
+            rate: Saniyede eklenen jeton (örn. saniyedeki eleman kotası)
+            capacity: Kova kapasitesi (varsayılan: rate)
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, tokens=1):
+        """
+        tokens adet jeton al (gerekirse bekle)
+        
+        Args:
+            tokens: İstenen jeton sayısı (kapasiteden büyükse kapasiteye indirilir)
+        
+        Returns:
+            float: Beklenen toplam süre (saniye)
+        """
+        tokens = min(float(tokens), self.capacity)
+        waited = 0.0
+        
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity,
+                                   self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            
+            time.sleep(delay)
+            waited += delay
+
+
+def tile_ranges(n_origins, n_destinations, max_origins=MAX_ORIGINS,
+                max_destinations=MAX_DESTINATIONS, max_elements=MAX_ELEMENTS):
+    """
+    Başlangıç x varış matrisini istek sınırlarına uyan döşemelere böl
+    
+    Args:
+        n_origins: Başlangıç noktası sayısı
+        n_destinations: Varış noktası sayısı
+        max_origins: İstek başına en fazla başlangıç
+        max_destinations: İstek başına en fazla varış
+        max_elements: İstek başına en fazla eleman (başlangıç x varış)
+    
+    Returns:
+        list: [(satır dilimi, sütun dilimi), ...]
+    """
+    columns = max(1, min(max_destinations, n_destinations, max_elements))
+    rows = max(1, min(max_origins, n_origins, max_elements // columns))
+    
+    return [(slice(row, min(row + rows, n_origins)),
+             slice(column, min(column + columns, n_destinations)))
+            for row in range(0, n_origins, rows)
+            for column in range(0, n_destinations, columns)]
+
+
+class DistanceMatrixFetcher:
+    """
+    Distance Matrix API ile NxN mesafe / süre matrisini paralel doldurur
+    
+    - NxN problem istek sınırlarına uyan döşemelere bölünür
+      (N^2 / max_elements kadar istek)
+    - Döşemeler sınırlı bir iş parçacığı havuzunda, eleman bazlı jeton
+      kovası hız sınırının arkasında çalışır
+    - Başarısız döşemeler üstel geri çekilme (backoff) ile yeniden denenir
+    - Yanıtı alınamayan elemanlar tek tek Haversine ile doldurulur
+    
+    distance_matrix(origins=..., destinations=..., **kwargs) metodu olan her
+    nesneyle çalışır (googlemaps.Client, yerel sahte sunucu, test taslağı).
+    """
+    
+    def __init__(self, client, max_workers=8, elements_per_second=1000, max_retries=3,
+                 backoff=0.5, max_origins=MAX_ORIGINS, max_destinations=MAX_DESTINATIONS,
+                 max_elements=MAX_ELEMENTS, mode="driving", language="tr", units="metric",
+                 time_factor=1.5):
+        """
+        Args:
+            client: distance_matrix metodu olan istemci
+            max_workers: Eşzamanlı istek sayısı
+            elements_per_second: Saniyedeki eleman kotası (hız sınırı)
+            max_retries: Döşeme başına en fazla yeniden deneme
+            backoff: İlk bekleme süresi (saniye), her denemede iki katına çıkar
+            max_origins: İstek başına en fazla başlangıç
+            max_destinations: İstek başına en fazla varış
+            max_elements: İstek başına en fazla eleman
+            mode: Ulaşım modu
+            language: Yanıt dili
+            units: Birim sistemi
+            time_factor: Haversine yedeğinde dakika / km oranı (tahmini süre)
+        """
+        self.client = client
+        self.max_workers = max_workers
+        self.rate_limiter = TokenBucket(elements_per_second, max(elements_per_second,
+                                                                 max_elements))
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_origins = max_origins
+        self.max_destinations = max_destinations
+        self.max_elements = max_elements
+        self.request_options = {'mode': mode, 'language': language, 'units': units}
+        self.time_factor = time_factor
+        
+        self.stats = {}
+        self._stats_lock = threading.Lock()
+    
+    def _count(self, name, value=1):
+        with self._stats_lock:
+            self.stats[name] += value
+    
+    def fetch(self, origins, destinations=None):
+        """
+        Mesafe ve süre matrislerini getir
+        
+        Args:
+            origins: [(lat, lng), ...] başlangıç koordinatları
+            destinations: [(lat, lng), ...] varış koordinatları (varsayılan: origins)
+        
+        Returns:
+            tuple: (distance_matrix (km), time_matrix (dakika)) numpy array'leri
+        """
+        origins = [tuple(coord) for coord in origins]
+        if destinations is None:
+            destinations = origins
+        else:
+            destinations = [tuple(coord) for coord in destinations]
+        
+        shape = (len(origins), len(destinations))
+        distance_matrix = np.zeros(shape)
+        time_matrix = np.zeros(shape)
+        fallback = np.zeros(shape, dtype=bool)
+        
+        tiles = tile_ranges(*shape, max_origins=self.max_origins,
+                            max_destinations=self.max_destinations,
+                            max_elements=self.max_elements)
+        self.stats = {'tiles': len(tiles), 'requests': 0, 'retries': 0,
+                      'failed_tiles': 0, 'fallback_elements': 0}
+        
+        def run(tile):
+            rows, columns = tile
+            self._fetch_tile(origins[rows], destinations[columns],
+                             distance_matrix[rows, columns], time_matrix[rows, columns],
+                             fallback[rows, columns])
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # list() ile işçilerdeki istisnalar burada yeniden fırlatılır
+            list(executor.map(run, tiles))
+        
+        # Yanıtı alınamayan elemanlar için tek çağrıda Haversine
+        if fallback.any():
+            rows, columns = np.nonzero(fallback)
+            estimate = haversine_pairs(np.asarray(origins)[rows],
+                                       np.asarray(destinations)[columns])
+            distance_matrix[rows, columns] = estimate
+            time_matrix[rows, columns] = estimate * self.time_factor
+            self.stats['fallback_elements'] = int(fallback.sum())
+        
+        return distance_matrix, time_matrix
+    
+    def _fetch_tile(self, origins, destinations, distances, times, fallback):
+        """Bir döşemeyi (yeniden denemelerle) getir, sonuçları görünümlere yaz"""
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self._count('retries')
+                delay = self.backoff * 2 ** (attempt - 1)
+                time.sleep(delay * (1 + random.random()))
+            
+            self.rate_limiter.acquire(len(origins) * len(destinations))
+            self._count('requests')
+            
+            try:
+                result = self.client.distance_matrix(
+                    origins=origins, destinations=destinations, **self.request_options
+                )
+            except Exception as e:
+                print(f"Distance Matrix isteği başarısız (deneme {attempt + 1}): {e}")
+                continue
+            
+            status = result.get('status')
+            if status == 'OK':
+                for i, row in enumerate(result['rows']):
+                    for j, element in enumerate(row['elements']):
+                        if element.get('status') == 'OK':
+                            distances[i, j] = element['distance']['value'] / 1000  # km
+                            times[i, j] = element['duration']['value'] / 60  # dakika
+                        else:
+                            fallback[i, j] = True
+                return
+            
+            print(f"Distance Matrix API hatası (deneme {attempt + 1}): {status}")
+            if status in NON_RETRYABLE_STATUSES:
+                break
+        
+        # Tüm denemeler başarısız: döşemenin tüm elemanları Haversine ile
+        self._count('failed_tiles')
+        fallback[...] = True
+
@@ -0,0 +1,228 @@
+"""
+Kalıcı Geocoding Önbelleği
+SQLite disk önbelleği ve önünde bellek içi LRU katmanı
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+
+def normalize_address(address):
+    """
+    Önbellek anahtarı için adresi normalleştir
+    
+    Unicode NFKC, küçük harf ve tek boşluk; böylece "Mogan Gölü,  Gölbaşı"
+    ile "mogan gölü, gölbaşı" aynı kayda düşer.
+    
+    Args:
+        address: Adres (str)
+    
+    Returns:
+        str: Normalleştirilmiş anahtar
+    """
+    address = unicodedata.normalize('NFKC', str(address)).casefold()
+    return re.sub(r'\s+', ' ', address).strip()
+
+
+class GeocodeCache:
+    """
+    Adres -> (lat, lng) kalıcı önbelleği
+    
+    - Kayıtlar SQLite dosyasında tutulur (uygulama yeniden başlatılınca korunur)
+    - ttl süresini aşan kayıtlar okunurken silinir
+    - max_entries aşılırsa en uzun süredir kullanılmayan kayıtlar silinir
+    - Sık kullanılan kayıtlar bellek içi LRU katmanından okunur
+    - İsabet / ıska sayaçları stats() ile alınır
+    
+    Birden fazla iş parçacığından güvenle kullanılabilir.
+    """
+    
+    def __init__(self, directory='.cache', ttl=90 * 24 * 3600, max_entries=10000,
+                 memory_size=256, filename='geocode.sqlite'):
+        """
+        Args:
+            directory: Önbellek dizini (":memory:" ise yalnızca bellek içi SQLite)
+            ttl: Kayıt ömrü (saniye, None ise süresiz)
+            max_entries: Diskte tutulacak en fazla kayıt (None ise sınırsız)
+            memory_size: Bellek içi LRU katmanının kapasitesi
+            filename: SQLite dosya adı
+        """
+        if directory == ':memory:':
+            self.path = ':memory:'
+        else:
+            os.makedirs(directory, exist_ok=True)
+            self.path = os.path.join(directory, filename)
+        
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.memory_size = memory_size
+        
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS geocode ("
+            "key TEXT PRIMARY KEY, lat REAL NOT NULL, lng REAL NOT NULL, "
+            "created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS geocode_accessed ON geocode (accessed)"
+        )
+        self._connection.commit()
+        
+        # İstatistikler
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def _expired(self, created, now):
+        return self.ttl is not None and now - created > self.ttl
+    
+    def _remember(self, key, value):
+        """Bellek içi LRU katmanına ekle (kapasite aşılırsa en eskiyi at)"""
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+    
+    def get(self, address):
+        """
+        Önbellekteki koordinatı döndür
+        
+        Args:
+            address: Adres (str)
+        
+        Returns:
+            tuple: (lat, lng) veya None (kayıt yok / süresi dolmuş)
+        """
+        key = normalize_address(address)
+        now = time.time()
+        
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and not self._expired(entry[1], now):
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return entry[0]
+            self._memory.pop(key, None)
+            
+            row = self._connection.execute(
+                "SELECT lat, lng, created FROM geocode WHERE key = ?", (key,)
+            ).fetchone()
+            
+            if row is None:
+                self.misses += 1
+                return None
+            
+            lat, lng, created = row
+            if self._expired(created, now):
+                self._connection.execute("DELETE FROM geocode WHERE key = ?", (key,))
+                self._connection.commit()
+                self.misses += 1
+                return None
+            
+            self._connection.execute(
+                "UPDATE geocode SET accessed = ? WHERE key = ?", (now, key)
+            )
+            self._connection.commit()
+            self._remember(key, ((lat, lng), created))
+            self.disk_hits += 1
+            return (lat, lng)
+    
+    def set(self, address, coordinate):
+        """
+        Koordinatı önbelleğe yaz
+        
+        Args:
+            address: Adres (str)
+            coordinate: (lat, lng)
+        """
+        key = normalize_address(address)
+        lat, lng = float(coordinate[0]), float(coordinate[1])
+        now = time.time()
+        
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO geocode (key, lat, lng, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?)", (key, lat, lng, now, now)
+            )
+            self._remember(key, ((lat, lng), now))
+            self._evict()
+            self._connection.commit()
+    
+    def __contains__(self, address):
+        """Adres için geçerli (süresi dolmamış) kayıt var mı (sayaçları etkilemez)"""
+        key = normalize_address(address)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT created FROM geocode WHERE key = ?", (key,)
+            ).fetchone()
+        return row is not None and not self._expired(row[0], time.time())
+    
+    def _evict(self):
+        """Süresi dolan ve kapasiteyi aşan (en eski erişilen) kayıtları sil"""
+        removed = 0
+        if self.ttl is not None:
+            removed += self._connection.execute(
+                "DELETE FROM geocode WHERE created < ?", (time.time() - self.ttl,)
+            ).rowcount
+        
+        if self.max_entries is not None:
+            count = self._connection.execute("SELECT COUNT(*) FROM geocode").fetchone()[0]
+            if count > self.max_entries:
+                removed += self._connection.execute(
+                    "DELETE FROM geocode WHERE key IN ("
+                    "SELECT key FROM geocode ORDER BY accessed LIMIT ?)",
+                    (count - self.max_entries,)
+                ).rowcount
+        
+        if removed:
+            self.evictions += removed
+            self._memory.clear()
+    
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM geocode").fetchone()[0]
+    
+    def clear(self):
+        """Tüm kayıtları sil"""
+        with self._lock:
+            self._connection.execute("DELETE FROM geocode")
+            self._connection.commit()
+            self._memory.clear()
+    
+    def stats(self):
+        """
+        Önbellek istatistikleri
+        
+        Returns:
+            dict: Bellek/disk isabetleri, ıskalar, isabet oranı, silinen ve
+                  toplam kayıt sayısı
+        """
+        hits = self.memory_hits + self.disk_hits
+        lookups = hits + self.misses
+        return {
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self)
+        }
+    
+    def close(self):
+        with self._lock:
+            self._connection.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
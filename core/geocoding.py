@@ -0,0 +1,197 @@
+"""
+Eşzamanlı Geocoding
+Sınırlı iş parçacığı havuzu üzerinde asyncio ile sıralı / akışlı koordinat alma
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Aynı anda en fazla bu kadar geocoding isteği yapılır
+DEFAULT_MAX_IN_FLIGHT = 8
+
+
+def _lookup(gmaps_client, address, cache=None):
+    """
+    Tek adresin koordinatı (önce önbellek, sonra API)
+    
+    Raises:
+        LookupError: Adres bulunamadı veya çevrimdışı modda önbellekte yok
+        Exception: İstemci hataları olduğu gibi iletilir
+    """
+    if cache is not None:
+        coord = cache.get(address)
+        if coord is not None:
+            return coord
+    
+    # Çevrimdışı (yalnızca önbellek) mod
+    if gmaps_client is None:
+        raise LookupError("önbellekte yok (çevrimdışı mod)")
+    
+    result = gmaps_client.geocode(address)
+    if not result:
+        raise LookupError("adres bulunamadı")
+    
+    location = result[0]['geometry']['location']
+    coord = (location['lat'], location['lng'])
+    if cache is not None:
+        cache.set(address, coord)
+    return coord
+
+
+def get_coordinates(gmaps_client, address, cache=None):
+    """
+    Google Maps Geocoding API ile adresin koordinatlarını al
+    
+    Args:
+        gmaps_client: Google Maps client (None ise yalnızca önbellek kullanılır)
+        address: Aranacak adres (str)
+        cache: GeocodeCache (opsiyonel); bulunan koordinatlar buraya yazılır
+    
+    Returns:
+        tuple: (lat, lng) veya None
+    """
+    try:
+        return _lookup(gmaps_client, address, cache)
+    except LookupError:
+        return None
+    except Exception as e:
+        print(f"Koordinat alma hatası ({address}): {e}")
+        return None
+
+
+async def geocode_stream(gmaps_client, addresses, cache=None,
+                         max_in_flight=DEFAULT_MAX_IN_FLIGHT, executor=None):
+    """
+    Adresleri eşzamanlı çöz, sonuçları geldikçe üret (async generator)
+    
+    İstemci çağrıları engelleyici olduğundan bir iş parçacığı havuzunda
+    çalışır; asyncio semaforu aynı anda yapılan istek sayısını sınırlar.
+    
+    Args:
+        gmaps_client: Google Maps client (None ise yalnızca önbellek kullanılır)
+        addresses: Adres listesi
+        cache: GeocodeCache (opsiyonel)
+        max_in_flight: Aynı anda en fazla istek sayısı
+        executor: Paylaşılan ThreadPoolExecutor (opsiyonel)
+    
+    Yields:
+        tuple: (indeks, adres, (lat, lng) veya None, hata mesajı veya None)
+               tamamlanma sırasıyla
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_in_flight)
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=max_in_flight)
+    
+    async def resolve(index, address):
+        async with semaphore:
+            try:
+                coord = await loop.run_in_executor(
+                    executor, _lookup, gmaps_client, address, cache
+                )
+                return index, address, coord, None
+            except Exception as e:
+                return index, address, None, str(e) or type(e).__name__
+    
+    tasks = [asyncio.ensure_future(resolve(index, address))
+             for index, address in enumerate(addresses)]
+    try:
+        for future in asyncio.as_completed(tasks):
+            yield await future
+    finally:
+        for task in tasks:
+            task.cancel()
+        if own_executor:
+            executor.shutdown(wait=False)
+
+
+async def geocode_addresses(gmaps_client, addresses, cache=None,
+                            max_in_flight=DEFAULT_MAX_IN_FLIGHT, on_result=None):
+    """
+    Adresleri eşzamanlı çöz, girdi sırasını koru
+    
+    Args:
+        gmaps_client: Google Maps client (None ise yalnızca önbellek kullanılır)
+        addresses: Adres listesi
+        cache: GeocodeCache (opsiyonel)
+        max_in_flight: Aynı anda en fazla istek sayısı
+        on_result: Her sonuç geldiğinde çağrılır (opsiyonel):
+                   on_result(indeks, adres, koordinat, hata)
+    
+    Returns:
+        tuple: (coordinates, failures)
+            - coordinates: Girdi sırasıyla [(lat, lng) veya None, ...]
+            - failures: {indeks: hata mesajı} (aynı adres farklı indekslerde
+              tekrarlanabildiğinden indeksle anahtarlanır)
+    """
+    addresses = list(addresses)
+    coordinates = [None] * len(addresses)
+    failures = {}
+    
+    async for index, address, coord, error in geocode_stream(
+            gmaps_client, addresses, cache, max_in_flight):
+        if error is None:
+            coordinates[index] = coord
+        else:
+            failures[index] = error
+        if on_result is not None:
+            on_result(index, address, coord, error)
+    
+    return coordinates, failures
+
+
+def _run(coroutine):
+    """Coroutine'i senkron çalıştır (çalışan bir döngü varsa ayrı iş parçacığında)"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+def get_coordinates_batch(gmaps_client, addresses, cache=None,
+                          max_in_flight=DEFAULT_MAX_IN_FLIGHT, raise_on_error=True,
+                          on_result=None):
+    """
+    Birden fazla adres için toplu (eşzamanlı) koordinat alma
+    
+    Args:
+        gmaps_client: Google Maps client (None ise yalnızca önbellek kullanılır)
+        addresses: Adres listesi
+        cache: GeocodeCache (opsiyonel)
+        max_in_flight: Aynı anda en fazla istek sayısı
+        raise_on_error: True ise alınamayan adresler için ValueError fırlatılır,
+                        False ise bu adreslerin yerinde None döner
+        on_result: Her sonuç geldiğinde çağrılır (opsiyonel):
+                   on_result(indeks, adres, koordinat, hata)
+    
+    Returns:
+        list: [(lat, lng), ...] koordinat listesi (girdi sırasıyla)
+    """
+    addresses = list(addresses)
+    completed = 0
+    
+    def report(index, address, coord, error):
+        nonlocal completed
+        completed += 1
+        if error is None:
+            print(f"Koordinat alındı {completed}/{len(addresses)}: {address}")
+        else:
+            print(f"Koordinat alınamadı {completed}/{len(addresses)}: {address} ({error})")
+        if on_result is not None:
+            on_result(index, address, coord, error)
+    
+    coordinates, failures = _run(geocode_addresses(
+        gmaps_client, addresses, cache, max_in_flight, on_result=report
+    ))
+    
+    if failures and raise_on_error:
+        raise ValueError("Koordinat alınamadı: " + ", ".join(
+            f"{addresses[index]} (#{index})" for index in sorted(failures)))
+    
+    return coordinates
+
@@ -5,6 +5,14 @@ Haversine Formülü ile Mesafe Hesaplama
 
 from math import radians, sin, cos, sqrt, atan2
 
+import numpy as np
+
+from .compact import TriangularMatrix
+
+
+# Dünya yarıçapı (kilometre)
+EARTH_RADIUS_KM = 6371.0
+
 
 def haversine_distance(coord1, coord2):
     """
@@ -25,7 +33,7 @@ def haversine_distance(coord1, coord2):
         279.18 km
     """
     # Dünya yarıçapı (kilometre)
-    R = 6371.0
+    R = EARTH_RADIUS_KM
     
     # Koordinatları ayrıştır
     lat1, lon1 = coord1
@@ -51,6 +59,99 @@ def haversine_distance(coord1, coord2):
     return distance
 
 
+def _haversine_arrays(lat1, lon1, lat2, lon2):
+    """Radyan cinsinden dizilerle (yayınlanabilir) Haversine mesafesi"""
+    a = (np.sin((lat2 - lat1) / 2) ** 2
+         + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+    return EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def _radians(coords):
+    """[(lat, lng), ...] -> (lat, lng) radyan dizileri"""
+    coords = np.radians(np.asarray(coords, dtype=float).reshape(-1, 2))
+    return coords[:, 0], coords[:, 1]
+
+
+def haversine_pairs(coords_a, coords_b):
+    """
+    Eşleşen koordinat çiftleri arası mesafeler
+    
+    Args:
+        coords_a: [(lat, lng), ...] koordinatlar
+        coords_b: coords_a ile aynı uzunlukta koordinatlar
+    
+    Returns:
+        numpy.ndarray: i. eleman coords_a[i] - coords_b[i] mesafesi (km)
+    """
+    lat1, lon1 = _radians(coords_a)
+    lat2, lon2 = _radians(coords_b)
+    return _haversine_arrays(lat1, lon1, lat2, lon2)
+
+
+def haversine_matrix(coords_a, coords_b=None, chunk_size=1024, packed=False,
+                     dtype=np.float64):
+    """
+    İki koordinat kümesi arası tüm mesafeler (vektörize)
+    
+    Satırlar chunk_size büyüklüğünde bloklar halinde işlenir; ara bellek
+    O(chunk_size * N) ile sınırlı kalır. coords_b verilmezse (aynı küme)
+    yalnızca üst üçgen hesaplanıp alt üçgene yansıtılır.
+    
+    Args:
+        coords_a: [(lat, lng), ...] M koordinat
+        coords_b: [(lat, lng), ...] N koordinat (varsayılan: coords_a)
+        chunk_size: Blok başına satır sayısı
+        packed: True ise (yalnızca aynı küme) TriangularMatrix döndür
+        dtype: Sonuç veri tipi
+    
+    Returns:
+        numpy.ndarray: MxN mesafe matrisi (km) veya TriangularMatrix
+    
+    Örnek:
+        >>> coords = [(39.9334, 32.8597), (41.0082, 28.9784)]
+        >>> matrix = haversine_matrix(coords)
+        >>> print(f"{matrix[0, 1]:.2f} km")
+        349.36 km
+    """
+    same = coords_b is None or coords_b is coords_a
+    if packed and not same:
+        raise ValueError("packed=True yalnızca tek koordinat kümesi ile kullanılabilir")
+    
+    lat_a, lon_a = _radians(coords_a)
+    lat_b, lon_b = (lat_a, lon_a) if same else _radians(coords_b)
+    m, n = len(lat_a), len(lat_b)
+    
+    if not same:
+        matrix = np.empty((m, n), dtype=dtype)
+        for start in range(0, m, chunk_size):
+            stop = min(start + chunk_size, m)
+            matrix[start:stop] = _haversine_arrays(
+                lat_a[start:stop, None], lon_a[start:stop, None], lat_b, lon_b
+            )
+        return matrix
+    
+    matrix = TriangularMatrix(n, dtype=dtype) if packed else np.empty((n, n), dtype=dtype)
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        
+        # Blok satırları için yalnızca köşegen ve sağındaki sütunlar
+        block = _haversine_arrays(
+            lat_a[start:stop, None], lon_a[start:stop, None],
+            lat_b[None, start:], lon_b[None, start:]
+        )
+        np.fill_diagonal(block, 0.0)
+        
+        if packed:
+            for row in range(start, stop):
+                offset = matrix._offsets[row] + row
+                matrix.data[offset:offset + n - row] = block[row - start, row - start:]
+        else:
+            matrix[start:stop, start:] = block
+            matrix[start:, start:stop] = block.T
+    
+    return matrix
+
+
 def calculate_total_route_distance(route_coords):
     """
     Rota boyunca toplam mesafe hesapla
@@ -61,11 +162,9 @@ def calculate_total_route_distance(route_coords):
     Returns:
         float: Toplam mesafe (km)
     """
-    total_distance = 0.0
-    
-    for i in range(len(route_coords) - 1):
-        distance = haversine_distance(route_coords[i], route_coords[i + 1])
-        total_distance += distance
+    if len(route_coords) < 2:
+        return 0.0
     
-    return total_distance
+    route_coords = np.asarray(route_coords, dtype=float)
+    return float(haversine_pairs(route_coords[:-1], route_coords[1:]).sum())
 
@@ -0,0 +1,277 @@
+"""
+ACO Ölçümleme (Instrumentation)
+Aşama süreleri, sayaçlar, iterasyon istatistikleri ve dışa aktarma
+"""
+
+import json
+import time
+from contextlib import contextmanager, nullcontext
+
+import numpy as np
+
+from .compact import row_blocks
+
+
+# Ölçümleme kapalıyken kullanılan boş bağlam (ek maliyet: tek fonksiyon çağrısı)
+NULL_PHASE = nullcontext()
+
+
+class Hook:
+    """
+    Ölçümleme olaylarını dinleyen temel sınıf
+    
+    Alt sınıflar yalnızca ihtiyaç duydukları metotları geçersiz kılar.
+    """
+    
+    def on_phase(self, name, seconds):
+        """Bir aşama bittiğinde çağrılır"""
+    
+    def on_iteration(self, record):
+        """Her iterasyon sonunda iterasyon kaydıyla çağrılır"""
+    
+    def on_run_end(self, instrumentation):
+        """optimize() / iterate() bittiğinde çağrılır"""
+
+
+# Varsayılan entropi hesaplama aralığı (iterasyon); yoğun / paketlenmiş feromonda
+# her hesaplama O(N^2) olduğundan her iterasyonda yapılmaz
+ENTROPY_INTERVAL = 10
+
+
+def _row_entropies(trails, width):
+    """Satırların log(width) ile normalize Shannon entropileri"""
+    totals = trails.sum(axis=1, keepdims=True)
+    probabilities = np.divide(trails, totals, out=np.zeros_like(trails), where=totals > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        terms = np.where(probabilities > 0, probabilities * np.log(probabilities), 0.0)
+    return -terms.sum(axis=1) / np.log(width)
+
+
+def pheromone_entropy(pheromone):
+    """
+    Ortalama normalize satır entropisi
+    
+    Her şehrin çıkan kenarlarındaki feromon olasılık dağılımına çevrilir,
+    Shannon entropisi log(kenar sayısı) ile [0, 1] aralığına ölçeklenir ve
+    satırlar üzerinden ortalaması alınır. 1'e yakın değerler tekdüze
+    (keşif), 0'a yakın değerler tek bir kenara yakınsamış feromondur.
+    Aday feromonda doğrudan N x k veri, yoğun / paketlenmiş feromonda
+    satır blokları kullanılır (NxN kopya oluşturulmaz).
+    
+    Args:
+        pheromone: Yoğun, paketlenmiş veya aday (N x k) feromon
+    
+    Returns:
+        float: Ortalama normalize entropi
+    """
+    if hasattr(pheromone, 'candidates'):
+        width = pheromone.data.shape[1]
+        if width < 2:
+            return 0.0
+        return float(_row_entropies(np.asarray(pheromone.data, dtype=float), width).mean())
+    
+    n = len(pheromone)
+    if n - 1 < 2:
+        return 0.0
+    
+    total = 0.0
+    for start, trails in row_blocks(pheromone):
+        rows = np.arange(len(trails))
+        trails[rows, start + rows] = 0.0
+        total += _row_entropies(trails, n - 1).sum()
+    return float(total / n)
+
+
+class Instrumentation:
+    """
+    Optimizer ölçümleme kaydı
+    
+    - phase(name): aşama süresi ve çağrı sayısı (bağlam yöneticisi)
+    - count(name, value): sayaçlar (örn. kurulan karınca, bırakılan kenar)
+    - record_iteration(...): iterasyon başına en iyi / ortalama / en kötü tur
+      ve feromon entropisi
+    - Kancalar (Hook) her olayda çağrılır; to_json() / to_prometheus() ile
+      dışa aktarılır
+    
+    AntColonyOptimizer(..., instrumentation=Instrumentation()) ile etkinleşir;
+    verilmezse optimizer boş bağlam kullanır.
+    """
+    
+    def __init__(self, hooks=(), entropy_interval=ENTROPY_INTERVAL):
+        """
+        Args:
+            hooks: Hook nesneleri
+            entropy_interval: Feromon entropisi kaç iterasyonda bir hesaplanır
+                              (0: hiçbir zaman; 1: her iterasyon, yoğun
+                              feromonda iterasyon başına O(N^2) maliyet ekler)
+        """
+        self.hooks = list(hooks)
+        self.entropy_interval = entropy_interval
+        self.reset()
+    
+    def reset(self):
+        """Tüm kayıtları sıfırla"""
+        self.phases = {}
+        self.counters = {}
+        self.iterations = []
+        self.started = None
+        self.wall_time = 0.0
+    
+    def add_hook(self, hook):
+        self.hooks.append(hook)
+    
+    @contextmanager
+    def phase(self, name):
+        """Aşama süresini ölç"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            total, calls = self.phases.get(name, (0.0, 0))
+            self.phases[name] = (total + seconds, calls + 1)
+            for hook in self.hooks:
+                hook.on_phase(name, seconds)
+    
+    def count(self, name, value=1):
+        """Sayaç artır"""
+        self.counters[name] = self.counters.get(name, 0) + value
+    
+    def set(self, name, value):
+        """Sayacı doğrudan ata (örn. dış bileşen istatistikleri)"""
+        self.counters[name] = value
+    
+    def start(self):
+        """Çalıştırma başlangıcını işaretle (önceki çalıştırmanın kayıtları silinir)"""
+        self.reset()
+        self.started = time.perf_counter()
+    
+    def record_iteration(self, iteration, distances, best_distance, pheromone=None):
+        """
+        İterasyon istatistiklerini kaydet
+        
+        Args:
+            iteration: İterasyon numarası (1'den başlar)
+            distances: İterasyondaki tur uzunlukları
+            best_distance: Şimdiye kadarki en iyi mesafe
+            pheromone: Entropi için feromon matrisi (opsiyonel)
+        """
+        record = {
+            'iteration': iteration,
+            'best': float(best_distance),
+            'iteration_best': float(np.min(distances)),
+            'mean': float(np.mean(distances)),
+            'worst': float(np.max(distances)),
+            'entropy': None
+        }
+        if (pheromone is not None and self.entropy_interval
+                and iteration % self.entropy_interval == 0):
+            with self.phase('entropy'):
+                record['entropy'] = pheromone_entropy(pheromone)
+        
+        self.iterations.append(record)
+        for hook in self.hooks:
+            hook.on_iteration(record)
+    
+    def finish(self):
+        """Çalıştırma bitişini işaretle ve kancalara bildir"""
+        if self.started is not None:
+            self.wall_time = time.perf_counter() - self.started
+        for hook in self.hooks:
+            hook.on_run_end(self)
+    
+    def breakdown(self):
+        """
+        Aşama dökümü
+        
+        Returns:
+            list: [{'phase', 'seconds', 'calls', 'share'}, ...] süreye göre azalan
+                  (share: toplam duvar saati içindeki pay)
+        """
+        total = self.wall_time or sum(seconds for seconds, _ in self.phases.values()) or 1.0
+        rows = [{'phase': name, 'seconds': seconds, 'calls': calls, 'share': seconds / total}
+                for name, (seconds, calls) in self.phases.items()]
+        return sorted(rows, key=lambda row: row['seconds'], reverse=True)
+    
+    def format_breakdown(self):
+        """Aşama dökümünü metin tablo olarak döndür"""
+        lines = [f"{'Aşama':<16}{'Süre (s)':>12}{'Çağrı':>10}{'Pay':>8}"]
+        for row in self.breakdown():
+            lines.append(f"{row['phase']:<16}{row['seconds']:>12.4f}{row['calls']:>10}"
+                         f"{row['share'] * 100:>7.1f}%")
+        lines.append(f"{'toplam':<16}{self.wall_time:>12.4f}")
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"{name:<26}{value:>12}")
+        return "\n".join(lines)
+    
+    def to_dict(self):
+        return {
+            'wall_time': self.wall_time,
+            'phases': self.breakdown(),
+            'counters': dict(self.counters),
+            'iterations': list(self.iterations)
+        }
+    
+    def to_json(self, path=None, **kwargs):
+        """
+        JSON olarak dışa aktar
+        
+        Args:
+            path: Dosya yolu (opsiyonel, verilmezse metin döndürülür)
+            **kwargs: json.dump seçenekleri
+        
+        Returns:
+            str: JSON metni (path verilmediyse)
+        """
+        kwargs.setdefault('indent', 2)
+        if path is None:
+            return json.dumps(self.to_dict(), **kwargs)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, **kwargs)
+    
+    def to_prometheus(self, prefix='aco', labels=None):
+        """
+        Prometheus metin biçiminde dışa aktar
+        
+        Args:
+            prefix: Metrik adı öneki
+            labels: Tüm metriklere eklenecek etiketler (opsiyonel)
+        
+        Returns:
+            str: Prometheus exposition metni
+        """
+        labels = labels or {}
+        
+        def label_text(extra=None):
+            items = {**labels, **(extra or {})}
+            if not items:
+                return ''
+            return '{' + ','.join(f'{key}="{value}"' for key, value in items.items()) + '}'
+        
+        lines = [f"# TYPE {prefix}_phase_seconds_total counter"]
+        for name, (seconds, _) in self.phases.items():
+            lines.append(f"{prefix}_phase_seconds_total{label_text({'phase': name})} {seconds}")
+        lines.append(f"# TYPE {prefix}_phase_calls_total counter")
+        for name, (_, calls) in self.phases.items():
+            lines.append(f"{prefix}_phase_calls_total{label_text({'phase': name})} {calls}")
+        
+        for name, value in self.counters.items():
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total{label_text()} {value}")
+        
+        lines.append(f"# TYPE {prefix}_wall_seconds gauge")
+        lines.append(f"{prefix}_wall_seconds{label_text()} {self.wall_time}")
+        lines.append(f"# TYPE {prefix}_iterations gauge")
+        lines.append(f"{prefix}_iterations{label_text()} {len(self.iterations)}")
+        
+        if self.iterations:
+            last = self.iterations[-1]
+            for key, metric in (('best', 'best_distance'), ('mean', 'iteration_mean_distance'),
+                                ('worst', 'iteration_worst_distance'),
+                                ('entropy', 'pheromone_entropy')):
+                if last[key] is not None:
+                    lines.append(f"# TYPE {prefix}_{metric} gauge")
+                    lines.append(f"{prefix}_{metric}{label_text()} {last[key]}")
+        
+        return "\n".join(lines) + "\n"
+
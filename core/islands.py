@@ -0,0 +1,227 @@
+"""
+Ada Modeli ile Paralel Karınca Kolonileri
+Farklı tohum ve parametrelerle çalışan koloniler arasında periyodik göç
+"""
+
+import multiprocessing as mp
+import traceback
+
+import numpy as np
+
+from .ant_algorithm import AntColonyOptimizer
+
+
+# Desteklenen göç yöntemleri
+MIGRATIONS = ('best', 'pheromone')
+
+
+class _Island:
+    """Tek bir koloni ve göç işlemleri"""
+    
+    def __init__(self, distance_matrix, params, start_city):
+        self.optimizer = AntColonyOptimizer(distance_matrix, **params)
+        self.start_city = start_city
+    
+    def run_epoch(self, n_iterations):
+        """Göçler arası iterasyonları çalıştır (yakınsadıysa boşta kalır)"""
+        optimizer = self.optimizer
+        for _ in range(n_iterations):
+            if optimizer.converged:
+                break
+            optimizer.run_iteration(self.start_city)
+    
+    def message(self, migration):
+        """Komşu adaya gönderilecek göç mesajı"""
+        optimizer = self.optimizer
+        message = {'route': optimizer.best_route, 'distance': optimizer.best_distance}
+        if migration == 'pheromone':
+            message['pheromone'] = optimizer.pheromone.copy()
+        return message
+    
+    def migrate(self, message, blend_rate):
+        """
+        Komşu adadan gelen göçü uygula
+        
+        - En iyi tur daha kısaysa benimsenir ve üzerine feromon bırakılır
+        - Feromon göçünde izler τ = (1 - w) τ + w τ_komşu ile harmanlanır
+        """
+        optimizer = self.optimizer
+        
+        if 'pheromone' in message:
+            optimizer.pheromone *= (1 - blend_rate)
+            optimizer.pheromone += blend_rate * message['pheromone']
+        elif message['route'] is not None:
+            optimizer._deposit(message['route'], optimizer.Q / message['distance'])
+            if optimizer.strategy == 'mmas':
+                np.clip(optimizer.pheromone, optimizer.tau_min, optimizer.tau_max,
+                        out=optimizer.pheromone)
+        
+        if message['distance'] < optimizer.best_distance:
+            optimizer.best_distance = message['distance']
+            optimizer.best_route = list(message['route'])
+    
+    def result(self):
+        optimizer = self.optimizer
+        return {
+            'route': optimizer.best_route,
+            'distance': optimizer.best_distance,
+            'history': optimizer.best_distance_history
+        }
+
+
+def _island_worker(connection, distance_matrix, params, start_city, migration):
+    """Ada süreci: her döngüde bir epoch çalıştır, mesajı gönder, göçü al"""
+    try:
+        island = _Island(distance_matrix, params, start_city)
+        while True:
+            command, payload = connection.recv()
+            if command == 'epoch':
+                island.run_epoch(payload)
+                connection.send(('ok', island.message(migration)))
+            elif command == 'migrate':
+                island.migrate(*payload)
+            elif command == 'result':
+                connection.send(('ok', island.result()))
+                break
+    except Exception:
+        connection.send(('error', traceback.format_exc()))
+    finally:
+        connection.close()
+
+
+def _receive(connection):
+    status, payload = connection.recv()
+    if status == 'error':
+        raise RuntimeError(f"Ada süreci hata verdi:\n{payload}")
+    return payload
+
+
+def run_islands(distance_matrix, n_islands=4, migration_interval=10, migration='best',
+                blend_rate=0.1, island_params=None, seed=None, start_city=0,
+                processes=True, **params):
+    """
+    Birden fazla ACO kolonisini (ada) paralel çalıştır
+    
+    Her ada ayrı bir süreçte, kendi tohumu ve (opsiyonel) kendi alpha/beta/ρ
+    değerleriyle çalışır. Her migration_interval iterasyonda adalar halka
+    düzeninde (i -> i+1) en iyi turlarını gönderir veya feromon izlerini
+    harmanlar. Aynı toplam karınca bütçesi için n_ants ada sayısına
+    bölünmelidir.
+    
+    Args:
+        distance_matrix: NxN mesafe matrisi
+        n_islands: Ada (koloni) sayısı
+        migration_interval: Göçler arası iterasyon sayısı (M)
+        migration: 'best' (en iyi tur göçü) veya 'pheromone' (iz harmanlama)
+        blend_rate: Feromon harmanlama oranı (w)
+        island_params: Ada başına parametre sözlükleri listesi (opsiyonel),
+                       örn. [{'alpha': 1.0}, {'beta': 5.0}, ...]
+        seed: Ana tohum; adaların tohumları buradan türetilir
+        start_city: Başlangıç şehri indeksi
+        processes: False ise adalar aynı süreçte sırayla çalışır
+        **params: Tüm adalar için ortak AntColonyOptimizer parametreleri
+    
+    Returns:
+        dict: {
+            'best_route': [0, ..., 0] biçiminde global en iyi rota,
+            'best_distance': global en iyi mesafe,
+            'best_island': en iyi rotayı bulan ada,
+            'islands': ada başına {'route', 'distance', 'history'} listesi
+        }
+    """
+    if migration not in MIGRATIONS:
+        raise ValueError(f"Bilinmeyen göç yöntemi: {migration} (seçenekler: {MIGRATIONS})")
+    
+    island_params = island_params or [{}] * n_islands
+    if len(island_params) != n_islands:
+        raise ValueError("island_params uzunluğu ada sayısına eşit olmalıdır")
+    
+    seeds = [int(child.generate_state(1)[0])
+             for child in np.random.SeedSequence(seed).spawn(n_islands)]
+    configs = [{**params, 'seed': island_seed, **overrides}
+               for island_seed, overrides in zip(seeds, island_params)]
+    
+    n_iterations = params.get('n_iterations', 100)
+    n_epochs = -(-n_iterations // migration_interval)
+    epoch_lengths = [min(migration_interval, n_iterations - epoch * migration_interval)
+                     for epoch in range(n_epochs)]
+    
+    if processes:
+        results = _run_processes(distance_matrix, configs, start_city, migration,
+                                 blend_rate, epoch_lengths)
+    else:
+        results = _run_sequential(distance_matrix, configs, start_city, migration,
+                                  blend_rate, epoch_lengths)
+    
+    best_island = int(np.argmin([result['distance'] for result in results]))
+    best = results[best_island]
+    
+    return {
+        'best_route': best['route'] + [start_city],
+        'best_distance': best['distance'],
+        'best_island': best_island,
+        'islands': results
+    }
+
+
+def _ring_migrants(messages):
+    """Halka düzeni: i. ada (i-1). adanın mesajını alır"""
+    return [messages[i - 1] for i in range(len(messages))]
+
+
+def _run_sequential(distance_matrix, configs, start_city, migration, blend_rate,
+                    epoch_lengths):
+    islands = [_Island(distance_matrix, config, start_city) for config in configs]
+    
+    for epoch, length in enumerate(epoch_lengths):
+        for island in islands:
+            island.run_epoch(length)
+        
+        if epoch < len(epoch_lengths) - 1 and len(islands) > 1:
+            messages = [island.message(migration) for island in islands]
+            for island, message in zip(islands, _ring_migrants(messages)):
+                island.migrate(message, blend_rate)
+    
+    return [island.result() for island in islands]
+
+
+def _run_processes(distance_matrix, configs, start_city, migration, blend_rate,
+                   epoch_lengths):
+    context = mp.get_context()
+    connections, workers = [], []
+    
+    try:
+        for config in configs:
+            parent, child = context.Pipe()
+            worker = context.Process(
+                target=_island_worker,
+                args=(child, distance_matrix, config, start_city, migration),
+                daemon=True
+            )
+            worker.start()
+            child.close()
+            connections.append(parent)
+            workers.append(worker)
+        
+        for epoch, length in enumerate(epoch_lengths):
+            for connection in connections:
+                connection.send(('epoch', length))
+            messages = [_receive(connection) for connection in connections]
+            
+            if epoch < len(epoch_lengths) - 1 and len(connections) > 1:
+                for connection, message in zip(connections, _ring_migrants(messages)):
+                    connection.send(('migrate', (message, blend_rate)))
+        
+        results = []
+        for connection in connections:
+            connection.send(('result', None))
+            results.append(_receive(connection))
+        return results
+    finally:
+        for connection in connections:
+            connection.close()
+        for worker in workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+
@@ -0,0 +1,250 @@
+"""
+Arka Plan Optimizasyon İşleri
+ACO ayrı süreçte çalışır; ilerleme kuyruktan okunur, arayüz iş parçacığı bloklanmaz
+"""
+
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+import traceback
+
+from .ant_algorithm import AntColonyOptimizer
+from .instrumentation import Instrumentation
+
+
+# İşçi süreç ilerleme mesajlarını en fazla bu sıklıkta gönderir (saniye)
+PROGRESS_INTERVAL = 0.2
+
+# Biten süreçten son mesajın gelmesi için beklenecek süre (saniye)
+DRAIN_TIMEOUT = 1.0
+
+FINISHED = ('done', 'cancelled', 'error')
+
+
+def _run(distance_matrix, params, start_city, time_budget, profile, messages, cancel_event):
+    """
+    İşçi süreç gövdesi
+    
+    Mesajlar:
+        ('progress', iteration, [yeni en iyi mesafeler])
+        ('done', {'route', 'distance', 'stop_reason', 'instrumentation'})
+        ('error', traceback metni)
+    """
+    try:
+        instrumentation = Instrumentation() if profile else None
+        optimizer = AntColonyOptimizer(distance_matrix, instrumentation=instrumentation, **params)
+        
+        history = []
+        iteration = 0
+        sent = time.perf_counter()
+        for snapshot in optimizer.iterate(start_city, time_budget=time_budget,
+                                          cancel_token=cancel_event):
+            iteration = snapshot['iteration']
+            history.append(float(snapshot['best_distance']))
+            if time.perf_counter() - sent >= PROGRESS_INTERVAL:
+                messages.put(('progress', iteration, history))
+                history = []
+                sent = time.perf_counter()
+        
+        messages.put(('progress', iteration, history))
+        messages.put(('done', {
+            'route': optimizer.best_route + [start_city] if optimizer.best_route else None,
+            'distance': float(optimizer.best_distance),
+            'stop_reason': optimizer.stop_reason,
+            'instrumentation': instrumentation
+        }))
+    except Exception:
+        messages.put(('error', traceback.format_exc()))
+
+
+class OptimizationJob:
+    """
+    Ayrı süreçte çalışan ACO işinin tutamacı
+    
+    Durum: 'queued' -> 'running' -> 'done' / 'cancelled' / 'error'.
+    poll() gelen mesajları işler ve iterasyon, en iyi mesafe geçmişi ile
+    sonuç alanlarını günceller; hiçbir çağrı işin bitmesini beklemez.
+    best_distance_history alanı sayesinde plot_convergence() ile doğrudan
+    kullanılabilir.
+    """
+    
+    def __init__(self, distance_matrix, params=None, start_city=0, time_budget=None,
+                 profile=False):
+        """
+        Args:
+            distance_matrix: Mesafe matrisi (veya KNNGraph)
+            params: AntColonyOptimizer parametreleri (opsiyonel)
+            start_city: Başlangıç şehri indeksi
+            time_budget: Saniye cinsinden süre bütçesi (opsiyonel)
+            profile: Aşama ölçümlerini topla (sonuç: instrumentation)
+        """
+        self.distance_matrix = distance_matrix
+        self.params = dict(params or {})
+        self.start_city = start_city
+        self.time_budget = time_budget
+        self.profile = profile
+        self.n_iterations = self.params.get('n_iterations', 100)
+        
+        self.status = 'queued'
+        self.iteration = 0
+        self.best_distance_history = []
+        self.best_route = None
+        self.best_distance = None
+        self.stop_reason = None
+        self.instrumentation = None
+        self.error = None
+        self.started = None
+        self.finished = None
+        
+        self._process = None
+        self._messages = None
+        self._cancel = None
+    
+    @property
+    def done(self):
+        return self.status in FINISHED
+    
+    @property
+    def progress(self):
+        """0-1 arası ilerleme"""
+        return min(self.iteration / self.n_iterations, 1.0) if self.n_iterations else 1.0
+    
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.perf_counter()) - self.started
+    
+    def start(self):
+        """İşçi süreci başlat"""
+        context = mp.get_context()
+        self._messages = context.Queue()
+        self._cancel = context.Event()
+        self._process = context.Process(
+            target=_run,
+            args=(self.distance_matrix, self.params, self.start_city, self.time_budget,
+                  self.profile, self._messages, self._cancel),
+            daemon=True
+        )
+        self._process.start()
+        self.status = 'running'
+        self.started = time.perf_counter()
+    
+    def cancel(self):
+        """İşi iptal et (çalışıyorsa o ana kadarki en iyi rota sonuç olur)"""
+        if self.status == 'queued':
+            self.status = 'cancelled'
+            self.finished = self.started = time.perf_counter()
+        elif self.status == 'running':
+            self._cancel.set()
+    
+    def poll(self):
+        """
+        Bekleyen mesajları işle
+        
+        Returns:
+            str: Güncel durum
+        """
+        if self.status != 'running':
+            return self.status
+        
+        self._drain()
+        if self.status == 'running' and not self._process.is_alive():
+            # Süreç bitti; kuyruktaki son mesajlar henüz aktarılmamış olabilir
+            self._drain(timeout=DRAIN_TIMEOUT)
+            if self.status == 'running':
+                self._finish('error', error=f"İşçi süreç beklenmedik şekilde sonlandı "
+                                            f"(çıkış kodu {self._process.exitcode})")
+        return self.status
+    
+    def _drain(self, timeout=None):
+        while self.status == 'running':
+            try:
+                if timeout is None:
+                    message = self._messages.get_nowait()
+                else:
+                    message = self._messages.get(timeout=timeout)
+            except queue.Empty:
+                return
+            
+            kind = message[0]
+            if kind == 'progress':
+                _, self.iteration, history = message
+                self.best_distance_history.extend(history)
+            elif kind == 'done':
+                result = message[1]
+                self.best_route = result['route']
+                self.best_distance = result['distance']
+                self.stop_reason = result['stop_reason']
+                self.instrumentation = result['instrumentation']
+                self._finish('cancelled' if self.stop_reason == 'cancelled' else 'done')
+            else:
+                self._finish('error', error=message[1])
+    
+    def _finish(self, status, error=None):
+        self.status = status
+        self.error = error
+        self.finished = time.perf_counter()
+        self._process.join(timeout=DRAIN_TIMEOUT)
+        self._messages.close()
+        # Matris işçiye kopyalandı; tutamaç belleği tutmasın
+        self.distance_matrix = None
+
+
+class JobRunner:
+    """
+    Eşzamanlı iş sayısını sınırlayan paylaşımlı çalıştırıcı
+    
+    Birden fazla kullanıcı oturumu (iş parçacığı) aynı örneği kullanabilir.
+    Sınır doluysa işler sırada bekler; her poll() çağrısında tüm çalışan
+    işler yoklanır, böylece sahibi ayrılmış işler de sırayı tıkamaz.
+    """
+    
+    def __init__(self, max_running=None):
+        """
+        Args:
+            max_running: Aynı anda çalışan en fazla iş (varsayılan: CPU sayısı)
+        """
+        self.max_running = max_running or os.cpu_count() or 1
+        self._jobs = []
+        self._lock = threading.Lock()
+    
+    def submit(self, job):
+        """İşi sıraya ekle (yer varsa hemen başlar)"""
+        with self._lock:
+            self._jobs.append(job)
+            self._schedule()
+        return job
+    
+    def poll(self, job):
+        """
+        İşi yokla ve sıradaki işleri başlat
+        
+        Returns:
+            str: İşin güncel durumu
+        """
+        with self._lock:
+            self._schedule()
+            return job.poll()
+    
+    def position(self, job):
+        """Sıradaki iş için 1'den başlayan sıra numarası (sırada değilse None)"""
+        with self._lock:
+            queued = [item for item in self._jobs if item.status == 'queued']
+        return queued.index(job) + 1 if job in queued else None
+    
+    def _schedule(self):
+        for job in self._jobs:
+            job.poll()
+        self._jobs = [job for job in self._jobs if not job.done]
+        
+        running = sum(job.status == 'running' for job in self._jobs)
+        for job in self._jobs:
+            if running >= self.max_running:
+                break
+            if job.status == 'queued':
+                job.start()
+                running += 1
+
@@ -0,0 +1,341 @@
+"""
+Yerel Arama (2-opt / Or-opt) ile Rota İyileştirme
+Komşu listeleri ve don't-look bitleri ile hızlı yerel arama
+"""
+
+import time
+from collections import deque
+
+import numpy as np
+
+from .ant_algorithm import nearest_neighbors
+from .compact import is_packed
+from .spatial import is_graph
+
+
+# Bu değerden küçük iyileşmeler yok sayılır (kayan nokta gürültüsü)
+EPSILON = 1e-10
+
+
+class _Tour:
+    """
+    Döngüsel tur gösterimi
+    
+    Şehirlerin tur içindeki konumları (pos) tutulduğu için ardıl/öncül
+    sorguları O(1)'dir. Asimetrik matrislerde ileri ve geri yöndeki kenar
+    maliyetlerinin önek toplamları tutulur; böylece bir segmenti ters
+    çevirmenin maliyet farkı da O(1) hesaplanır.
+    """
+    
+    def __init__(self, cities, distance_matrix, symmetric):
+        self.cities = list(cities)
+        self.n = len(self.cities)
+        self.d = distance_matrix
+        self.symmetric = symmetric
+        self.pos = {}
+        self.refresh()
+    
+    def refresh(self):
+        """Konumları ve (asimetrik ise) önek toplamlarını yeniden hesapla"""
+        cities, d, n = self.cities, self.d, self.n
+        self.pos = {city: i for i, city in enumerate(cities)}
+        
+        if self.symmetric:
+            return
+        
+        forward = [0.0] * (n + 1)
+        backward = [0.0] * (n + 1)
+        for i in range(n):
+            a, b = cities[i], cities[(i + 1) % n]
+            forward[i + 1] = forward[i] + d[a, b]
+            backward[i + 1] = backward[i] + d[b, a]
+        self.forward, self.backward = forward, backward
+    
+    def succ(self, city):
+        return self.cities[(self.pos[city] + 1) % self.n]
+    
+    def pred(self, city):
+        return self.cities[self.pos[city] - 1]
+    
+    def reversal_cost(self, p, q):
+        """p..q konumlarındaki (döngüsel) segment ters çevrilirse iç maliyet farkı"""
+        if self.symmetric:
+            return 0.0
+        
+        forward, backward, n = self.forward, self.backward, self.n
+        if p <= q:
+            return (backward[q] - backward[p]) - (forward[q] - forward[p])
+        return ((backward[n] - backward[p] + backward[q])
+                - (forward[n] - forward[p] + forward[q]))
+    
+    def reverse(self, p, q):
+        """p..q konumlarındaki (döngüsel) segmenti ters çevir"""
+        n = self.n
+        length = (q - p) % n + 1
+        
+        # Simetrik durumda tümleyeni ters çevirmek aynı turu verir
+        if self.symmetric and length > n // 2:
+            p, q = (q + 1) % n, (p - 1) % n
+            length = n - length
+        
+        positions = [(p + i) % n for i in range(length)]
+        segment = [self.cities[i] for i in positions]
+        for i, city in zip(positions, reversed(segment)):
+            self.cities[i] = city
+            self.pos[city] = i
+        
+        if not self.symmetric:
+            self.refresh()
+    
+    def move_segment(self, segment, after, reverse):
+        """
+        Segmenti turdan çıkarıp 'after' şehrinden sonra yerleştir
+        
+        Yalnızca segment ile 'after' arasındaki (kısa taraftaki) şehirler
+        kaydırılır; tur yeniden kurulmaz.
+        """
+        n, length = self.n, len(segment)
+        start = self.pos[segment[0]]
+        target = self.pos[after]
+        segment = segment[::-1] if reverse else segment
+        
+        # Segment ile 'after' arasındaki şehir sayıları: ileride ('after' dahil) ve geride
+        ahead = (target - start - length + 1) % n
+        behind = n - length - ahead
+        
+        if ahead <= behind:
+            # Aradaki şehirler geri kayar, segment arkalarına yerleşir
+            block = [self.cities[(start + length + i) % n] for i in range(ahead)] + segment
+        else:
+            # Aradaki şehirler ileri kayar, segment 'after' sonrasına yerleşir
+            block = segment + [self.cities[(target + 1 + i) % n] for i in range(behind)]
+            start = target + 1
+        
+        for i, city in enumerate(block):
+            index = (start + i) % n
+            self.cities[index] = city
+            self.pos[city] = index
+        
+        if not self.symmetric:
+            self.refresh()
+
+
+class LocalSearch:
+    """
+    2-opt ve Or-opt hamleleriyle rota iyileştirme
+    
+    - Hamle maliyet farkları O(1) hesaplanır
+    - Her şehir için yalnızca en yakın komşular denenir (komşu listeleri)
+    - İyileştirme bulunamayan şehirler, komşu kenarları değişene kadar
+      tekrar denenmez (don't-look bitleri)
+    
+    optimize() çıktısı gibi [0, ..., 0] biçimindeki kapalı rotalarla da,
+    başlangıca dönüşü içermeyen açık rotalarla da çalışır. Rotanın tüm
+    şehirleri içermesi gerekmez (alt turlar da iyileştirilebilir).
+    """
+    
+    def __init__(self, distance_matrix, n_neighbors=10, two_opt=True, or_opt=True,
+                 max_segment_length=3, neighbors=None, symmetric=None):
+        """
+        Args:
+            distance_matrix: NxN mesafe matrisi veya KNNGraph (komşu listeleri
+                             grafikten alınır)
+            n_neighbors: Şehir başına denenecek en yakın komşu sayısı
+            two_opt: 2-opt hamlelerini kullan
+            or_opt: Or-opt (segment taşıma) hamlelerini kullan
+            max_segment_length: Or-opt ile taşınacak en uzun segment
+            neighbors: Hazır komşu listeleri (opsiyonel, örn. ACO aday listeleri)
+            symmetric: Matris simetrik mi (varsayılan: otomatik tespit)
+        """
+        if not is_packed(distance_matrix) and not is_graph(distance_matrix):
+            distance_matrix = np.asarray(distance_matrix)
+        self.distance_matrix = distance_matrix
+        self.two_opt = two_opt
+        self.or_opt = or_opt
+        self.max_segment_length = max_segment_length
+        
+        if neighbors is None and is_graph(distance_matrix):
+            neighbors = distance_matrix.neighbors[:, :n_neighbors]
+        elif neighbors is None:
+            neighbors = nearest_neighbors(self.distance_matrix, n_neighbors)
+        self.neighbors = [list(row) for row in np.asarray(neighbors).tolist()]
+        
+        if symmetric is None and is_graph(distance_matrix):
+            symmetric = distance_matrix.symmetric
+        elif symmetric is None:
+            symmetric = is_packed(distance_matrix) or bool(
+                np.allclose(distance_matrix, distance_matrix.T)
+            )
+        self.symmetric = symmetric
+        
+        # İstatistikler
+        self.n_calls = 0
+        self.n_moves = 0
+        self.total_gain = 0.0
+        self.total_time = 0.0
+    
+    def route_length(self, route):
+        """Kapalı tur uzunluğu (son şehirden ilk şehre dönüş dahil)"""
+        route = np.asarray(route)
+        return float(self.distance_matrix[route, np.roll(route, -1)].sum())
+    
+    def improve(self, route):
+        """
+        Rotayı yerel optimuma kadar iyileştir
+        
+        Args:
+            route: Şehir indeksleri; [0, ..., 0] (kapalı) veya [0, ...] (açık)
+        
+        Returns:
+            tuple: (iyileştirilmiş rota (aynı biçimde), kazanç)
+        """
+        started = time.perf_counter()
+        
+        route = [int(city) for city in route]
+        closed = len(route) > 1 and route[0] == route[-1]
+        cities = route[:-1] if closed else route
+        start_city = cities[0]
+        
+        gain = 0.0
+        if len(cities) > 3:
+            before = self.route_length(cities)
+            tour = _Tour(cities, self.distance_matrix, self.symmetric)
+            self._search(tour)
+            
+            # Başlangıç şehri yeniden başa alınır
+            index = tour.cities.index(start_city)
+            cities = tour.cities[index:] + tour.cities[:index]
+            gain = before - self.route_length(cities)
+        
+        self.n_calls += 1
+        self.total_gain += gain
+        self.total_time += time.perf_counter() - started
+        
+        return (cities + [start_city] if closed else cities), gain
+    
+    def stats(self):
+        """
+        Yerel arama istatistikleri
+        
+        Returns:
+            dict: Çağrı sayısı, uygulanan hamle sayısı, toplam kazanç ve süre
+        """
+        return {
+            'calls': self.n_calls,
+            'moves': self.n_moves,
+            'total_gain': self.total_gain,
+            'total_time': self.total_time
+        }
+    
+    def _search(self, tour):
+        """Don't-look bitleri ile iyileştirme döngüsü"""
+        queue = deque(tour.cities)
+        active = set(tour.cities)
+        
+        while queue:
+            city = queue.popleft()
+            active.discard(city)
+            
+            touched = None
+            if self.two_opt:
+                touched = self._two_opt_move(tour, city)
+            if touched is None and self.or_opt:
+                touched = self._or_opt_move(tour, city)
+            
+            if touched is None:
+                continue
+            
+            # Kenarları değişen şehirlerin bitleri sıfırlanır
+            self.n_moves += 1
+            for other in touched:
+                if other not in active:
+                    active.add(other)
+                    queue.append(other)
+    
+    def _two_opt_move(self, tour, a):
+        """a şehrine komşu kenarlar için ilk iyileştiren 2-opt hamlesini uygula"""
+        d = self.distance_matrix
+        
+        # Ardıl yönü: ... a b ... c e ... -> ... a c ... b e ...
+        b = tour.succ(a)
+        d_ab = d[a, b]
+        for c in self.neighbors[a]:
+            d_ac = d[a, c]
+            if d_ac >= d_ab:
+                break
+            if c not in tour.pos:
+                continue
+            e = tour.succ(c)
+            if c == b or e == a:
+                continue
+            
+            p, q = tour.pos[b], tour.pos[c]
+            delta = d_ac + d[b, e] - d_ab - d[c, e] + tour.reversal_cost(p, q)
+            if delta < -EPSILON:
+                tour.reverse(p, q)
+                return (a, b, c, e)
+        
+        # Öncül yönü: ... b a ... e c ... -> ... b e ... a c ...
+        b = tour.pred(a)
+        d_ba = d[b, a]
+        for c in self.neighbors[a]:
+            d_ac = d[a, c]
+            if d_ac >= d_ba:
+                break
+            if c not in tour.pos:
+                continue
+            e = tour.pred(c)
+            if c == b or e == a:
+                continue
+            
+            p, q = tour.pos[a], tour.pos[e]
+            delta = d[b, e] + d_ac - d_ba - d[e, c] + tour.reversal_cost(p, q)
+            if delta < -EPSILON:
+                tour.reverse(p, q)
+                return (a, b, c, e)
+        
+        return None
+    
+    def _or_opt_move(self, tour, a):
+        """a şehriyle başlayan kısa bir segmenti daha iyi bir konuma taşı"""
+        d = self.distance_matrix
+        n = tour.n
+        
+        for length in range(1, min(self.max_segment_length, n - 3) + 1):
+            start = tour.pos[a]
+            segment = [tour.cities[(start + i) % n] for i in range(length)]
+            first, last = segment[0], segment[-1]
+            prev, nxt = tour.pred(first), tour.succ(last)
+            
+            removal_gain = d[prev, first] + d[last, nxt] - d[prev, nxt]
+            if removal_gain <= EPSILON:
+                continue
+            
+            # Ters yöndeki iç maliyet farkı (simetrik matriste sıfır)
+            reverse_cost = 0.0
+            if not self.symmetric:
+                reverse_cost = sum(d[segment[i + 1], segment[i]] - d[segment[i], segment[i + 1]]
+                                   for i in range(length - 1))
+            
+            in_segment = set(segment)
+            for c in self.neighbors[first] + self.neighbors[last]:
+                if c in in_segment or c not in tour.pos:
+                    continue
+                
+                for u, v in ((c, tour.succ(c)), (tour.pred(c), c)):
+                    if u in in_segment or v in in_segment:
+                        continue
+                    
+                    d_uv = d[u, v]
+                    forward = d[u, first] + d[last, v] - d_uv
+                    backward = d[u, last] + d[first, v] - d_uv + reverse_cost
+                    
+                    if forward - removal_gain < -EPSILON:
+                        tour.move_segment(segment, u, reverse=False)
+                        return (prev, nxt, first, last, u, v)
+                    if backward - removal_gain < -EPSILON:
+                        tour.move_segment(segment, u, reverse=True)
+                        return (prev, nxt, first, last, u, v)
+        
+        return None
+
@@ -0,0 +1,257 @@
+"""
+İçerik Adresli Mesafe / Süre Matrisi Deposu
+Hesaplanan matrisler .npy olarak saklanır, bellek eşlemeli (mmap) yüklenir
+"""
+
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+from .compact import TriangularMatrix, is_packed
+
+
+# Depo biçimi değişirse eski kayıtların anahtarları geçersiz olur
+STORE_VERSION = 1
+
+
+def matrix_key(coordinates, mode='driving', source='haversine', compact=False):
+    """
+    Matris çifti için içerik adresi
+    
+    Args:
+        coordinates: [(lat, lng), ...] koordinat listesi (sıra önemlidir)
+        mode: Ulaşım modu (örn. "driving")
+        source: Matris kaynağı (örn. "api", "haversine")
+        compact: Kompakt (float32 / paketlenmiş) gösterim mi
+    
+    Returns:
+        str: SHA-256 onaltılık özet
+    """
+    payload = json.dumps({
+        'version': STORE_VERSION,
+        'coordinates': np.asarray(coordinates, dtype=float).round(7).tolist(),
+        'mode': mode,
+        'source': source,
+        'compact': bool(compact)
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _packed_size(length):
+    """N(N+1)/2 uzunluğundaki paketlenmiş diziden N"""
+    n = int((np.sqrt(8 * length + 1) - 1) / 2)
+    if n * (n + 1) // 2 != length:
+        raise ValueError(f"Paketlenmiş matris uzunluğu geçersiz: {length}")
+    return n
+
+
+class MatrixStore:
+    """
+    Mesafe ve süre matrislerinin disk deposu
+    
+    Her kayıt <anahtar>.distance.npy ve <anahtar>.time.npy dosya çiftidir.
+    Kayıtlar np.load(mmap_mode='r') ile yüklenir; böylece tekrar eden
+    çalıştırmalar ve aynı matrisi kullanan süreçler matrisi yeniden
+    hesaplamak veya kopyalamak yerine işletim sisteminin sayfa önbelleğini
+    paylaşır. Paketlenmiş (TriangularMatrix) matrisler tek boyutlu veri
+    olarak saklanır ve yine TriangularMatrix olarak döner.
+    
+    - max_entries / max_bytes aşılınca en uzun süredir kullanılmayan kayıtlar silinir
+    - ttl süresini aşan kayıtlar geçersiz sayılır (örn. değişen trafik süreleri)
+    - invalidate() ile tek kayıt, clear() ile tüm depo silinir
+    """
+    
+    def __init__(self, directory='.cache/matrices', max_entries=32, max_bytes=None,
+                 ttl=None):
+        """
+        Args:
+            directory: Depo dizini
+            max_entries: En fazla kayıt (matris çifti) sayısı (None ise sınırsız)
+            max_bytes: Toplam disk kullanımı sınırı (None ise sınırsız)
+            ttl: Kayıt ömrü (saniye, None ise süresiz)
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        
+        # İstatistikler
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def _paths(self, key):
+        base = os.path.join(self.directory, key)
+        return base + '.distance.npy', base + '.time.npy'
+    
+    def __contains__(self, key):
+        distance_path, time_path = self._paths(key)
+        if not (os.path.exists(distance_path) and os.path.exists(time_path)):
+            return False
+        return not self._expired(key)
+    
+    def _expired(self, key):
+        """Tamamlanmış kaydın ttl süresi doldu mu (yarım kayıt silinmez)"""
+        if self.ttl is None:
+            return False
+        try:
+            # Süre dosyasına yazıldıktan sonra dokunulmaz; mtime oluşturma zamanıdır
+            return time.time() - os.path.getmtime(self._paths(key)[1]) > self.ttl
+        except OSError:
+            # Çift başka bir süreç tarafından henüz yazılıyor veya siliniyor
+            return False
+    
+    def get(self, key):
+        """
+        Kaydı bellek eşlemeli (salt okunur) olarak yükle
+        
+        Args:
+            key: matrix_key() ile üretilen anahtar
+        
+        Returns:
+            tuple: (distance_matrix, time_matrix) veya None (kayıt yok / süresi dolmuş)
+        """
+        with self._lock:
+            if key not in self:
+                if self._expired(key):
+                    self._remove(key)
+                self.misses += 1
+                return None
+            
+            try:
+                matrices = tuple(self._load(path) for path in self._paths(key))
+            except (OSError, ValueError) as e:
+                print(f"Bozuk matris kaydı siliniyor ({key[:12]}): {e}")
+                self._remove(key)
+                self.misses += 1
+                return None
+            
+            # Son erişim zamanı mesafe dosyasının mtime'ıdır (LRU silme sırası)
+            os.utime(self._paths(key)[0])
+            self.hits += 1
+            return matrices
+    
+    def _load(self, path):
+        array = np.load(path, mmap_mode='r')
+        if array.ndim == 1:
+            return TriangularMatrix(_packed_size(len(array)), data=array)
+        return array
+    
+    def put(self, key, distance_matrix, time_matrix):
+        """
+        Matris çiftini depoya yaz
+        
+        Dosyalar önce geçici isimle yazılıp atomik olarak yeniden adlandırılır;
+        eşzamanlı okuyucular yarım yazılmış dosya görmez.
+        
+        Args:
+            key: matrix_key() ile üretilen anahtar
+            distance_matrix: NxN numpy array veya TriangularMatrix
+            time_matrix: NxN numpy array veya TriangularMatrix
+        """
+        with self._lock:
+            for path, matrix in zip(self._paths(key), (distance_matrix, time_matrix)):
+                array = matrix.data if is_packed(matrix) else np.asarray(matrix)
+                handle, temporary = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+                try:
+                    with os.fdopen(handle, 'wb') as file:
+                        np.save(file, array)
+                    os.replace(temporary, path)
+                except BaseException:
+                    if os.path.exists(temporary):
+                        os.remove(temporary)
+                    raise
+            self._evict()
+    
+    def get_or_create(self, key, factory):
+        """
+        Kayıt varsa yükle, yoksa factory() ile hesaplayıp kaydet
+        
+        Args:
+            key: matrix_key() ile üretilen anahtar
+            factory: (distance_matrix, time_matrix) döndüren fonksiyon
+        
+        Returns:
+            tuple: (distance_matrix, time_matrix)
+        """
+        matrices = self.get(key)
+        if matrices is None:
+            matrices = factory()
+            self.put(key, *matrices)
+        return matrices
+    
+    def invalidate(self, key):
+        """Kaydı sil (kayıt yoksa bir şey yapmaz)"""
+        with self._lock:
+            self._remove(key)
+    
+    def clear(self):
+        """Tüm kayıtları sil"""
+        with self._lock:
+            for key in self.keys():
+                self._remove(key)
+    
+    def _remove(self, key):
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+    
+    def keys(self):
+        """Depodaki kayıt anahtarları"""
+        paths = glob.glob(os.path.join(self.directory, '*.distance.npy'))
+        return [os.path.basename(path)[:-len('.distance.npy')] for path in paths]
+    
+    def _evict(self):
+        """Süresi dolan ve sınırları aşan (en eski erişilen) kayıtları sil"""
+        entries = []
+        for key in self.keys():
+            if self._expired(key):
+                self._remove(key)
+                self.evictions += 1
+                continue
+            # Eşzamanlı yazılan (süre dosyası henüz olmayan) çiftlere dokunulmaz
+            paths = self._paths(key)
+            try:
+                entries.append((os.path.getmtime(paths[0]), key,
+                                sum(os.path.getsize(path) for path in paths)))
+            except OSError:
+                continue
+        
+        entries.sort()
+        total = sum(size for _, _, size in entries)
+        while entries and (
+            (self.max_entries is not None and len(entries) > self.max_entries)
+            or (self.max_bytes is not None and total > self.max_bytes)
+        ):
+            _, key, size = entries.pop(0)
+            self._remove(key)
+            total -= size
+            self.evictions += 1
+    
+    def stats(self):
+        """
+        Depo istatistikleri
+        
+        Returns:
+            dict: İsabet, ıska, silinen kayıt, kayıt sayısı ve disk kullanımı
+        """
+        keys = self.keys()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(keys),
+            'bytes': sum(os.path.getsize(path) for key in keys
+                         for path in self._paths(key) if os.path.exists(path))
+        }
+
@@ -4,128 +4,225 @@ Google Maps API ve Haversine formülü kullanımı
 """
 
 import numpy as np
-import googlemaps
-from .haversine import haversine_distance
+from .haversine import haversine_matrix
+from .compact import is_packed, compact_matrix
+from .matrix_store import matrix_key
+from .spatial import KNNGraph
 
+# API ve yol ağı istemcileri yalnızca kullanıldıklarında yüklenir; Haversine
+# ile çalışan kullanım (örn. işçi süreçler) yalnızca NumPy gerektirir
 
-def get_coordinates(gmaps_client, address):
+
+def __getattr__(name):
     """
-    Google Maps Geocoding API ile adresin koordinatlarını al
-    
-    Args:
-        gmaps_client: Google Maps client
-        address: Aranacak adres (str)
-    
-    Returns:
-        tuple: (lat, lng) veya None
+    Geocoding fonksiyonları core.geocoding modülüne taşındı; eski importlar
+    (from core.matrix_utils import get_coordinates) çalışmaya devam eder
     """
-    try:
-        result = gmaps_client.geocode(address)
-        if result:
-            location = result[0]['geometry']['location']
-            return (location['lat'], location['lng'])
-        return None
-    except Exception as e:
-        print(f"Koordinat alma hatası ({address}): {e}")
-        return None
+    if name in ('get_coordinates', 'get_coordinates_batch'):
+        from . import geocoding
+        return getattr(geocoding, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-def get_coordinates_batch(gmaps_client, addresses):
+def create_distance_matrix(coordinates, gmaps_client=None, use_api=True, compact=False,
+                           store=None, fetcher=None, knn=None, road_network=None):
     """
-    Birden fazla adres için toplu koordinat alma
+    Koordinatlar arası mesafe matrisi oluştur
     
     Args:
-        gmaps_client: Google Maps client
-        addresses: Adres listesi
+        coordinates: [(lat, lng), ...] koordinat listesi
+        gmaps_client: Google Maps client (opsiyonel)
+        use_api: True ise Google Maps API kullan, False ise Haversine
+        compact: True ise matrisler float32 tutulur; simetrik Haversine
+                 matrisleri paketlenmiş üst üçgen (TriangularMatrix) olur
+        store: MatrixStore (opsiyonel); aynı koordinat/kaynak için önceden
+               hesaplanmış matrisler buradan bellek eşlemeli yüklenir
+        fetcher: DistanceMatrixFetcher (opsiyonel); verilmezse gmaps_client ile
+                 varsayılan ayarlarla oluşturulur
+        knn: Nokta başına komşu sayısı (opsiyonel). Verilirse yoğun matris
+             yerine seyrek KNNGraph döndürülür; mesafeler Haversine ile
+             hesaplanır (API ve depo kullanılmaz), bellek O(N knn) kalır
+        road_network: RoadNetwork veya RoadNetworkFetcher (opsiyonel). Verilirse
+                      mesafe ve süreler ağ bağlantısı olmadan yerel yol ağı
+                      üzerinde hesaplanır (API kullanılmaz)
     
     Returns:
-        list: [(lat, lng), ...] koordinat listesi
+        tuple: (distance_matrix, time_matrix)
+            - distance_matrix: NxN numpy array, TriangularMatrix veya KNNGraph (km)
+            - time_matrix: NxN numpy array, TriangularMatrix veya KNNGraph (dakika)
     """
-    coordinates = []
+    if knn is not None:
+        print(f"Izgara indeksi ile {knn} en yakın komşu grafiği oluşturuluyor...")
+        
+        distance_matrix = KNNGraph.from_coordinates(coordinates, k=knn)
+        time_matrix = distance_matrix.scaled(1.5)  # Tahmini süre
+        
+        print("Mesafe grafiği oluşturuldu!")
+        return distance_matrix, time_matrix
+    
+    dtype = np.float32 if compact else float
+    road = _road_fetcher(road_network)
+    api = bool(use_api and (gmaps_client or fetcher)) and road is None
+    source = road.source if road is not None else ("api" if api else "haversine")
+    
+    if store is not None:
+        key = matrix_key(coordinates, mode="driving", source=source, compact=compact)
+        matrices = store.get(key)
+        if matrices is not None:
+            print("Mesafe matrisi depodan yüklendi!")
+            return matrices
+    
+    # Haversine ile doldurulan API hücreleri varsa sonuç depoya yazılmaz
+    fallback_used = False
     
-    for i, address in enumerate(addresses, 1):
-        print(f"Koordinat alınıyor {i}/{len(addresses)}: {address}")
-        coord = get_coordinates(gmaps_client, address)
+    if road is not None:
+        # Yerel yol ağı üzerinde çoktan çoka en kısa yollar
+        print("Yol ağı üzerinde mesafeler hesaplanıyor...")
         
-        if coord:
-            coordinates.append(coord)
-        else:
-            raise ValueError(f"Koordinat alınamadı: {address}")
+        distance_matrix, time_matrix = road.fetch(coordinates)
+        distance_matrix = distance_matrix.astype(dtype, copy=False)
+        time_matrix = time_matrix.astype(dtype, copy=False)
+        
+        stats = road.stats
+        print(f"{stats['searches']} Dijkstra araması ({stats['cached_pairs']} çift önbellekten), "
+              f"{stats['fallback_elements']} eleman Haversine ile dolduruldu")
+        fallback_used = stats['fallback_elements'] > 0
+    elif api:
+        # Google Maps Distance Matrix API kullan (döşemeli, eşzamanlı istekler)
+        print("Google Maps Distance Matrix API ile mesafeler hesaplanıyor...")
+        
+        fetcher = _api_fetcher(fetcher, gmaps_client)
+        distance_matrix, time_matrix = fetcher.fetch(coordinates)
+        distance_matrix = distance_matrix.astype(dtype, copy=False)
+        time_matrix = time_matrix.astype(dtype, copy=False)
+        
+        stats = fetcher.stats
+        print(f"{stats['requests']} istek ({stats['tiles']} döşeme, {stats['retries']} "
+              f"yeniden deneme), {stats['fallback_elements']} eleman Haversine ile dolduruldu")
+        fallback_used = stats['fallback_elements'] > 0
+    else:
+        # Haversine formülü kullan (kuş uçuşu, vektörize)
+        print("Haversine formülü ile mesafeler hesaplanıyor...")
+        
+        distance_matrix = haversine_matrix(coordinates, packed=compact, dtype=dtype)
+        time_matrix = distance_matrix * 1.5  # Tahmini süre
+    
+    if store is not None and not fallback_used:
+        store.put(key, distance_matrix, time_matrix)
     
-    return coordinates
+    print("Mesafe matrisi oluşturuldu!")
+    return distance_matrix, time_matrix
 
 
-def create_distance_matrix(coordinates, gmaps_client=None, use_api=True):
+def update_distance_matrix(distance_matrix, time_matrix, coordinates, add=None, remove=None,
+                           gmaps_client=None, use_api=True, fetcher=None, store=None,
+                           road_network=None):
     """
-    Koordinatlar arası mesafe matrisi oluştur
+    Nokta eklenip çıkarıldığında matrisleri artımlı güncelle
+    
+    Korunan noktalar arası değerler mevcut matrislerden kopyalanır; yalnızca
+    eklenen noktaların satır ve sütunları hesaplanır (Haversine veya API).
+    Böylece k nokta eklemek N^2 yerine O(k N) mesafe hesabı / API elemanı
+    gerektirir.
     
     Args:
-        coordinates: [(lat, lng), ...] koordinat listesi
+        distance_matrix: Mevcut NxN mesafe matrisi (numpy array veya TriangularMatrix)
+        time_matrix: Mevcut NxN süre matrisi
+        coordinates: Mevcut [(lat, lng), ...] koordinat listesi
+        add: Eklenecek [(lat, lng), ...] koordinatlar (sona eklenir)
+        remove: Çıkarılacak noktaların mevcut indeksleri
         gmaps_client: Google Maps client (opsiyonel)
-        use_api: True ise Google Maps API kullan, False ise Haversine
+        use_api: True ise yeni satır/sütunlar için Distance Matrix API kullan
+        fetcher: DistanceMatrixFetcher (opsiyonel)
+        store: MatrixStore (opsiyonel); güncellenen matrisler buraya yazılır
+        road_network: RoadNetwork veya RoadNetworkFetcher (opsiyonel); yeni
+                      satır/sütunlar yerel yol ağı üzerinde hesaplanır
     
     Returns:
-        tuple: (distance_matrix, time_matrix)
-            - distance_matrix: NxN numpy array (km)
-            - time_matrix: NxN numpy array (dakika)
+        tuple: (distance_matrix, time_matrix, coordinates, index_map)
+            - Matrisler girdi ile aynı gösterimde (yoğun / paketlenmiş, dtype)
+            - coordinates: Korunan noktalar (aynı sırada) + eklenen noktalar
+            - index_map: index_map[yeni_indeks] = eski indeks (yeni noktalar için -1);
+                         warm_start() ile doğrudan kullanılabilir
     """
+    packed = is_packed(distance_matrix)
+    distance_matrix = np.asarray(distance_matrix)
+    time_matrix = np.asarray(time_matrix)
+    dtype = distance_matrix.dtype
+    
     n = len(coordinates)
-    distance_matrix = np.zeros((n, n))
-    time_matrix = np.zeros((n, n))
+    removed = {int(index) for index in (remove or [])}
+    invalid = [index for index in removed if not 0 <= index < n]
+    if invalid:
+        raise IndexError(f"Geçersiz nokta indeksleri: {sorted(invalid)}")
     
-    if use_api and gmaps_client:
-        # Google Maps Distance Matrix API kullan
-        print("Google Maps Distance Matrix API ile mesafeler hesaplanıyor...")
-        
-        for i in range(n):
-            print(f"Nokta {i+1}/{n} için mesafeler hesaplanıyor...")
-            
-            try:
-                result = gmaps_client.distance_matrix(
-                    origins=[coordinates[i]],
-                    destinations=coordinates,
-                    mode="driving",
-                    language="tr",
-                    units="metric"
-                )
-                
-                if result['status'] == 'OK':
-                    for j, element in enumerate(result['rows'][0]['elements']):
-                        if element['status'] == 'OK':
-                            # Gerçek yol mesafesi ve süresi
-                            distance_matrix[i][j] = element['distance']['value'] / 1000  # km
-                            time_matrix[i][j] = element['duration']['value'] / 60  # dakika
-                        else:
-                            # API hatası durumunda Haversine kullan
-                            distance_matrix[i][j] = haversine_distance(
-                                coordinates[i], coordinates[j]
-                            )
-                            time_matrix[i][j] = distance_matrix[i][j] * 1.5  # Tahmini süre
-                else:
-                    raise Exception(f"API hatası: {result['status']}")
-                    
-            except Exception as e:
-                print(f"Hata (nokta {i}): {e}")
-                # Tüm satır için Haversine kullan
-                for j in range(n):
-                    distance_matrix[i][j] = haversine_distance(
-                        coordinates[i], coordinates[j]
-                    )
-                    time_matrix[i][j] = distance_matrix[i][j] * 1.5
-    else:
-        # Haversine formülü kullan (kuş uçuşu)
-        print("Haversine formülü ile mesafeler hesaplanıyor...")
+    kept = np.array([index for index in range(n) if index not in removed], dtype=np.intp)
+    added = [tuple(coord) for coord in (add or [])]
+    new_coordinates = [tuple(coordinates[index]) for index in kept] + added
+    k, m = len(kept), len(new_coordinates)
+    
+    # Korunan noktalar arası değerler olduğu gibi taşınır
+    new_distance = np.zeros((m, m), dtype=dtype)
+    new_time = np.zeros((m, m), dtype=dtype)
+    new_distance[:k, :k] = distance_matrix[np.ix_(kept, kept)]
+    new_time[:k, :k] = time_matrix[np.ix_(kept, kept)]
+    
+    road = _road_fetcher(road_network)
+    api = bool(use_api and (gmaps_client or fetcher)) and road is None
+    source = road.source if road is not None else ("api" if api else "haversine")
+    fallback_used = False
+    
+    if added and (api or road is not None):
+        if road is not None:
+            print(f"{len(added)} yeni nokta için yol ağı üzerinde mesafeler hesaplanıyor...")
+            fetcher = road
+        else:
+            print(f"{len(added)} yeni nokta için Distance Matrix API sorgulanıyor...")
+            fetcher = _api_fetcher(fetcher, gmaps_client)
         
-        for i in range(n):
-            for j in range(n):
-                if i != j:
-                    distance_matrix[i][j] = haversine_distance(
-                        coordinates[i], coordinates[j]
-                    )
-                    time_matrix[i][j] = distance_matrix[i][j] * 1.5  # Tahmini süre
+        # Yeni satırlar (yeni -> tüm noktalar) ve yeni sütunlar (korunan -> yeni)
+        new_distance[k:], new_time[k:] = fetcher.fetch(added, new_coordinates)
+        fallback_used = fetcher.stats['fallback_elements'] > 0
+        if k:
+            new_distance[:k, k:], new_time[:k, k:] = fetcher.fetch(new_coordinates[:k], added)
+            fallback_used = fallback_used or fetcher.stats['fallback_elements'] > 0
+    elif added:
+        rows = haversine_matrix(added, new_coordinates)
+        new_distance[k:] = rows
+        new_distance[:k, k:] = rows[:, :k].T
+        new_time[k:] = rows * 1.5  # Tahmini süre
+        new_time[:k, k:] = rows[:, :k].T * 1.5
     
-    print("Mesafe matrisi oluşturuldu!")
-    return distance_matrix, time_matrix
+    if packed:
+        new_distance = compact_matrix(new_distance, dtype=dtype)
+        new_time = compact_matrix(new_time, dtype=dtype)
+    
+    if store is not None and not fallback_used:
+        key = matrix_key(new_coordinates, mode="driving", source=source,
+                         compact=dtype == np.float32)
+        store.put(key, new_distance, new_time)
+    
+    index_map = np.concatenate([kept, np.full(len(added), -1, dtype=np.intp)])
+    print(f"Mesafe matrisi güncellendi: {len(removed)} nokta çıkarıldı, {len(added)} nokta eklendi")
+    return new_distance, new_time, new_coordinates, index_map
+
+
+def _api_fetcher(fetcher, gmaps_client):
+    """Verilen fetcher veya gmaps_client ile varsayılan ayarlı DistanceMatrixFetcher"""
+    if fetcher is not None:
+        return fetcher
+    from .distance_fetcher import DistanceMatrixFetcher
+    return DistanceMatrixFetcher(gmaps_client)
+
+
+def _road_fetcher(road_network):
+    """RoadNetwork -> varsayılan ayarlı RoadNetworkFetcher (zaten fetcher ise aynen)"""
+    if road_network is None:
+        return None
+    from .road_network import RoadNetworkFetcher
+    if isinstance(road_network, RoadNetworkFetcher):
+        return road_network
+    return RoadNetworkFetcher(road_network)
 
 
 def get_route_details(route_indices, distance_matrix, time_matrix, locations):
@@ -134,8 +231,8 @@ def get_route_details(route_indices, distance_matrix, time_matrix, locations):
     
     Args:
         route_indices: Rota indeksleri listesi
-        distance_matrix: Mesafe matrisi
-        time_matrix: Süre matrisi
+        distance_matrix: Mesafe matrisi (veya KNNGraph)
+        time_matrix: Süre matrisi (veya KNNGraph)
         locations: Lokasyon isimleri
     
     Returns:
@@ -149,8 +246,8 @@ def get_route_details(route_indices, distance_matrix, time_matrix, locations):
         idx_from = route_indices[i]
         idx_to = route_indices[i + 1]
         
-        distance = distance_matrix[idx_from][idx_to]
-        time = time_matrix[idx_from][idx_to]
+        distance = float(distance_matrix[idx_from, idx_to])
+        time = float(time_matrix[idx_from, idx_to])
         
         total_distance += distance
         total_time += time
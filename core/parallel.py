@@ -0,0 +1,221 @@
+"""
+Çok Süreçli Karınca Rota Oluşturma
+Paylaşımlı bellekteki feromon ve mesafe matrisleri ile paralel ACO
+"""
+
+import os
+import multiprocessing as mp
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .ant_algorithm import AntColonyOptimizer
+from .compact import TriangularMatrix, is_packed
+from .spatial import is_graph
+
+
+# İşçi süreçlere kopyalanmayıp paylaşımlı bellekten okunan diziler
+SHARED_ATTRIBUTES = ('distance_matrix', 'heuristic', 'pheromone',
+                     'candidates', 'candidate_heuristic')
+
+# İşçi süreçlere hiç gönderilmeyen (yalnızca ana süreçte anlamlı) alanlar
+WORKER_EXCLUDED = ('best_route', 'best_distance_history', 'rng',
+                   'seed_sequence', 'n_workers', '_pool', '_segments',
+                   '_iteration', 'local_search', 'instrumentation')
+
+# İşçi sürecin kendi optimizer kopyası ve bağlı bellek segmentleri
+_worker_optimizer = None
+_worker_segments = []
+
+
+def ant_random_values(entropy, iteration, ants, n_steps):
+    """
+    Karınca başına bağımsız rastgele sayı akışları üret
+    
+    Her (iterasyon, karınca) çifti kendi SeedSequence akışını kullanır;
+    bu yüzden sonuçlar işçi sayısından ve karıncaların işçilere nasıl
+    dağıtıldığından bağımsızdır.
+    
+    Args:
+        entropy: Ana tohumun entropisi (SeedSequence.entropy)
+        iteration: İterasyon numarası
+        ants: Karınca indeksleri
+        n_steps: Karınca başına gereken rastgele sayı adedi
+    
+    Returns:
+        numpy.ndarray: (len(ants), n_steps) rastgele sayılar
+    """
+    values = np.empty((len(ants), n_steps))
+    for row, ant in enumerate(ants):
+        stream = np.random.SeedSequence(entropy, spawn_key=(iteration, ant))
+        values[row] = np.random.default_rng(stream).random(n_steps)
+    return values
+
+
+def _init_worker(state, specs):
+    """İşçi süreç başlangıcı: paylaşımlı dizilere bağlanıp optimizer kur"""
+    global _worker_optimizer, _worker_segments
+    
+    optimizer = AntColonyOptimizer.__new__(AntColonyOptimizer)
+    optimizer.__dict__.update(state)
+    optimizer.instrumentation = None
+    
+    _worker_segments = []
+    for name, (segment_name, shape, dtype, packed) in specs.items():
+        segment = shared_memory.SharedMemory(name=segment_name)
+        _worker_segments.append(segment)
+        array = np.ndarray(shape, dtype=dtype, buffer=segment.buf)
+        setattr(optimizer, name, TriangularMatrix(packed, data=array) if packed else array)
+    
+    _worker_optimizer = optimizer
+
+
+def _construct_chunk(args):
+    """İşçi süreçte bir karınca grubunun rotalarını ve mesafelerini üret"""
+    start_city, entropy, iteration, ants = args
+    optimizer = _worker_optimizer
+    
+    random_values = ant_random_values(entropy, iteration, ants, optimizer.n_cities - 1)
+    routes = optimizer.construct_solutions(start_city, random_values)
+    
+    return routes, optimizer.calculate_route_distances(routes)
+
+
+class ParallelAntColonyOptimizer(AntColonyOptimizer):
+    """
+    Karıncaları birden fazla süreçte çalıştıran ACO
+    
+    Bir iterasyondaki karıncalar birbirinden bağımsızdır; bu yüzden
+    rota oluşturma işçi süreçlere dağıtılır. Mesafe, heuristik ve feromon
+    matrisleri multiprocessing.shared_memory içinde tutulur ve işçilere
+    yalnızca bir kez (segment adıyla) tanıtılır; iterasyon başına NxN dizi
+    kopyalanmaz. Ana süreç rotaları ve mesafeleri toplar, feromonu
+    paylaşımlı bellekte yerinde günceller. Paketlenmiş (compact=True)
+    matrislerde yalnızca üst üçgen verisi paylaşılır.
+    
+    Not: Windows/macOS (spawn) üzerinde çağıran betik
+    `if __name__ == "__main__":` bloğu içinde çalıştırılmalıdır.
+    """
+    
+    def __init__(self, distance_matrix, n_workers=None, **kwargs):
+        """
+        Args:
+            distance_matrix: NxN mesafe matrisi
+            n_workers: İşçi süreç sayısı (varsayılan: CPU sayısı)
+            **kwargs: AntColonyOptimizer parametreleri
+        """
+        if kwargs.get('strategy') == 'acs':
+            raise ValueError("ACS yerel feromon güncellemesi paralel modda desteklenmez")
+        if is_graph(distance_matrix):
+            raise ValueError("Seyrek KNNGraph paralel modda desteklenmez")
+        
+        super().__init__(distance_matrix, **kwargs)
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.seed_sequence = np.random.SeedSequence(kwargs.get('seed'))
+        self._iteration = 0
+        self._pool = None
+        self._segments = []
+    
+    def start(self):
+        """Paylaşımlı belleği ayır ve işçi süreçleri başlat"""
+        if self._pool is not None:
+            return
+        
+        specs = {}
+        for name in SHARED_ATTRIBUTES:
+            matrix = getattr(self, name, None)
+            packed = matrix.n if is_packed(matrix) else 0
+            array = matrix.data if packed else matrix
+            if not isinstance(array, np.ndarray):
+                continue
+            
+            segment = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            shared = np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)
+            shared[...] = array
+            
+            # Ana süreç de aynı belleği kullanır (feromon yerinde güncellenir)
+            if packed:
+                matrix.data = shared
+            else:
+                setattr(self, name, shared)
+            self._segments.append(segment)
+            specs[name] = (segment.name, array.shape, array.dtype, packed)
+        
+        state = {key: value for key, value in self.__dict__.items()
+                 if key not in specs and key not in WORKER_EXCLUDED}
+        
+        self._pool = mp.get_context().Pool(
+            self.n_workers, initializer=_init_worker, initargs=(state, specs)
+        )
+    
+    def close(self):
+        """İşçileri durdur, dizileri özel belleğe geri kopyala ve segmentleri sil"""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        
+        for name in SHARED_ATTRIBUTES:
+            matrix = getattr(self, name, None)
+            if is_packed(matrix):
+                matrix.data = np.array(matrix.data)
+            elif isinstance(matrix, np.ndarray):
+                setattr(self, name, np.array(matrix))
+        
+        for segment in self._segments:
+            segment.close()
+            segment.unlink()
+        self._segments = []
+    
+    def __enter__(self):
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _construct_population(self, start_city):
+        """
+        Karıncaları işçilere dağıt, rotaları ve mesafeleri topla
+        
+        Returns:
+            tuple: (all_routes, all_distances)
+        """
+        self.start()
+        
+        with self._phase('construct'):
+            return self._construct_chunks(start_city)
+    
+    def _construct_chunks(self, start_city):
+        """İşçilerden karınca gruplarının rotalarını ve mesafelerini topla"""
+        chunks = np.array_split(np.arange(self.n_ants), min(self.n_workers, self.n_ants))
+        tasks = [(start_city, self.seed_sequence.entropy, self._iteration, chunk.tolist())
+                 for chunk in chunks if len(chunk)]
+        self._iteration += 1
+        
+        results = self._pool.map(_construct_chunk, tasks)
+        all_routes = np.concatenate([routes for routes, _ in results])
+        all_distances = np.concatenate([distances for _, distances in results])
+        self._count('ants_built', len(all_routes))
+        
+        return all_routes, all_distances
+    
+    def optimize(self, start_city=0, progress_callback=None, **kwargs):
+        """
+        ACO algoritmasını paralel çalıştır
+        
+        Çalışma bittiğinde işçi süreçler ve paylaşımlı bellek serbest bırakılır.
+        
+        Args:
+            start_city: Başlangıç şehri indeksi
+            progress_callback: İlerleme callback fonksiyonu (opsiyonel)
+            **kwargs: time_budget, target_distance, cancel_token
+        
+        Returns:
+            tuple: (best_route, best_distance)
+        """
+        try:
+            return super().optimize(start_city, progress_callback, **kwargs)
+        finally:
+            self.close()
+
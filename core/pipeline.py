@@ -0,0 +1,93 @@
+"""
+Rota Planlama Hattı (Pipeline)
+Arayüzden bağımsız geocoding -> mesafe matrisi -> ACO aşamaları
+"""
+
+from .ant_algorithm import AntColonyOptimizer
+from .matrix_utils import create_distance_matrix, get_route_details
+
+
+# solve() argümanlarıyla verilen, params içinde bulunamayacak anahtarlar
+RESERVED_PARAMS = ('distance_matrix', 'seed', 'instrumentation')
+
+
+def geocode(catalog, gmaps_client=None, cache=None):
+    """
+    Katalogdaki eksik koordinatları doldur
+    
+    Args:
+        catalog: LocationCatalog
+        gmaps_client: Google Maps client (None ise yalnızca önbellek / dosya)
+        cache: GeocodeCache (opsiyonel)
+    
+    Returns:
+        list: [(lat, lng), ...] tüm koordinatlar
+    
+    Raises:
+        ValueError: Koordinatı bulunamayan lokasyon kaldıysa
+    """
+    return catalog.fill_coordinates(gmaps_client, cache)
+
+
+def build_matrices(coordinates, gmaps_client=None, store=None, **options):
+    """
+    Mesafe ve süre matrislerini oluştur
+    
+    Args:
+        coordinates: [(lat, lng), ...] koordinat listesi
+        gmaps_client: Google Maps client (opsiyonel)
+        store: MatrixStore (opsiyonel)
+        **options: create_distance_matrix() seçenekleri
+                   (use_api, compact, knn, road_network)
+    
+    Returns:
+        tuple: (distance_matrix, time_matrix)
+    """
+    return create_distance_matrix(coordinates, gmaps_client, store=store, **options)
+
+
+def solve(distance_matrix, time_matrix, names, params=None, seed=None, time_budget=None,
+          instrumentation=None, progress_callback=None):
+    """
+    ACO ile rotayı bul ve özetle
+    
+    Args:
+        distance_matrix: Mesafe matrisi (veya KNNGraph)
+        time_matrix: Süre matrisi (veya KNNGraph)
+        names: Lokasyon adları (0. eleman başlangıç noktası)
+        params: AntColonyOptimizer parametreleri (opsiyonel)
+        seed: Rastgele sayı üreteci tohumu (opsiyonel)
+        time_budget: Saniye cinsinden süre bütçesi (opsiyonel)
+        instrumentation: Instrumentation (opsiyonel)
+        progress_callback: optimize() ilerleme callback'i (opsiyonel)
+    
+    Returns:
+        dict: {'route', 'route_names', 'total_distance', 'total_time',
+               'iterations', 'stop_reason', 'history', 'optimizer'}
+    
+    Raises:
+        ValueError: params ayrılmış bir anahtar (seed, instrumentation) içeriyorsa
+    """
+    params = params or {}
+    reserved = sorted(set(RESERVED_PARAMS) & set(params))
+    if reserved:
+        raise ValueError(f"params içinde kullanılamayan anahtarlar: {reserved} "
+                         f"(solve() argümanlarıyla verin)")
+    
+    optimizer = AntColonyOptimizer(distance_matrix, seed=seed, instrumentation=instrumentation,
+                                   **params)
+    route, _ = optimizer.optimize(start_city=0, progress_callback=progress_callback,
+                                  time_budget=time_budget)
+    details = get_route_details(route, distance_matrix, time_matrix, names)
+    
+    return {
+        'route': [int(city) for city in route],
+        'route_names': [str(names[city]) for city in route],
+        'total_distance': details['total_distance'],
+        'total_time': details['total_time'],
+        'iterations': len(optimizer.best_distance_history),
+        'stop_reason': optimizer.stop_reason,
+        'history': [float(value) for value in optimizer.best_distance_history],
+        'optimizer': optimizer
+    }
+
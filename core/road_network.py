@@ -0,0 +1,385 @@
+"""
+Yerel Yol Ağı ile Çevrimdışı Mesafe Hesaplama
+Koordinatları ağ düğümlerine oturtma ve çoktan çoka en kısa yollar (Dijkstra)
+"""
+
+import csv
+import hashlib
+import heapq
+import multiprocessing as mp
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .haversine import haversine_pairs
+from .spatial import GridIndex
+
+
+# Yol ağı dosyalarındaki varsayılan birimler: metre ve saniye
+LENGTH_SCALE = 1 / 1000  # m -> km
+DURATION_SCALE = 1 / 60  # s -> dakika
+
+WEIGHTS = ('duration', 'length')
+
+
+class RoadNetwork:
+    """
+    Yönlü yol ağı (CSR komşuluk dizileri)
+    
+    Düğümler 0..M-1 ile yeniden numaralandırılır; her kenarın uzunluğu (km)
+    ve geçiş süresi (dakika) tutulur. Çift yönlü yollar iki kenar olarak
+    saklanır.
+    """
+    
+    def __init__(self, node_coordinates, sources, targets, lengths, durations, node_ids=None):
+        """
+        Args:
+            node_coordinates: (M, 2) düğüm koordinatları (lat, lng)
+            sources: Kenar başlangıç düğümleri (0..M-1)
+            targets: Kenar bitiş düğümleri (0..M-1)
+            lengths: Kenar uzunlukları (km)
+            durations: Kenar süreleri (dakika)
+            node_ids: Dosyadaki orijinal düğüm kimlikleri (opsiyonel)
+        """
+        self.node_coordinates = np.asarray(node_coordinates, dtype=float).reshape(-1, 2)
+        self.n_nodes = len(self.node_coordinates)
+        self.node_ids = (np.arange(self.n_nodes) if node_ids is None
+                         else np.asarray(node_ids))
+        
+        sources = np.asarray(sources, dtype=np.int64)
+        order = np.argsort(sources, kind='stable')
+        self.indices = np.asarray(targets, dtype=np.int64)[order]
+        self.lengths = np.asarray(lengths, dtype=float)[order]
+        self.durations = np.asarray(durations, dtype=float)[order]
+        self.indptr = np.concatenate([[0], np.cumsum(np.bincount(sources, minlength=self.n_nodes))])
+        
+        self._index = None
+        self._fingerprint = None
+    
+    @classmethod
+    def from_csv(cls, nodes_path, edges_path, length_scale=LENGTH_SCALE,
+                 duration_scale=DURATION_SCALE, default_speed_kmh=50.0):
+        """
+        OSM'den türetilmiş düğüm / kenar listelerinden ağ oluştur
+        
+        nodes_path sütunları: id, lat, lng
+        edges_path sütunları: source, target, length[, duration][, oneway]
+        
+        Süre sütunu yoksa default_speed_kmh ile tahmin edilir. oneway
+        sütunu yoksa veya 0/false ise kenar iki yönde de eklenir.
+        
+        Args:
+            nodes_path: Düğüm CSV dosyası
+            edges_path: Kenar CSV dosyası
+            length_scale: Uzunluk birimi -> km çarpanı (varsayılan: metre)
+            duration_scale: Süre birimi -> dakika çarpanı (varsayılan: saniye)
+            default_speed_kmh: Süre sütunu yoksa kullanılacak hız
+        
+        Returns:
+            RoadNetwork
+        """
+        with open(nodes_path, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        node_ids = [row['id'] for row in rows]
+        positions = {node_id: i for i, node_id in enumerate(node_ids)}
+        node_coordinates = [(float(row['lat']), float(row['lng'])) for row in rows]
+        
+        sources, targets, lengths, durations = [], [], [], []
+        with open(edges_path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                u, v = positions[row['source']], positions[row['target']]
+                length = float(row['length']) * length_scale
+                if row.get('duration') not in (None, ''):
+                    duration = float(row['duration']) * duration_scale
+                else:
+                    duration = length / default_speed_kmh * 60
+                
+                oneway = str(row.get('oneway', '')).strip().lower() in ('1', 'true', 'yes')
+                for a, b in ([(u, v)] if oneway else [(u, v), (v, u)]):
+                    sources.append(a)
+                    targets.append(b)
+                    lengths.append(length)
+                    durations.append(duration)
+        
+        return cls(node_coordinates, sources, targets, lengths, durations, node_ids=node_ids)
+    
+    @classmethod
+    def load(cls, path):
+        """save() ile yazılmış .npz dosyasından ağı yükle (CSV ayrıştırmadan hızlı)"""
+        with np.load(path, allow_pickle=False) as data:
+            network = cls.__new__(cls)
+            network.node_coordinates = data['node_coordinates']
+            network.n_nodes = len(network.node_coordinates)
+            network.node_ids = data['node_ids']
+            network.indptr = data['indptr']
+            network.indices = data['indices']
+            network.lengths = data['lengths']
+            network.durations = data['durations']
+        network._index = None
+        network._fingerprint = None
+        return network
+    
+    def save(self, path):
+        """Ağı sıkıştırılmamış .npz olarak kaydet"""
+        np.savez(path, node_coordinates=self.node_coordinates,
+                 node_ids=self.node_ids.astype(str), indptr=self.indptr,
+                 indices=self.indices, lengths=self.lengths, durations=self.durations)
+    
+    @property
+    def n_edges(self):
+        return len(self.indices)
+    
+    @property
+    def fingerprint(self):
+        """Ağ içeriğinin SHA-256 özeti (matris deposu anahtarı için)"""
+        if self._fingerprint is None:
+            digest = hashlib.sha256()
+            for array in (self.node_coordinates, self.indptr, self.indices,
+                          self.lengths, self.durations):
+                digest.update(np.ascontiguousarray(array).tobytes())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+    
+    def snap(self, coordinates):
+        """
+        Koordinatları en yakın ağ düğümüne oturt
+        
+        Args:
+            coordinates: [(lat, lng), ...] koordinatlar
+        
+        Returns:
+            tuple: (nodes, offsets)
+                - nodes: Düğüm indeksleri
+                - offsets: Koordinat ile düğüm arası kuş uçuşu mesafe (km)
+        """
+        if self._index is None:
+            self._index = GridIndex(self.node_coordinates)
+        nodes, offsets = self._index.query(coordinates, k=1)
+        return nodes[:, 0], offsets[:, 0]
+
+
+# İşçi süreçlerdeki ağ (başlatıcıda bir kez kurulur)
+_worker_graph = None
+
+
+def _init_worker(indptr, indices, primary, secondary):
+    global _worker_graph
+    _worker_graph = (indptr.tolist(), indices.tolist(), primary.tolist(), secondary.tolist())
+
+
+def _worker_search(task):
+    source, targets = task
+    return _shortest_paths(*_worker_graph, source, targets)
+
+
+def _shortest_paths(indptr, indices, primary, secondary, source, targets):
+    """
+    Tek kaynaktan hedef düğümlere Dijkstra
+    
+    Yollar primary ağırlığına göre en kısadır; aynı yol boyunca secondary
+    ağırlığı da toplanır (örn. en hızlı yolun uzunluğu). Tüm hedefler
+    kesinleşince arama durur.
+    
+    Returns:
+        tuple: (primary, secondary) hedef başına listeler (ulaşılamayan: inf)
+    """
+    remaining = set(targets)
+    best = {source: 0.0}
+    settled = {}
+    heap = [(0.0, 0.0, source)]
+    
+    while heap and remaining:
+        cost, other, node = heapq.heappop(heap)
+        if node in settled:
+            continue
+        settled[node] = (cost, other)
+        remaining.discard(node)
+        
+        for edge in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[edge]
+            if neighbor in settled:
+                continue
+            candidate = cost + primary[edge]
+            if candidate < best.get(neighbor, float('inf')):
+                best[neighbor] = candidate
+                heapq.heappush(heap, (candidate, other + secondary[edge], neighbor))
+    
+    unreachable = (float('inf'), float('inf'))
+    results = [settled.get(target, unreachable) for target in targets]
+    return [result[0] for result in results], [result[1] for result in results]
+
+
+class RoadNetworkFetcher:
+    """
+    Yol ağı üzerinde NxN mesafe / süre matrisi (API gerektirmez)
+    
+    - Her koordinat en yakın düğüme oturtulur (sonuç önbelleğe alınır)
+    - Tekil başlangıç düğümlerinden, tüm hedefler kesinleşene kadar
+      Dijkstra çalıştırılır; başlangıçlar süreç havuzunda paralel işlenir
+    - Düğüm çifti sonuçları LRU önbellekte tutulur; aynı noktalarla tekrar
+      (veya update_distance_matrix ile artımlı) sorgular aramayı atlar
+    - Koordinat ile düğüm arası kuş uçuşu mesafe yürüme/erişim ayağı olarak
+      eklenir; ulaşılamayan çiftler Haversine ile doldurulur
+    
+    DistanceMatrixFetcher ile aynı fetch() / stats arayüzüne sahiptir.
+    """
+    
+    def __init__(self, network, weight='duration', max_workers=None, cache_size=1_000_000,
+                 max_snap_km=1.0, time_factor=1.5, min_parallel_sources=32):
+        """
+        Args:
+            network: RoadNetwork
+            weight: En kısa yol ölçütü ('duration': en hızlı, 'length': en kısa)
+            max_workers: İşçi süreç sayısı (varsayılan: CPU sayısı)
+            cache_size: Önbellekte tutulacak en fazla düğüm çifti
+            max_snap_km: Bu mesafeden uzağa oturtulan koordinatlar için uyarı
+            time_factor: Erişim ayağı ve Haversine yedeğinde dakika / km oranı
+            min_parallel_sources: Bundan az başlangıç düğümü süreç açmadan işlenir
+        """
+        if weight not in WEIGHTS:
+            raise ValueError(f"Bilinmeyen ağırlık: {weight} (seçenekler: {WEIGHTS})")
+        
+        self.network = network
+        self.weight = weight
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cache_size = cache_size
+        self.max_snap_km = max_snap_km
+        self.time_factor = time_factor
+        self.min_parallel_sources = min_parallel_sources
+        
+        self._snapped = {}
+        self._pairs = OrderedDict()
+        self.stats = {}
+    
+    @property
+    def source(self):
+        """Matris deposu anahtarındaki kaynak adı"""
+        return f"road:{self.weight}:{self.network.fingerprint[:16]}"
+    
+    def snap(self, coordinates):
+        """Koordinatları düğümlere oturt (önbellekli) -> (nodes, offsets)"""
+        coordinates = [tuple(coord) for coord in coordinates]
+        missing = list(dict.fromkeys(coord for coord in coordinates if coord not in self._snapped))
+        if missing:
+            nodes, offsets = self.network.snap(missing)
+            for coord, node, offset in zip(missing, nodes.tolist(), offsets.tolist()):
+                self._snapped[coord] = (node, offset)
+        
+        snapped = [self._snapped[coord] for coord in coordinates]
+        return (np.array([node for node, _ in snapped], dtype=np.int64),
+                np.array([offset for _, offset in snapped]))
+    
+    def fetch(self, origins, destinations=None):
+        """
+        Mesafe ve süre matrislerini hesapla
+        
+        Args:
+            origins: [(lat, lng), ...] başlangıç koordinatları
+            destinations: [(lat, lng), ...] varış koordinatları (varsayılan: origins)
+        
+        Returns:
+            tuple: (distance_matrix (km), time_matrix (dakika)) numpy array'leri
+        """
+        origins = [tuple(coord) for coord in origins]
+        destinations = origins if destinations is None else [tuple(c) for c in destinations]
+        
+        origin_nodes, origin_offsets = self.snap(origins)
+        destination_nodes, destination_offsets = self.snap(destinations)
+        far = int((origin_offsets > self.max_snap_km).sum()
+                  + (destination_offsets > self.max_snap_km).sum())
+        if far:
+            print(f"Uyarı: {far} koordinat yol ağına {self.max_snap_km} km'den uzak")
+        
+        sources = np.unique(origin_nodes)
+        targets = np.unique(destination_nodes)
+        self.stats = {'sources': len(sources), 'targets': len(targets), 'searches': 0,
+                      'cached_pairs': 0, 'far_snaps': far, 'fallback_elements': 0}
+        
+        road_distance, road_time = self._solve(sources.tolist(), targets.tolist())
+        
+        # Düğüm çifti sonuçları koordinat matrisine yayılır
+        rows = np.searchsorted(sources, origin_nodes)
+        columns = np.searchsorted(targets, destination_nodes)
+        
+        access = origin_offsets[:, None] + destination_offsets[None, :]
+        distance_matrix = road_distance[np.ix_(rows, columns)] + access
+        time_matrix = road_time[np.ix_(rows, columns)] + access * self.time_factor
+        
+        # Ulaşılamayan çiftler için Haversine
+        fallback = ~np.isfinite(distance_matrix)
+        if fallback.any():
+            i, j = np.nonzero(fallback)
+            estimate = haversine_pairs(np.asarray(origins)[i], np.asarray(destinations)[j])
+            distance_matrix[i, j] = estimate
+            time_matrix[i, j] = estimate * self.time_factor
+            self.stats['fallback_elements'] = int(fallback.sum())
+        
+        # Aynı koordinat çiftleri arası mesafe sıfırdır
+        same = (np.asarray(origins)[:, None, :] == np.asarray(destinations)[None, :, :]).all(axis=2)
+        distance_matrix[same] = 0.0
+        time_matrix[same] = 0.0
+        
+        return distance_matrix, time_matrix
+    
+    def _solve(self, sources, targets):
+        """
+        Düğüm kümeleri arası (uzunluk km, süre dakika) matrisleri
+        
+        Önbellekte tüm hedefleri bulunan başlangıçlar için arama yapılmaz.
+        """
+        shape = (len(sources), len(targets))
+        lengths = np.empty(shape)
+        durations = np.empty(shape)
+        
+        pending = []
+        for i, source in enumerate(sources):
+            cached = [self._pairs.get((source, target)) for target in targets]
+            if any(value is None for value in cached):
+                pending.append(i)
+                continue
+            lengths[i] = [length for length, _ in cached]
+            durations[i] = [duration for _, duration in cached]
+            self.stats['cached_pairs'] += len(targets)
+            for target in targets:
+                self._pairs.move_to_end((source, target))
+        
+        results = self._search([sources[i] for i in pending], targets)
+        self.stats['searches'] = len(pending)
+        
+        for i, (primary, secondary) in zip(pending, results):
+            if self.weight == 'duration':
+                durations[i], lengths[i] = primary, secondary
+            else:
+                lengths[i], durations[i] = primary, secondary
+            for target, length, duration in zip(targets, lengths[i].tolist(),
+                                                durations[i].tolist()):
+                self._pairs[(sources[i], target)] = (length, duration)
+        
+        while len(self._pairs) > self.cache_size:
+            self._pairs.popitem(last=False)
+        
+        return lengths, durations
+    
+    def _search(self, sources, targets):
+        """Başlangıç düğümleri için Dijkstra (gerekirse süreç havuzunda)"""
+        network = self.network
+        if self.weight == 'duration':
+            primary, secondary = network.durations, network.lengths
+        else:
+            primary, secondary = network.lengths, network.durations
+        
+        if self.max_workers <= 1 or len(sources) < self.min_parallel_sources:
+            graph = (network.indptr.tolist(), network.indices.tolist(),
+                     primary.tolist(), secondary.tolist())
+            return [_shortest_paths(*graph, source, targets) for source in sources]
+        
+        tasks = [(source, targets) for source in sources]
+        chunksize = max(1, len(tasks) // (4 * self.max_workers))
+        with ProcessPoolExecutor(self.max_workers, mp_context=mp.get_context(),
+                                 initializer=_init_worker,
+                                 initargs=(network.indptr, network.indices,
+                                           primary, secondary)) as executor:
+            return list(executor.map(_worker_search, tasks, chunksize=chunksize))
+
@@ -0,0 +1,401 @@
+"""
+Mekansal İndeks ve Seyrek k-NN Mesafe Grafiği
+Büyük örneklerde yoğun NxN matris kurmadan en yakın komşu sorguları
+"""
+
+import copy
+from collections import OrderedDict
+
+import numpy as np
+
+from .haversine import EARTH_RADIUS_KM, _haversine_arrays
+
+
+class GridIndex:
+    """
+    Enlem/boylam koordinatları için düzenli ızgara indeksi
+    
+    Noktalar eşdikdörtgen (equirectangular) izdüşümde kare hücrelere
+    yerleştirilir ve hücre numarasına göre sıralanır. En yakın k komşu
+    sorgusu, sorgu hücresinin etrafındaki halkaları genişleterek aday
+    toplar; k. en yakın adayın mesafesi halkanın dışına ulaşamayacak
+    kadar küçük olduğunda durur. Mesafeler gerçek Haversine ile hesaplanır.
+    
+    İzdüşümde boylam ölçeği verideki en yüksek enlemin kosinüsü ile alınır;
+    böylece halka sınırı Haversine mesafesi için alt sınır olarak kalır.
+    """
+    
+    def __init__(self, coordinates, cell_size_km=None, points_per_cell=8):
+        """
+        Args:
+            coordinates: [(lat, lng), ...] koordinat listesi
+            cell_size_km: Hücre kenarı (km, varsayılan: hücre başına
+                          ortalama points_per_cell nokta düşecek şekilde)
+            points_per_cell: Varsayılan hücre boyutu için hedef yoğunluk
+        """
+        self.coordinates = np.asarray(coordinates, dtype=float).reshape(-1, 2)
+        self.n = len(self.coordinates)
+        radians = np.radians(self.coordinates)
+        self._lat, self._lon = radians[:, 0], radians[:, 1]
+        
+        max_latitude = np.abs(self._lat).max() if self.n else 0.0
+        self._lon_scale = EARTH_RADIUS_KM * max(np.cos(max_latitude), 1e-6)
+        
+        xy = self._project(self._lat, self._lon)
+        self._origin = xy.min(axis=0) if self.n else np.zeros(2)
+        extent = (xy.max(axis=0) - self._origin) if self.n else np.zeros(2)
+        
+        if cell_size_km is None:
+            # Noktalar bir çizgi üzerindeyse alan sıfıra yaklaşır; uzunluk da dikkate alınır
+            density = points_per_cell / max(self.n, 1)
+            cell_size_km = max(np.sqrt(extent[0] * extent[1] * density), extent.max() * density)
+        self.cell_size = max(float(cell_size_km), 1e-9)
+        self.shape = tuple((extent // self.cell_size).astype(int) + 1)
+        
+        # Noktalar hücre numarasına göre sıralanır; hücre içeriği bir dilimdir
+        cells = self._cells(xy)
+        cell_ids = cells[:, 0] * self.shape[1] + cells[:, 1]
+        self._order = np.argsort(cell_ids, kind='stable')
+        self._sorted_ids = cell_ids[self._order]
+    
+    def _project(self, lat, lon):
+        return np.column_stack([lon * self._lon_scale, lat * EARTH_RADIUS_KM])
+    
+    def _cells(self, xy):
+        """İzdüşüm koordinatlarının (ızgara dışında da olabilen) hücre indeksleri"""
+        return np.floor((xy - self._origin) / self.cell_size).astype(np.int64)
+    
+    def _members(self, cx_range, cy_range):
+        """Verilen hücre aralığındaki noktaların indeksleri"""
+        nx, ny = self.shape
+        x0, x1 = max(cx_range[0], 0), min(cx_range[1], nx - 1)
+        y0, y1 = max(cy_range[0], 0), min(cy_range[1], ny - 1)
+        if x0 > x1 or y0 > y1:
+            return np.empty(0, dtype=np.intp)
+        
+        # Her ızgara sütunu için ardışık hücreler tek bir dilimdir
+        starts = np.searchsorted(self._sorted_ids, np.arange(x0, x1 + 1) * ny + y0, 'left')
+        stops = np.searchsorted(self._sorted_ids, np.arange(x0, x1 + 1) * ny + y1, 'right')
+        return np.concatenate([self._order[start:stop] for start, stop in zip(starts, stops)])
+    
+    def query(self, coordinates, k=1, exclude=None):
+        """
+        Verilen noktaların en yakın k komşusu
+        
+        Args:
+            coordinates: [(lat, lng), ...] sorgu noktaları
+            k: Komşu sayısı
+            exclude: Sorgu başına dışlanacak indeks (opsiyonel, örn. noktanın kendisi)
+        
+        Returns:
+            tuple: (indices, distances)
+                - indices: (M, k) komşu indeksleri, yakından uzağa sıralı
+                - distances: (M, k) Haversine mesafeleri (km)
+        """
+        queries = np.radians(np.asarray(coordinates, dtype=float).reshape(-1, 2))
+        m = len(queries)
+        available = self.n - (1 if exclude is not None else 0)
+        k = min(k, max(available, 0))
+        
+        indices = np.empty((m, k), dtype=np.intp)
+        distances = np.empty((m, k))
+        if m == 0 or k == 0:
+            return indices, distances
+        
+        cells = self._cells(self._project(queries[:, 0], queries[:, 1]))
+        groups, group_of = np.unique(cells, axis=0, return_inverse=True)
+        group_of = group_of.reshape(-1)
+        nx, ny = self.shape
+        
+        for group, (cx, cy) in enumerate(groups):
+            members = np.flatnonzero(group_of == group)
+            lat = queries[members, 0][:, None]
+            lon = queries[members, 1][:, None]
+            
+            radius = 1
+            while True:
+                candidates = self._members((cx - radius, cx + radius), (cy - radius, cy + radius))
+                covers_grid = (cx - radius <= 0 and cy - radius <= 0
+                               and cx + radius >= nx - 1 and cy + radius >= ny - 1)
+                
+                if len(candidates) >= k + (exclude is not None) or covers_grid:
+                    block = _haversine_arrays(lat, lon, self._lat[candidates],
+                                              self._lon[candidates])
+                    if exclude is not None:
+                        block[candidates[None, :] == np.asarray(exclude)[members][:, None]] = np.inf
+                    
+                    nearest = np.argpartition(block, k - 1, axis=1)[:, :k]
+                    nearest_distances = np.take_along_axis(block, nearest, axis=1)
+                    
+                    # Halka dışındaki her nokta en az radius hücre uzaktadır
+                    if covers_grid or nearest_distances.max() <= radius * self.cell_size:
+                        break
+                radius *= 2
+            
+            order = np.argsort(nearest_distances, axis=1, kind='stable')
+            indices[members] = candidates[np.take_along_axis(nearest, order, axis=1)]
+            distances[members] = np.take_along_axis(nearest_distances, order, axis=1)
+        
+        return indices, distances
+    
+    def knn(self, k):
+        """
+        Tüm noktaların (kendileri hariç) en yakın k komşusu
+        
+        Returns:
+            tuple: (indices, distances) - (N, k) diziler
+        """
+        return self.query(self.coordinates, k, exclude=np.arange(self.n))
+
+
+class KNNGraph:
+    """
+    Seyrek k-NN mesafe grafiği (yoğun matrisin yerine geçer)
+    
+    Her nokta için en yakın k komşu ve mesafeleri tutulur (O(N k) bellek).
+    Diğer tüm mesafeler istendiğinde Haversine ile hesaplanır; tekil
+    (i, j) sorguları küçük bir LRU önbellekte saklanır. NumPy dizisinin
+    optimizer, rota detayları ve görselleştirme tarafından kullanılan
+    arayüzünü taklit eder:
+        g[i, j]          -> tek mesafe veya (dizi indekslerle) mesafe grubu
+        g[i], g[[i, k]]  -> satır(lar) (anında hesaplanır)
+        g.neighbors      -> (N, k) komşu listeleri (aday listesi olarak)
+        g.scaled(1.5)    -> aynı grafik üzerinde süre tahmini (dakika)
+    """
+    
+    ndim = 2
+    symmetric = True
+    
+    def __init__(self, coordinates, neighbors, neighbor_distances, cache_size=4096,
+                 transforms=()):
+        """
+        Args:
+            coordinates: [(lat, lng), ...] koordinat listesi
+            neighbors: (N, k) komşu indeksleri (yakından uzağa)
+            neighbor_distances: (N, k) komşu mesafeleri (km)
+            cache_size: Tekil mesafe sorguları için LRU önbellek kapasitesi
+            transforms: Değerlere sırayla uygulanan fonksiyonlar (map() ile eklenir)
+        """
+        self.coordinates = np.asarray(coordinates, dtype=float).reshape(-1, 2)
+        self.n = len(self.coordinates)
+        radians = np.radians(self.coordinates)
+        self._lat, self._lon = radians[:, 0], radians[:, 1]
+        
+        self.neighbors = np.asarray(neighbors, dtype=np.int32)
+        self.neighbor_distances = np.asarray(neighbor_distances)
+        self.cache_size = cache_size
+        self.transforms = tuple(transforms)
+        self._cache = OrderedDict()
+        self.cache_stats = {'hits': 0, 'misses': 0}  # map() görünümleriyle paylaşılır
+    
+    @classmethod
+    def from_coordinates(cls, coordinates, k=16, cell_size_km=None, cache_size=4096):
+        """
+        Koordinatlardan ızgara indeksi ile k-NN grafiği kur
+        
+        Args:
+            coordinates: [(lat, lng), ...] koordinat listesi
+            k: Nokta başına komşu sayısı
+            cell_size_km: Izgara hücre boyutu (opsiyonel)
+            cache_size: LRU önbellek kapasitesi
+        
+        Returns:
+            KNNGraph
+        """
+        index = GridIndex(coordinates, cell_size_km=cell_size_km)
+        neighbors, distances = index.knn(k)
+        return cls(coordinates, neighbors, distances, cache_size=cache_size)
+    
+    @property
+    def k(self):
+        return self.neighbors.shape[1]
+    
+    @property
+    def shape(self):
+        return (self.n, self.n)
+    
+    @property
+    def nbytes(self):
+        return self.coordinates.nbytes + self.neighbors.nbytes + self.neighbor_distances.nbytes
+    
+    def __len__(self):
+        return self.n
+    
+    def map(self, func):
+        """Değerlere func uygulanmış görünüm (komşu listeleri ve önbellek paylaşılır)"""
+        view = copy.copy(self)
+        view.transforms = self.transforms + (func,)
+        return view
+    
+    def scaled(self, factor):
+        """Mesafelerin factor katı (örn. km -> tahmini dakika)"""
+        return self.map(_Scale(factor))
+    
+    def _apply(self, values):
+        for func in self.transforms:
+            values = func(values)
+        return values
+    
+    def _distance(self, i, j):
+        """Tekil mesafe (önbellekli)"""
+        key = (i, j) if i <= j else (j, i)
+        value = self._cache.get(key)
+        if value is None:
+            self.cache_stats['misses'] += 1
+            value = float(_haversine_arrays(self._lat[i], self._lon[i],
+                                            self._lat[j], self._lon[j]))
+            self._cache[key] = value
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self.cache_stats['hits'] += 1
+            self._cache.move_to_end(key)
+        return value
+    
+    def __getitem__(self, key):
+        if isinstance(key, tuple) and len(key) == 2:
+            i, j = key
+            if isinstance(i, (int, np.integer)) and isinstance(j, (int, np.integer)):
+                return self._apply(np.float64(self._distance(int(i), int(j))))
+            i, j = np.asarray(i), np.asarray(j)
+            return self._apply(_haversine_arrays(self._lat[i], self._lon[i],
+                                                 self._lat[j], self._lon[j]))
+        
+        rows = np.asarray(key)
+        return self._apply(_haversine_arrays(self._lat[rows][..., None], self._lon[rows][..., None],
+                                             self._lat, self._lon))
+    
+    def __array__(self, dtype=None, copy=None):
+        """Yoğun NxN matris (yalnızca küçük örnekler için)"""
+        dense = self[np.arange(self.n)]
+        return dense.astype(dtype, copy=False) if dtype is not None else dense
+
+
+class _Scale:
+    """Seçilebilir (pickle) çarpan fonksiyonu"""
+    
+    def __init__(self, factor):
+        self.factor = factor
+    
+    def __call__(self, values):
+        return values * self.factor
+
+
+def is_graph(matrix):
+    """Matris seyrek k-NN grafiği mi?"""
+    return isinstance(matrix, KNNGraph)
+
+
+class CandidatePheromone:
+    """
+    Yalnızca aday (k-NN) kenarlarında tutulan feromon
+    
+    (N, k) dizi, candidates[i, s] kenarının feromonunu tutar. Aday olmayan
+    kenarlar tek bir ortak değeri (outside) okur; bu değer buharlaşma,
+    fill ve clip ile birlikte güncellenir, ancak bu kenarlara feromon
+    bırakılmaz. Karıncalar aday olmayan kenarları yalnızca tüm adaylar
+    ziyaret edildiğinde kullandığı için etkisi küçüktür; bellek O(N k) kalır.
+    """
+    
+    ndim = 2
+    
+    def __init__(self, candidates, value, dtype=np.float64, data=None):
+        """
+        Args:
+            candidates: (N, k) aday listeleri
+            value: Başlangıç feromonu
+            dtype: Veri tipi
+            data: Hazır (N, k) feromon dizisi (opsiyonel)
+        """
+        self.candidates = candidates
+        self.n = len(candidates)
+        self.data = np.full(candidates.shape, value, dtype=dtype) if data is None else data
+        self.outside = float(value)
+    
+    @property
+    def shape(self):
+        return (self.n, self.n)
+    
+    @property
+    def dtype(self):
+        return self.data.dtype
+    
+    @property
+    def nbytes(self):
+        return self.data.nbytes
+    
+    def __len__(self):
+        return self.n
+    
+    def _slots(self, rows, cols):
+        """(rows, cols) kenarlarının aday sırası ve aday olup olmadıkları"""
+        rows, cols = np.broadcast_arrays(np.asarray(rows), np.asarray(cols))
+        matches = self.candidates[rows] == cols[..., None]
+        return rows, matches.any(axis=-1), np.argmax(matches, axis=-1)
+    
+    def __getitem__(self, key):
+        if isinstance(key, tuple) and len(key) == 2:
+            rows, found, slots = self._slots(*key)
+            return np.where(found, self.data[rows, slots], self.outside)
+        
+        rows = np.asarray(key)
+        dense = np.full(rows.shape + (self.n,), self.outside, dtype=self.dtype)
+        np.put_along_axis(dense, self.candidates[rows], self.data[rows], axis=-1)
+        return dense
+    
+    def __setitem__(self, key, value):
+        if not (isinstance(key, tuple) and len(key) == 2):
+            raise IndexError("CandidatePheromone yalnızca (i, j) atamalarını destekler")
+        rows, found, slots = self._slots(*key)
+        value = np.broadcast_to(value, rows.shape)
+        self.data[rows[found], slots[found]] = value[found]
+    
+    def add_at(self, rows, cols, values):
+        """np.add.at karşılığı; aday olmayan kenarlara bırakılan feromon yok sayılır"""
+        rows, found, slots = self._slots(rows, cols)
+        values = np.broadcast_to(values, rows.shape)
+        np.add.at(self.data, (rows[found], slots[found]), values[found])
+    
+    def fill(self, value):
+        self.data.fill(value)
+        self.outside = float(value)
+    
+    def clip(self, min=None, max=None, out=None):
+        target = self if out is self else self.copy()
+        np.clip(target.data, min, max, out=target.data)
+        target.outside = float(np.clip(target.outside, min, max))
+        return target
+    
+    def copy(self):
+        return CandidatePheromone(self.candidates, self.outside, data=self.data.copy())
+    
+    def __array__(self, dtype=None, copy=None):
+        """Yoğun NxN matris (yalnızca küçük örnekler için)"""
+        dense = self[np.arange(self.n)]
+        return dense.astype(dtype, copy=False) if dtype is not None else dense
+    
+    def _combine(self, other, operation):
+        if isinstance(other, CandidatePheromone):
+            return operation(self.data, other.data), operation(self.outside, other.outside)
+        return operation(self.data, other), operation(self.outside, other)
+    
+    def __imul__(self, other):
+        self.data[...], self.outside = self._combine(other, np.multiply)
+        return self
+    
+    def __iadd__(self, other):
+        self.data[...], self.outside = self._combine(other, np.add)
+        return self
+    
+    def __mul__(self, other):
+        data, outside = self._combine(other, np.multiply)
+        return CandidatePheromone(self.candidates, float(outside), data=data)
+    
+    __rmul__ = __mul__
+    
+    def __add__(self, other):
+        data, outside = self._combine(other, np.add)
+        return CandidatePheromone(self.candidates, float(outside), data=data)
+    
+    __radd__ = __add__
+
@@ -0,0 +1,332 @@
+"""
+Çok Ekipli / Çok Günlü Rota Bölme (VRP)
+Vardiya süresi sınırlı depo turları, O(1) delta değerlendirmeli rotalar arası hamleler
+"""
+
+import math
+import os
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .ant_algorithm import AntColonyOptimizer, nearest_neighbors
+
+
+# Bu değerden küçük iyileşmeler yok sayılır (kayan nokta gürültüsü)
+EPSILON = 1e-9
+
+# Alt turlar için varsayılan (hafif) ACO parametreleri
+DEFAULT_ROUTE_PARAMS = {'n_ants': 20, 'n_iterations': 50, 'alpha': 1.0, 'beta': 3.0,
+                        'evaporation_rate': 0.3, 'patience': 15}
+
+
+def _submatrix(matrix, nodes):
+    """Düğüm kümesi için yoğun alt matris (yoğun, paketlenmiş veya seyrek grafik)"""
+    nodes = np.asarray(nodes)
+    return np.asarray(matrix[nodes[:, None], nodes[None, :]], dtype=float)
+
+
+def split_tour(tour, time_matrix, max_duration, service_time=0.0, depot=0):
+    """
+    Dev turu vardiya süresine uyan depo turlarına en iyi şekilde böl
+    
+    Tur sırası korunarak toplam süreyi en aza indiren kesim noktaları
+    Bellman (Prins "split") yöntemiyle bulunur.
+    
+    Args:
+        tour: Depo dışındaki noktaların ziyaret sırası
+        time_matrix: NxN süre matrisi (dakika)
+        max_duration: Tur başına en fazla süre (dakika)
+        service_time: Durak başına numune alma süresi (dakika)
+        depot: Depo (başlangıç) indeksi
+    
+    Returns:
+        list: [[durak, ...], ...] depo turları (depo hariç)
+    """
+    tour = [int(city) for city in tour if city != depot]
+    n = len(tour)
+    costs = [0.0] + [math.inf] * n
+    previous = [0] * (n + 1)
+    
+    for i in range(n):
+        cost = 0.0
+        for j in range(i, n):
+            city = tour[j]
+            if j == i:
+                cost = time_matrix[depot, city] + service_time + time_matrix[city, depot]
+            else:
+                last = tour[j - 1]
+                cost += (time_matrix[last, city] + service_time + time_matrix[city, depot]
+                         - time_matrix[last, depot])
+            if cost > max_duration:
+                break
+            if costs[i] + cost < costs[j + 1]:
+                costs[j + 1] = costs[i] + cost
+                previous[j + 1] = i
+    
+    if math.isinf(costs[n]):
+        raise ValueError("Tek başına vardiya süresini aşan nokta var; max_duration artırılmalı")
+    
+    routes = []
+    j = n
+    while j > 0:
+        i = previous[j]
+        routes.append(tour[i:j])
+        j = i
+    return routes[::-1]
+
+
+def _solve_route(task):
+    """Tek depo turunu ACO ile TSP olarak çöz (işçi süreçte de çalışır)"""
+    submatrix, params = task
+    optimizer = AntColonyOptimizer(submatrix, **params)
+    route, duration = optimizer.optimize(start_city=0)
+    return route[1:-1], float(duration)
+
+
+class FleetPlanner:
+    """
+    Birden fazla ekip ve gün için süre sınırlı rota planlama
+    
+    1. Tüm noktalar için tek bir dev tur (ACO, süre matrisi üzerinde)
+    2. Dev tur, vardiya süresini aşmayacak depo turlarına bölünür
+    3. Rotalar arası relocate / exchange hamleleri; her hamlenin süre farkı
+       yalnızca değişen kenarlardan O(1) hesaplanır, rota süreleri tutulur
+    4. Her tur kendi içinde ACO ile yeniden sıralanır (süreç havuzunda paralel)
+    
+    3. ve 4. adımlar iyileşme kalmayana kadar (en fazla max_rounds) tekrarlanır.
+    Turlar günlere ekip sayısı kadar dağıtılır.
+    """
+    
+    def __init__(self, time_matrix, distance_matrix=None, n_teams=1, shift_duration=480.0,
+                 service_time=15.0, depot=0, n_neighbors=10, route_params=None,
+                 tour_params=None, max_rounds=3, n_workers=None, seed=None):
+        """
+        Args:
+            time_matrix: NxN süre matrisi (dakika; yoğun, paketlenmiş veya KNNGraph)
+            distance_matrix: NxN mesafe matrisi (opsiyonel, yalnızca raporlama)
+            n_teams: Günlük ekip sayısı
+            shift_duration: Ekip başına vardiya süresi (dakika, varsayılan 8 saat)
+            service_time: Durak başına numune alma süresi (dakika)
+            depot: Depo (başlangıç) indeksi
+            n_neighbors: Hamlelerde denenecek en yakın komşu sayısı
+            route_params: Alt tur ACO parametreleri (opsiyonel)
+            tour_params: Dev tur ACO parametreleri (opsiyonel)
+            max_rounds: Hamle + alt tur çözme turu sayısı
+            n_workers: Alt turlar için işçi süreç sayısı (1: sıralı)
+            seed: Rastgele sayı üreteci tohumu (opsiyonel)
+        """
+        self.time_matrix = time_matrix
+        self.distance_matrix = distance_matrix
+        self.n = len(time_matrix)
+        self.n_teams = n_teams
+        self.shift_duration = shift_duration
+        self.service_time = service_time
+        self.depot = depot
+        self.max_rounds = max_rounds
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.seed = seed
+        
+        self.route_params = {**DEFAULT_ROUTE_PARAMS, 'seed': seed, **(route_params or {})}
+        self.tour_params = {**DEFAULT_ROUTE_PARAMS, 'seed': seed, **(tour_params or {})}
+        
+        self.neighbors = [list(row) for row in
+                          np.asarray(nearest_neighbors(time_matrix, n_neighbors)).tolist()]
+        
+        # İstatistikler
+        self.n_relocates = 0
+        self.n_exchanges = 0
+    
+    def _t(self, a, b):
+        return float(self.time_matrix[a, b])
+    
+    def route_duration(self, stops):
+        """Depo turunun süresi (yol + numune alma, dakika)"""
+        path = [self.depot] + list(stops) + [self.depot]
+        return (sum(self._t(a, b) for a, b in zip(path, path[1:]))
+                + self.service_time * len(stops))
+    
+    def giant_tour(self):
+        """Depo dahil tüm noktaları dolaşan ACO turu (depo hariç sıra)"""
+        route, _ = AntColonyOptimizer(self.time_matrix, **self.tour_params).optimize(
+            start_city=self.depot
+        )
+        return [city for city in route if city != self.depot]
+    
+    def plan(self, tour=None):
+        """
+        Rota planı oluştur
+        
+        Args:
+            tour: Hazır dev tur (opsiyonel, örn. optimize() çıktısı)
+        
+        Returns:
+            dict: {
+                'routes': [{'day', 'team', 'route' ([depo, ..., depo]),
+                            'duration', 'distance'}, ...],
+                'n_days': gün sayısı,
+                'total_duration': toplam süre (dakika),
+                'total_distance': toplam mesafe (km, distance_matrix verildiyse)
+            }
+        """
+        if tour is None:
+            tour = self.giant_tour()
+        routes = split_tour(tour, self.time_matrix, self.shift_duration,
+                            self.service_time, self.depot)
+        
+        for _ in range(self.max_rounds):
+            durations = [self.route_duration(route) for route in routes]
+            moved = self.improve(routes, durations)
+            routes = [route for route in routes if route]
+            resequenced = self.resequence(routes)
+            if not moved and not resequenced:
+                break
+        
+        return self._report(routes)
+    
+    def improve(self, routes, durations):
+        """
+        Rotalar arası relocate / exchange ile yerinde iyileştir
+        
+        Hamle süre farkları yalnızca değişen kenarlardan hesaplanır; rota
+        süreleri (durations) her kabul edilen hamlede güncellenir, böylece
+        vardiya sınırı kontrolü de O(1) kalır.
+        
+        Args:
+            routes: [[durak, ...], ...] depo turları (yerinde değişir)
+            durations: Rota süreleri (yerinde değişir)
+        
+        Returns:
+            int: Uygulanan hamle sayısı
+        """
+        location = {}
+        for r, route in enumerate(routes):
+            for position, city in enumerate(route):
+                location[city] = (r, position)
+        
+        def neighbors_of(r, position):
+            route = routes[r]
+            before = route[position - 1] if position > 0 else self.depot
+            after = route[position + 1] if position + 1 < len(route) else self.depot
+            return before, after
+        
+        def reindex(r):
+            for position, city in enumerate(routes[r]):
+                location[city] = (r, position)
+        
+        moves = 0
+        improved = True
+        while improved:
+            improved = False
+            for x in list(location):
+                r1, i = location[x]
+                p, n = neighbors_of(r1, i)
+                removal = self._t(p, n) - self._t(p, x) - self._t(x, n) - self.service_time
+                
+                for y in self.neighbors[x]:
+                    if y == self.depot or y not in location:
+                        continue
+                    r2, j = location[y]
+                    if r2 == r1:
+                        continue
+                    
+                    # Relocate: x, y'nin önüne veya arkasına taşınır
+                    best = None
+                    before, after = neighbors_of(r2, j)
+                    for a, b, position in ((before, y, j), (y, after, j + 1)):
+                        insertion = (self._t(a, x) + self._t(x, b) - self._t(a, b)
+                                     + self.service_time)
+                        if (removal + insertion < -EPSILON
+                                and durations[r2] + insertion <= self.shift_duration
+                                and (best is None or insertion < best[0])):
+                            best = (insertion, position)
+                    
+                    if best is not None:
+                        insertion, position = best
+                        routes[r1].pop(i)
+                        routes[r2].insert(position, x)
+                        durations[r1] += removal
+                        durations[r2] += insertion
+                        reindex(r1)
+                        reindex(r2)
+                        self.n_relocates += 1
+                        moves += 1
+                        improved = True
+                        break
+                    
+                    # Exchange: x ve y yer değiştirir
+                    q, m = before, after
+                    delta1 = self._t(p, y) + self._t(y, n) - self._t(p, x) - self._t(x, n)
+                    delta2 = self._t(q, x) + self._t(x, m) - self._t(q, y) - self._t(y, m)
+                    if (delta1 + delta2 < -EPSILON
+                            and durations[r1] + delta1 <= self.shift_duration
+                            and durations[r2] + delta2 <= self.shift_duration):
+                        routes[r1][i], routes[r2][j] = y, x
+                        location[x], location[y] = (r2, j), (r1, i)
+                        durations[r1] += delta1
+                        durations[r2] += delta2
+                        self.n_exchanges += 1
+                        moves += 1
+                        improved = True
+                        break
+        
+        return moves
+    
+    def resequence(self, routes):
+        """
+        Her turu kendi içinde ACO ile yeniden sırala (paralel)
+        
+        Daha kısa bulunan sıralar yerinde benimsenir.
+        
+        Args:
+            routes: [[durak, ...], ...] depo turları (yerinde değişir)
+        
+        Returns:
+            int: Değişen tur sayısı
+        """
+        indices = [r for r, route in enumerate(routes) if len(route) > 2]
+        tasks = []
+        for r in indices:
+            nodes = [self.depot] + routes[r]
+            tasks.append((_submatrix(self.time_matrix, nodes), self.route_params))
+        
+        if self.n_workers <= 1 or len(tasks) <= 1:
+            results = [_solve_route(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(min(self.n_workers, len(tasks)),
+                                     mp_context=mp.get_context()) as executor:
+                results = list(executor.map(_solve_route, tasks))
+        
+        changed = 0
+        for r, (order, _) in zip(indices, results):
+            candidate = [routes[r][position - 1] for position in order]
+            if self.route_duration(candidate) < self.route_duration(routes[r]) - EPSILON:
+                routes[r] = candidate
+                changed += 1
+        return changed
+    
+    def _report(self, routes):
+        """Turları günlere ve ekiplere dağıt, süre / mesafe özetini çıkar"""
+        plan = []
+        for index, stops in enumerate(sorted(routes, key=self.route_duration, reverse=True)):
+            route = [self.depot] + list(stops) + [self.depot]
+            distance = None
+            if self.distance_matrix is not None:
+                distance = float(sum(self.distance_matrix[a, b] for a, b in zip(route, route[1:])))
+            plan.append({
+                'day': index // self.n_teams + 1,
+                'team': index % self.n_teams + 1,
+                'route': route,
+                'duration': self.route_duration(stops),
+                'distance': distance
+            })
+        
+        return {
+            'routes': plan,
+            'n_days': (len(plan) + self.n_teams - 1) // self.n_teams,
+            'total_duration': sum(item['duration'] for item in plan),
+            'total_distance': (sum(item['distance'] for item in plan)
+                               if self.distance_matrix is not None else None)
+        }
+
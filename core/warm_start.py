@@ -0,0 +1,170 @@
+"""
+Nokta Eklendiğinde / Çıkarıldığında Isıtılmış (Warm-Start) Yeniden Optimizasyon
+Önceki feromon ve en iyi rota yeni lokasyon kümesine taşınır
+"""
+
+import numpy as np
+
+from .ant_algorithm import AntColonyOptimizer
+from .compact import is_packed
+from .spatial import CandidatePheromone
+
+
+def build_index_map(old_locations, new_locations):
+    """
+    Lokasyon isimlerinden indeks eşlemesi oluştur
+    
+    Args:
+        old_locations: Önceki lokasyon listesi
+        new_locations: Yeni lokasyon listesi
+    
+    Returns:
+        numpy.ndarray: index_map[yeni_indeks] = eski indeks (yeni noktalar için -1)
+    """
+    old_positions = {location: i for i, location in enumerate(old_locations)}
+    return np.array([old_positions.get(location, -1) for location in new_locations],
+                    dtype=np.intp)
+
+
+def remap_pheromone(pheromone, index_map, fill_value=None, candidates=None):
+    """
+    Feromon matrisini yeni lokasyon kümesine taşı
+    
+    Her iki ucu da önceki kümede bulunan kenarlar eski feromonu korur;
+    yeni noktalara ait kenarlar fill_value ile doldurulur. Eski feromon
+    yoğun, paketlenmiş (TriangularMatrix) veya aday (CandidatePheromone)
+    olabilir; yalnızca taşınan kenarlar okunur.
+    
+    Args:
+        pheromone: Önceki feromon matrisi
+        index_map: index_map[yeni_indeks] = eski indeks (yeni noktalar için -1)
+        fill_value: Yeni kenarların feromonu (varsayılan: taşınan kenarların
+                    ortalaması)
+        candidates: Yeni kümenin (M, k) aday listeleri (opsiyonel). Verilirse
+                    yalnızca aday kenarlar taşınır ve CandidatePheromone döner
+    
+    Returns:
+        numpy.ndarray veya CandidatePheromone: MxM (veya M x k) feromon
+    """
+    if not isinstance(pheromone, (np.ndarray, CandidatePheromone)) and not is_packed(pheromone):
+        pheromone = np.asarray(pheromone)
+    index_map = np.asarray(index_map, dtype=np.intp)
+    
+    if candidates is not None:
+        # Aday kenarlar (i, candidates[i, s]); iki ucu da eski kümedeyse taşınır
+        rows = np.broadcast_to(np.arange(len(index_map))[:, None], candidates.shape)
+        old_rows, old_cols = index_map[rows], index_map[candidates]
+        kept = (old_rows >= 0) & (old_cols >= 0)
+        carried = np.asarray(pheromone[old_rows[kept], old_cols[kept]], dtype=float)
+    else:
+        kept_cities = np.flatnonzero(index_map >= 0)
+        old = index_map[kept_cities]
+        carried = np.asarray(pheromone[old[:, None], old[None, :]], dtype=float)
+    
+    if fill_value is None:
+        fill_value = carried.mean() if carried.size else 1.0 / max(len(index_map), 1)
+    
+    if candidates is not None:
+        remapped = CandidatePheromone(candidates, fill_value, dtype=float)
+        remapped.data[kept] = carried
+        return remapped
+    
+    remapped = np.full((len(index_map), len(index_map)), fill_value, dtype=float)
+    remapped[np.ix_(kept_cities, kept_cities)] = carried
+    return remapped
+
+
+def insert_cities(route, cities, distance_matrix):
+    """
+    Şehirleri en ucuz ekleme (cheapest insertion) ile tura yerleştir
+    
+    Her şehir, turdaki tüm kenarlar arasından d(a, c) + d(c, b) - d(a, b)
+    artışı en küçük olan kenarın arasına eklenir.
+    
+    Args:
+        route: Açık tur (başlangıca dönüş hariç) şehir listesi
+        cities: Eklenecek şehirler
+        distance_matrix: Mesafe matrisi
+    
+    Returns:
+        list: Yeni tur
+    """
+    route = list(route)
+    for city in cities:
+        if not route:
+            route.append(int(city))
+            continue
+        
+        tour = np.asarray(route)
+        following = np.roll(tour, -1)
+        increase = (distance_matrix[tour, city] + distance_matrix[city, following]
+                    - distance_matrix[tour, following])
+        position = int(np.argmin(increase)) + 1
+        route.insert(position, int(city))
+    
+    return route
+
+
+def warm_start(previous, distance_matrix, index_map, start_city=0, **params):
+    """
+    Önceki çözümden ısıtılmış yeni bir optimizer oluştur
+    
+    1. Feromon yeni kümeye taşınır (silinen noktaların kenarları atılır)
+    2. Önceki en iyi rota yeni indekslere çevrilir, silinen noktalar çıkarılır
+       ve yeni noktalar en ucuz ekleme ile yerleştirilir
+    3. Bu rota başlangıç en iyi çözümü olarak atanır ve üzerine feromon bırakılır
+    
+    Sonrasında optimize() birkaç iterasyonla çağrılarak çözüm iyileştirilir.
+    
+    Args:
+        previous: Önceki AntColonyOptimizer veya get_state() sözlüğü
+                  (best_route açık veya başlangıca dönen kapalı rota olabilir)
+        distance_matrix: Yeni MxM mesafe matrisi veya KNNGraph (feromon yeni
+                         grafiğin aday kenarlarına taşınır)
+        index_map: index_map[yeni_indeks] = eski indeks (yeni noktalar için -1)
+        start_city: Yeni kümedeki başlangıç şehri indeksi
+        **params: AntColonyOptimizer parametreleri (örn. n_iterations=10)
+    
+    Returns:
+        AntColonyOptimizer: Isıtılmış optimizer
+    """
+    state = previous.get_state() if isinstance(previous, AntColonyOptimizer) else previous
+    index_map = np.asarray(index_map, dtype=np.intp)
+    if len(index_map) != len(distance_matrix):
+        raise ValueError("index_map uzunluğu yeni mesafe matrisinin boyutuna eşit olmalıdır")
+    
+    optimizer = AntColonyOptimizer(distance_matrix, **params)
+    if optimizer.graph:
+        # Seyrek modda yalnızca yeni grafiğin aday kenarları taşınır
+        pheromone = remap_pheromone(state['pheromone'], index_map,
+                                    candidates=optimizer.pheromone.candidates)
+        optimizer.pheromone.data[...] = pheromone.data
+        optimizer.pheromone.outside = pheromone.outside
+    else:
+        optimizer.pheromone[...] = remap_pheromone(state['pheromone'], index_map)
+    
+    # Önceki rotayı yeni indekslere çevir (kapalı rotadaki dönüş şehri atılır)
+    previous_route = list(state['best_route'] or [])
+    if len(previous_route) > 1 and previous_route[0] == previous_route[-1]:
+        previous_route = previous_route[:-1]
+    old_to_new = {int(old): new for new, old in enumerate(index_map) if old >= 0}
+    route = [old_to_new[city] for city in previous_route if city in old_to_new]
+    
+    # Başlangıç şehri başa, yeni noktalar en ucuz konumlarına
+    missing = sorted(set(range(len(index_map))) - set(route))
+    route = insert_cities(route, missing, optimizer.distance_matrix)
+    index = route.index(start_city)
+    route = route[index:] + route[:index]
+    
+    optimizer.best_route = route
+    optimizer.best_distance = float(optimizer.calculate_route_distances([route])[0])
+    if optimizer.best_distance > 0:
+        optimizer._deposit(route, optimizer.Q / optimizer.best_distance)
+    
+    if optimizer.strategy == 'mmas':
+        optimizer._update_trail_limits(optimizer.best_distance)
+        np.clip(optimizer.pheromone, optimizer.tau_min, optimizer.tau_max,
+                out=optimizer.pheromone)
+    
+    return optimizer
+
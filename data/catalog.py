@@ -0,0 +1,291 @@
+"""
+Numune Noktası Kataloğu
+CSV / GeoJSON dosyalarından akışlı okuma ve sütunlu (columnar) lokasyon deposu
+"""
+
+import csv
+import json
+import math
+import os
+from array import array
+
+import numpy as np
+
+
+# Desteklenen sütun / özellik adları (küçük harfle karşılaştırılır)
+NAME_FIELDS = ('name', 'ad', 'isim', 'address', 'adres')
+LAT_FIELDS = ('lat', 'latitude', 'enlem')
+LNG_FIELDS = ('lng', 'lon', 'long', 'longitude', 'boylam')
+
+GEOJSON_EXTENSIONS = ('.geojson', '.json')
+GEOJSON_SEQ_EXTENSIONS = ('.geojsonl', '.geojsons', '.jsonl', '.ndjson')
+
+
+def _normalize_name(name):
+    """Tekrar kontrolü için ad anahtarı (büyük/küçük harf ve boşluk duyarsız)"""
+    return ' '.join(name.split()).casefold()
+
+
+def _pick(fields, candidates):
+    """Alan adları arasından ilk eşleşen aday (yoksa None)"""
+    lowered = {field.strip().lower(): field for field in fields if field}
+    for candidate in candidates:
+        if candidate in lowered:
+            return lowered[candidate]
+    return None
+
+
+def _parse_coordinate(value):
+    """Boş değer -> None, sayısal değer -> float (virgüllü ondalık kabul edilir)"""
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    if isinstance(value, str):
+        value = value.strip().replace(',', '.')
+    return float(value)
+
+
+def _csv_rows(path, name_field, lat_field, lng_field):
+    """CSV satırlarını (satır no, ad, lat, lng) olarak akıt"""
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.DictReader(f)
+        fields = reader.fieldnames or []
+        name_field = name_field or _pick(fields, NAME_FIELDS)
+        lat_field = lat_field or _pick(fields, LAT_FIELDS)
+        lng_field = lng_field or _pick(fields, LNG_FIELDS)
+        if name_field is None:
+            raise ValueError(f"Ad sütunu bulunamadı ({path}): {fields}")
+        
+        for row in reader:
+            yield (reader.line_num, row.get(name_field),
+                   row.get(lat_field) if lat_field else None,
+                   row.get(lng_field) if lng_field else None)
+
+
+def _feature_row(number, feature, name_field):
+    """GeoJSON Feature -> (satır no, ad, lat, lng); Point dışı geometrilerde koordinat yok"""
+    properties = feature.get('properties') or {}
+    field = name_field or _pick(properties.keys(), NAME_FIELDS)
+    name = properties.get(field) if field else None
+    
+    geometry = feature.get('geometry') or {}
+    if geometry.get('type') == 'Point':
+        lng, lat = geometry['coordinates'][:2]  # GeoJSON sırası: boylam, enlem
+    else:
+        lat = properties.get(_pick(properties.keys(), LAT_FIELDS))
+        lng = properties.get(_pick(properties.keys(), LNG_FIELDS))
+    return number, name, lat, lng
+
+
+def _geojson_rows(path, name_field):
+    """
+    GeoJSON özelliklerini akıt
+    
+    Satır başına bir Feature içeren (GeoJSON Text Sequence / NDJSON)
+    dosyalar satır satır okunur; FeatureCollection dosyaları tek seferde
+    ayrıştırılır.
+    """
+    if path.lower().endswith(GEOJSON_SEQ_EXTENSIONS):
+        with open(path, encoding='utf-8') as f:
+            for number, line in enumerate(f, 1):
+                line = line.strip().lstrip('\x1e')  # RFC 8142 kayıt ayırıcı
+                if line:
+                    yield _feature_row(number, json.loads(line), name_field)
+        return
+    
+    with open(path, encoding='utf-8') as f:
+        collection = json.load(f)
+    features = collection.get('features', []) if isinstance(collection, dict) else collection
+    for number, feature in enumerate(features, 1):
+        yield _feature_row(number, feature, name_field)
+
+
+def iter_locations(path, name_field=None, lat_field=None, lng_field=None,
+                   deduplicate=True, on_invalid=None):
+    """
+    Katalog dosyasındaki lokasyonları doğrulayarak akıt (üreteç)
+    
+    Satırlar tek tek okunur ve doğrulanır: adı boş olanlar, sayısal
+    olmayan veya aralık dışı koordinatlar ve yalnızca enlem / boylamdan
+    biri verilen satırlar atlanır. Tekrarlar (aynı normalize ad ve aynı
+    koordinat) ilk görüldükleri yerde tutulur.
+    
+    Args:
+        path: .csv, .geojson / .json veya satır başına Feature içeren
+              .geojsonl / .geojsons / .ndjson dosyası
+        name_field: Ad sütunu (varsayılan: name, ad, isim, address, adres)
+        lat_field: Enlem sütunu (varsayılan: lat, latitude, enlem)
+        lng_field: Boylam sütunu (varsayılan: lng, lon, longitude, boylam)
+        deduplicate: Tekrarlanan satırları atla
+        on_invalid: Geçersiz satırlarda çağrılır (opsiyonel):
+                    on_invalid(satır no, neden)
+    
+    Yields:
+        tuple: (name, lat, lng) - koordinatı olmayan satırlarda lat, lng None
+    """
+    if path.lower().endswith(GEOJSON_EXTENSIONS + GEOJSON_SEQ_EXTENSIONS):
+        rows = _geojson_rows(path, name_field)
+    else:
+        rows = _csv_rows(path, name_field, lat_field, lng_field)
+    
+    seen = set()
+    for number, name, lat, lng in rows:
+        name = ' '.join(str(name).split()) if name is not None else ''
+        try:
+            lat, lng = _parse_coordinate(lat), _parse_coordinate(lng)
+        except (TypeError, ValueError):
+            reason = "sayısal olmayan koordinat"
+        else:
+            if not name:
+                reason = "ad boş"
+            elif (lat is None) != (lng is None):
+                reason = "eksik koordinat"
+            elif lat is not None and not (-90 <= lat <= 90 and -180 <= lng <= 180):
+                reason = "aralık dışı koordinat"
+            else:
+                reason = None
+        
+        if reason is not None:
+            if on_invalid is not None:
+                on_invalid(number, reason)
+            continue
+        
+        if deduplicate:
+            key = (_normalize_name(name),
+                   None if lat is None else (round(lat, 6), round(lng, 6)))
+            if key in seen:
+                continue
+            seen.add(key)
+        
+        yield name, lat, lng
+
+
+class LocationCatalog:
+    """
+    Sütunlu lokasyon deposu
+    
+    Adlar tek bir dizi, koordinatlar (N, 2) float dizi olarak tutulur;
+    koordinatı bilinmeyen satırlar NaN içerir. Satır başına sözlük veya
+    nesne oluşturulmaz. 0. satır başlangıç noktasıdır (ACO start_city=0).
+    """
+    
+    def __init__(self, names, coordinates=None):
+        """
+        Args:
+            names: Lokasyon adları (0. eleman başlangıç noktası)
+            coordinates: (N, 2) koordinat dizisi (opsiyonel, bilinmeyenler NaN)
+        """
+        self.names = np.asarray(names, dtype=str)
+        if coordinates is None:
+            coordinates = np.full((len(self.names), 2), np.nan)
+        self.coordinates = np.asarray(coordinates, dtype=float).reshape(-1, 2)
+        if len(self.coordinates) != len(self.names):
+            raise ValueError("Ad ve koordinat sayıları eşleşmiyor")
+    
+    @classmethod
+    def from_locations(cls, locations, start=None):
+        """
+        (name, lat, lng) akışından katalog oluştur
+        
+        Koordinatlar satır satır sıkışık float dizilerine eklenir; akış
+        tek geçişte tüketilir.
+        
+        Args:
+            locations: (name, lat, lng) üreteci (örn. iter_locations())
+            start: Başlangıç noktası; ad veya (name, lat, lng) (opsiyonel,
+                   verilmezse akışın ilk satırı başlangıçtır)
+        
+        Returns:
+            LocationCatalog
+        """
+        names = []
+        latitudes, longitudes = array('d'), array('d')
+        
+        if start is not None:
+            locations = _prepend(start, locations)
+        
+        for name, lat, lng in locations:
+            names.append(name)
+            latitudes.append(math.nan if lat is None else lat)
+            longitudes.append(math.nan if lng is None else lng)
+        
+        coordinates = np.column_stack([np.frombuffer(latitudes, dtype=float),
+                                       np.frombuffer(longitudes, dtype=float)])
+        return cls(names, coordinates)
+    
+    @classmethod
+    def from_file(cls, path, start=None, **options):
+        """
+        Katalog dosyasından oluştur
+        
+        Args:
+            path: CSV / GeoJSON dosyası
+            start: Başlangıç noktası (opsiyonel)
+            **options: iter_locations() seçenekleri
+        
+        Returns:
+            LocationCatalog
+        """
+        invalid = []
+        options.setdefault('on_invalid', lambda number, reason: invalid.append(number))
+        catalog = cls.from_locations(iter_locations(path, **options), start=start)
+        
+        if invalid:
+            print(f"{len(invalid)} geçersiz satır atlandı ({os.path.basename(path)})")
+        print(f"{len(catalog)} lokasyon yüklendi, {catalog.missing().size} tanesi için "
+              f"koordinat gerekli")
+        return catalog
+    
+    def __len__(self):
+        return len(self.names)
+    
+    @property
+    def has_coordinates(self):
+        """Koordinatı bilinen satırların maskesi"""
+        return ~np.isnan(self.coordinates).any(axis=1)
+    
+    def missing(self):
+        """Koordinatı bilinmeyen satırların indeksleri"""
+        return np.flatnonzero(~self.has_coordinates)
+    
+    def name(self, index):
+        """Index'e göre lokasyon adı"""
+        return str(self.names[index])
+    
+    def coordinate_list(self):
+        """[(lat, lng), ...] koordinat listesi (tümü bilinmelidir)"""
+        if not self.has_coordinates.all():
+            raise ValueError(f"{self.missing().size} lokasyonun koordinatı bilinmiyor")
+        return [tuple(coord) for coord in self.coordinates.tolist()]
+    
+    def fill_coordinates(self, gmaps_client, cache=None, **options):
+        """
+        Koordinatı bilinmeyen satırları geocoding ile doldur
+        
+        Dosyada koordinatı olan satırlar için istek yapılmaz.
+        
+        Args:
+            gmaps_client: Google Maps client (None ise yalnızca önbellek)
+            cache: GeocodeCache (opsiyonel)
+            **options: get_coordinates_batch() seçenekleri
+        
+        Returns:
+            list: [(lat, lng), ...] tüm koordinatlar (katalog sırasıyla)
+        """
+        missing = self.missing()
+        if missing.size:
+            from core.geocoding import get_coordinates_batch
+            
+            found = get_coordinates_batch(gmaps_client, self.names[missing].tolist(), cache,
+                                          **options)
+            for index, coord in zip(missing, found):
+                if coord is not None:
+                    self.coordinates[index] = coord
+        
+        return self.coordinate_list()
+
+
+def _prepend(start, locations):
+    """Başlangıç noktasını akışın önüne ekle"""
+    yield (start, None, None) if isinstance(start, str) else tuple(start)
+    yield from locations
+
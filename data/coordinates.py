@@ -2,7 +2,7 @@
 Ankara Göletleri ve Başlangıç Noktası Verileri
 """
 
-import googlemaps
+from .catalog import LocationCatalog
 
 # Başlangıç noktası (Çevre Bakanlığı)
 baslangic_noktasi = "Çevre, Şehircilik ve İklim Değişikliği Bakanlığı, Ankara"
@@ -22,9 +22,31 @@ goletler = [
 ]
 
 
+def get_catalog(path=None, start=baslangic_noktasi, **options):
+    """
+    Lokasyon kataloğunu döndür
+    
+    Args:
+        path: CSV / GeoJSON katalog dosyası (opsiyonel, verilmezse
+              yukarıdaki 10 gölet kullanılır)
+        start: Başlangıç noktası (0. satır)
+        **options: iter_locations() seçenekleri
+    
+    Returns:
+        LocationCatalog
+    """
+    if path is None:
+        return LocationCatalog([start] + goletler)
+    return LocationCatalog.from_file(path, start=start, **options)
+
+
+# Varsayılan katalog (başlangıç + göletler)
+catalog = get_catalog()
+
+
 def get_all_locations():
     """Tüm lokasyonları döndür (başlangıç + göletler)"""
-    return [baslangic_noktasi] + goletler
+    return catalog.names.tolist()
 
 
 def get_location_info(index):
@@ -37,8 +59,5 @@ def get_location_info(index):
     Returns:
         str: Lokasyon ismi
     """
-    if index == 0:
-        return baslangic_noktasi
-    else:
-        return goletler[index - 1]
+    return catalog.name(index)
 
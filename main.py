@@ -5,16 +5,17 @@ Streamlit Ana Uygulama Dosyası
 
 import streamlit as st
 import os
+import time
 from dotenv import load_dotenv
-import googlemaps
-import folium
-from streamlit_folium import st_folium
-
-from config import ACOConfig
-from data.coordinates import goletler, baslangic_noktasi, get_all_locations
-from core.haversine import haversine_distance
-from core.matrix_utils import create_distance_matrix, get_coordinates_batch
-from core.ant_algorithm import AntColonyOptimizer
+
+# googlemaps, folium (streamlit_folium), matplotlib ve pandas ilk kullanıldıkları
+# yerde yüklenir; ilk sayfa bunları beklemeden çizilir
+from config import ACOConfig, CacheConfig
+from data.coordinates import get_catalog
+from core import pipeline
+from core.jobs import OptimizationJob, JobRunner
+from core.geocache import GeocodeCache
+from core.matrix_store import MatrixStore
 from visual.plotting import plot_convergence, create_interactive_map
 
 # Sayfa yapılandırması
@@ -28,6 +29,71 @@ st.set_page_config(
 load_dotenv()
 API_KEY = os.getenv('GOOGLE_MAPS_API_KEY')
 
+# Lokasyon kataloğu dosyası (CSV / GeoJSON, opsiyonel; yoksa 10 gölet)
+LOCATIONS_FILE = os.getenv('LOCATIONS_FILE')
+
+
+@st.cache_resource
+def get_geocode_cache():
+    """Tüm oturumlarda paylaşılan kalıcı geocoding önbelleği"""
+    return GeocodeCache(
+        CacheConfig.CACHE_DIR,
+        ttl=CacheConfig.GEOCODE_TTL_DAYS * 24 * 3600,
+        max_entries=CacheConfig.GEOCODE_MAX_ENTRIES,
+        memory_size=CacheConfig.GEOCODE_MEMORY_SIZE
+    )
+
+
+@st.cache_resource
+def load_catalog(path):
+    """Tüm oturumlarda paylaşılan lokasyon kataloğu"""
+    return get_catalog(path)
+
+
+@st.cache_resource
+def get_matrix_store():
+    """Tüm oturumlarda paylaşılan mesafe / süre matrisi deposu"""
+    return MatrixStore(
+        os.path.join(CacheConfig.CACHE_DIR, CacheConfig.MATRIX_DIR),
+        max_entries=CacheConfig.MATRIX_MAX_ENTRIES,
+        ttl=CacheConfig.MATRIX_TTL_DAYS * 24 * 3600
+    )
+
+
+@st.cache_resource
+def get_job_runner():
+    """Tüm oturumlarda paylaşılan, eşzamanlı iş sayısını sınırlayan çalıştırıcı"""
+    return JobRunner(max_running=ACOConfig.MAX_CONCURRENT_RUNS or None)
+
+
+@st.cache_resource
+def get_gmaps_client(api_key):
+    """API anahtarı başına tek Google Maps client (anahtar yoksa None)"""
+    if not api_key:
+        return None
+    import googlemaps
+    return googlemaps.Client(key=api_key)
+
+
+@st.cache_data(show_spinner=False)
+def geocode_locations(locations_file, api_key):
+    """Katalog koordinatları (dosya ve anahtar değişmedikçe yeniden alınmaz)"""
+    return pipeline.geocode(load_catalog(locations_file), get_gmaps_client(api_key),
+                            get_geocode_cache())
+
+
+@st.cache_resource(show_spinner=False, max_entries=CacheConfig.MATRIX_MEMORY_ENTRIES)
+def build_matrices(coordinates, api_key):
+    """Mesafe / süre matrisleri (koordinatlar ve kaynak değişmedikçe yeniden kurulmaz)"""
+    return pipeline.build_matrices(list(coordinates), get_gmaps_client(api_key),
+                                   get_matrix_store())
+
+
+catalog = load_catalog(LOCATIONS_FILE)
+baslangic_noktasi = catalog.name(0)
+goletler = catalog.names[1:].tolist()
+
+
 # Ana başlık
 st.title("Karınca Kolonisi Algoritması ile Rota Optimizasyonu")
 st.markdown("**Ankara Göletleri Su Numunesi Toplama - En Kısa Rota**")
@@ -56,6 +122,17 @@ with st.sidebar:
         beta = st.slider("Beta (β) - Mesafe", 0.1, 10.0, ACOConfig.BETA, 0.1)
         evaporation = st.slider("Buharlaşma (ρ)", 0.1, 0.9, ACOConfig.EVAPORATION_RATE, 0.05)
         Q = st.number_input("Q Sabiti", 10, 500, ACOConfig.Q, 10)
+        strategy = st.selectbox(
+            "Strateji",
+            ["as", "mmas", "acs"],
+            index=["as", "mmas", "acs"].index(ACOConfig.STRATEGY),
+            format_func=lambda s: {"as": "Ant System", "mmas": "MAX-MIN Ant System",
+                                   "acs": "Ant Colony System"}[s]
+        )
+        patience = st.number_input(
+            "Erken Durma (iyileşmesiz iterasyon)", 0, 500, ACOConfig.PATIENCE, 10,
+            help="Bu kadar iterasyon boyunca iyileşme olmazsa algoritma durur (0 = kapalı)"
+        )
     
     st.markdown("---")
     run_btn = st.button("Optimizasyonu Başlat", type="primary", use_container_width=True)
@@ -117,78 +194,108 @@ with tab2:
         | Beta (β) | {} | Mesafe etkisi |
         | Buharlaşma | {} | Feromon azalma oranı |
         | Q | {} | Feromon miktarı |
-        """.format(n_ants, n_iterations, alpha, beta, evaporation, Q))
+        | Strateji | {} | Feromon güncelleme yöntemi |
+        """.format(n_ants, n_iterations, alpha, beta, evaporation, Q, strategy.upper()))
 
 # Optimizasyon çalıştırma
 if run_btn:
-    if not api_key_input:
+    geocode_cache = get_geocode_cache()
+    # Dosyada koordinatı olan lokasyonlar için geocoding gerekmez
+    offline = all(catalog.name(index) in geocode_cache for index in catalog.missing())
+    
+    if not api_key_input and not offline:
         st.error("Lütfen Google Maps API anahtarını girin!")
     else:
-        with st.spinner("Optimizasyon yapılıyor..."):
-            try:
-                # Google Maps client
-                gmaps = googlemaps.Client(key=api_key_input)
-                
-                # Koordinatları al
-                with st.status("Koordinatlar alınıyor...", expanded=True) as status:
-                    st.write("Gölet koordinatları Google Maps API'den alınıyor...")
-                    coordinates = get_coordinates_batch(gmaps, get_all_locations())
-                    status.update(label="Koordinatlar alındı!", state="complete")
-                
-                # Mesafe matrisi
-                with st.status("Mesafeler hesaplanıyor...", expanded=True) as status:
-                    st.write("Noktalar arası mesafeler hesaplanıyor...")
-                    distance_matrix, time_matrix = create_distance_matrix(coordinates, gmaps)
-                    status.update(label="Mesafe matrisi oluşturuldu!", state="complete")
+        try:
+            # Girdileri değişmeyen aşamalar önbellekten gelir
+            with st.status("Koordinatlar ve mesafeler hazırlanıyor...", expanded=True) as status:
+                coordinates = geocode_locations(LOCATIONS_FILE, api_key_input or None)
+                cache_stats = geocode_cache.stats()
+                st.write(f"Koordinatlar alındı (önbellek: "
+                         f"{cache_stats['memory_hits'] + cache_stats['disk_hits']} isabet, "
+                         f"{cache_stats['misses']} ıska)")
                 
-                # ACO optimizasyonu
-                with st.status("ACO algoritması çalışıyor...", expanded=True) as status:
-                    progress_bar = st.progress(0)
-                    progress_text = st.empty()
-                    
-                    def progress_callback(iteration, total, best_dist):
-                        progress_bar.progress(iteration / total)
-                        progress_text.text(f"İterasyon {iteration}/{total} - En İyi: {best_dist:.2f} km")
-                    
-                    aco = AntColonyOptimizer(
-                        distance_matrix=distance_matrix,
-                        n_ants=n_ants,
-                        n_iterations=n_iterations,
-                        alpha=alpha,
-                        beta=beta,
-                        evaporation_rate=evaporation,
-                        Q=Q
-                    )
-                    
-                    optimal_route, total_distance = aco.optimize(
-                        start_city=0, 
-                        progress_callback=progress_callback
-                    )
-                    
-                    progress_bar.empty()
-                    progress_text.empty()
-                    status.update(label="Optimizasyon tamamlandı!", state="complete")
-                
-                # Sonuçları session state'e kaydet
-                st.session_state.optimized = True
-                st.session_state.optimal_route = optimal_route
-                st.session_state.total_distance = total_distance
-                st.session_state.coordinates = coordinates
-                st.session_state.distance_matrix = distance_matrix
-                st.session_state.time_matrix = time_matrix
-                st.session_state.aco = aco
-                
-                st.success(f"Optimizasyon tamamlandı! Toplam mesafe: {total_distance:.2f} km")
-                
-            except Exception as e:
-                st.error(f"Hata: {str(e)}")
-                st.exception(e)
+                distance_matrix, time_matrix = build_matrices(tuple(coordinates),
+                                                              api_key_input or None)
+                st.write("Mesafe matrisi hazır")
+                status.update(label="Koordinatlar ve mesafeler hazır!", state="complete")
+            
+            # Önceki iş sürüyorsa iptal et
+            previous_job = st.session_state.get('job')
+            if previous_job is not None and not previous_job.done:
+                previous_job.cancel()
+            
+            # ACO arka plan sürecinde çalışır; sayfa her yenilemede işi yoklar
+            st.session_state.job = get_job_runner().submit(OptimizationJob(
+                distance_matrix,
+                params={
+                    'n_ants': n_ants,
+                    'n_iterations': n_iterations,
+                    'alpha': alpha,
+                    'beta': beta,
+                    'evaporation_rate': evaporation,
+                    'Q': Q,
+                    'strategy': strategy,
+                    'patience': patience or None
+                },
+                profile=True
+            ))
+            st.session_state.job_inputs = (coordinates, distance_matrix, time_matrix)
+            
+        except Exception as e:
+            st.error(f"Hata: {str(e)}")
+            st.exception(e)
+
+# Arka plan işinin durumu
+job = st.session_state.get('job')
+if job is not None and st.session_state.get('job_inputs') is not None:
+    job_status = get_job_runner().poll(job)
+    
+    if job_status == 'queued':
+        st.info(f"Optimizasyon sırada bekliyor ({get_job_runner().position(job)}. sırada)")
+        if st.button("İptal"):
+            job.cancel()
+            st.rerun()
+    elif job_status == 'running':
+        best_text = (f" - En İyi: {job.best_distance_history[-1]:.2f} km"
+                     if job.best_distance_history else "")
+        st.progress(job.progress,
+                    text=f"İterasyon {job.iteration}/{job.n_iterations}{best_text}")
+        if st.button("İptal"):
+            job.cancel()
+    elif job_status == 'error':
+        st.session_state.job_inputs = None
+        st.error("Optimizasyon başarısız oldu")
+        st.code(job.error)
+    elif job.best_route is None:
+        st.session_state.job_inputs = None
+        st.warning("Optimizasyon iptal edildi")
+    else:
+        # Sonuçları session state'e kaydet
+        coordinates, distance_matrix, time_matrix = st.session_state.job_inputs
+        st.session_state.job_inputs = None
+        st.session_state.optimized = True
+        st.session_state.optimal_route = job.best_route
+        st.session_state.total_distance = job.best_distance
+        st.session_state.coordinates = coordinates
+        st.session_state.distance_matrix = distance_matrix
+        st.session_state.time_matrix = time_matrix
+        st.session_state.aco = job
+        st.session_state.instrumentation = job.instrumentation
+        
+        if job_status == 'cancelled':
+            st.warning(f"Optimizasyon iptal edildi; o ana kadarki en iyi rota: "
+                       f"{job.best_distance:.2f} km")
+        else:
+            st.success(f"Optimizasyon tamamlandı! Toplam mesafe: {job.best_distance:.2f} km")
 
 # Sekme 3: Harita
 with tab3:
     st.subheader("İnteraktif Rota Haritası")
     
     if st.session_state.get('optimized'):
+        from streamlit_folium import st_folium
+        
         # Harita oluştur
         route_map = create_interactive_map(
             optimal_route=st.session_state.optimal_route,
@@ -210,7 +317,7 @@ with tab3:
         for i in range(len(st.session_state.optimal_route) - 1):
             idx_from = st.session_state.optimal_route[i]
             idx_to = st.session_state.optimal_route[i + 1]
-            total_time += st.session_state.time_matrix[idx_from][idx_to]
+            total_time += st.session_state.time_matrix[idx_from, idx_to]
         
         col1.metric("Toplam Mesafe", f"{st.session_state.total_distance:.2f} km")
         col2.metric("Tahmini Süre", f"{total_time:.0f} dk")
@@ -246,14 +353,11 @@ with tab4:
         
         rota_data = []
         for i, idx in enumerate(st.session_state.optimal_route[:-1], 1):
-            if idx == 0:
-                lokasyon = baslangic_noktasi
-            else:
-                lokasyon = goletler[idx - 1]
+            lokasyon = catalog.name(idx)
             
             next_idx = st.session_state.optimal_route[i]
-            mesafe = st.session_state.distance_matrix[idx][next_idx]
-            sure = st.session_state.time_matrix[idx][next_idx]
+            mesafe = st.session_state.distance_matrix[idx, next_idx]
+            sure = st.session_state.time_matrix[idx, next_idx]
             
             rota_data.append({
                 'Sıra': i,
@@ -273,6 +377,28 @@ with tab4:
             file_name="ankara_golet_rota.csv",
             mime="text/csv"
         )
+        
+        # Aşama süreleri
+        instrumentation = st.session_state.get('instrumentation')
+        if instrumentation is not None:
+            st.markdown("### Aşama Süreleri")
+            
+            df_phases = pd.DataFrame([{
+                'Aşama': row['phase'],
+                'Süre (s)': round(row['seconds'], 4),
+                'Çağrı': row['calls'],
+                'Pay (%)': round(row['share'] * 100, 1)
+            } for row in instrumentation.breakdown()])
+            st.dataframe(df_phases, use_container_width=True, hide_index=True)
+            st.caption(f"Toplam süre: {instrumentation.wall_time:.2f} s | " + ", ".join(
+                f"{name}: {value}" for name, value in sorted(instrumentation.counters.items())))
+            
+            st.download_button(
+                label="Ölçümleri İndir (JSON)",
+                data=instrumentation.to_json().encode('utf-8'),
+                file_name="aco_profil.json",
+                mime="application/json"
+            )
     else:
         st.info("Sonuçları görmek için önce optimizasyonu çalıştırın.")
 
@@ -284,3 +410,8 @@ st.markdown(
     unsafe_allow_html=True
 )
 
+# Çalışan / sıradaki iş varsa sayfayı kısa aralıklarla yenileyerek yokla
+if job is not None and st.session_state.get('job_inputs') is not None and not job.done:
+    time.sleep(ACOConfig.POLL_INTERVAL)
+    st.rerun()
+
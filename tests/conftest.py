@@ -0,0 +1,31 @@
+"""
+Ortak test yardımcıları
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def random_coordinates(n, seed=0):
+    """Ankara çevresinde n rastgele (lat, lng) koordinatı"""
+    rng = np.random.default_rng(seed)
+    lats = 39.9 + rng.uniform(-0.3, 0.3, n)
+    lngs = 32.8 + rng.uniform(-0.3, 0.3, n)
+    return list(zip(lats.tolist(), lngs.tolist()))
+
+
+def euclidean_matrix(n, seed=0):
+    """Birim karede n rastgele noktanın simetrik Öklid mesafe matrisi"""
+    points = np.random.default_rng(seed).random((n, 2))
+    return np.linalg.norm(points[:, None, :] - points[None, :, :], axis=-1)
+
+
+@pytest.fixture
+def matrix():
+    return euclidean_matrix(20)
+
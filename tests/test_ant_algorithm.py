@@ -0,0 +1,113 @@
+"""
+AntColonyOptimizer rota kurma, aday listeleri ve feromon güncelleme testleri
+"""
+
+import numpy as np
+import pytest
+
+from core.ant_algorithm import AntColonyOptimizer, nearest_neighbors, roulette_select
+from tests.conftest import euclidean_matrix
+
+
+def is_tour(route, n, start_city=0):
+    return route[0] == start_city and sorted(route) == list(range(n))
+
+
+def test_roulette_select_respects_weights():
+    weights = np.array([[0.0, 1.0, 0.0, 3.0]] * 4000)
+    random_values = np.random.default_rng(0).random(4000)
+    
+    chosen = roulette_select(weights, random_values)
+    
+    assert set(chosen) == {1, 3}
+    assert (chosen == 3).mean() == pytest.approx(0.75, abs=0.03)
+    # Eşik toplama eşit olsa da sıfır ağırlıklı sütun seçilmez
+    assert roulette_select(np.array([[1.0, 2.0, 0.0]]), np.array([1.0]))[0] == 1
+
+
+def test_vectorized_construction_matches_per_ant_loop(matrix):
+    batched = AntColonyOptimizer(matrix, n_ants=8, seed=0)
+    looped = AntColonyOptimizer(matrix, n_ants=8, seed=0, vectorized=False)
+    random_values = np.random.default_rng(1).random((8, len(matrix) - 1))
+    
+    routes = batched.construct_solutions(start_city=3, random_values=random_values)
+    
+    np.testing.assert_array_equal(routes, looped.construct_solutions(3, random_values))
+    assert all(is_tour(route.tolist(), len(matrix), start_city=3) for route in routes)
+
+
+def test_same_seed_gives_same_result(matrix):
+    first = AntColonyOptimizer(matrix, n_ants=6, n_iterations=10, seed=42).optimize()
+    second = AntColonyOptimizer(matrix, n_ants=6, n_iterations=10, seed=42).optimize()
+    
+    assert first == second
+
+
+def test_route_distances_match_scalar_sum(matrix):
+    optimizer = AntColonyOptimizer(matrix, n_ants=4, seed=0)
+    routes = optimizer.construct_solutions()
+    
+    expected = [sum(matrix[route[i], route[(i + 1) % len(route)]] for i in range(len(route)))
+                for route in routes]
+    
+    np.testing.assert_allclose(optimizer.calculate_route_distances(routes), expected)
+    assert optimizer.calculate_route_distance(routes[0].tolist()) == pytest.approx(expected[0])
+
+
+def test_nearest_neighbors_in_chunks(matrix):
+    neighbors = nearest_neighbors(matrix, 5, chunk_size=3)
+    
+    for city, row in enumerate(neighbors):
+        distances = np.where(np.arange(len(matrix)) == city, np.inf, matrix[city])
+        np.testing.assert_array_equal(row, np.argsort(distances, kind='stable')[:5])
+
+
+def test_candidate_lists_restrict_choices(matrix):
+    optimizer = AntColonyOptimizer(matrix, n_ants=10, n_iterations=10, n_candidates=4, seed=0)
+    
+    route, distance = optimizer.optimize()
+    
+    assert optimizer.candidates.shape == (len(matrix), 4)
+    assert is_tour(route[:-1], len(matrix))
+    # Aday listesi N-1'e ulaşırsa tam arama kullanılır
+    assert AntColonyOptimizer(matrix, n_candidates=len(matrix)).candidates is None
+
+
+@pytest.mark.parametrize('symmetric', [True, False])
+def test_vectorized_deposit_matches_loop(matrix, symmetric):
+    optimizer = AntColonyOptimizer(matrix, n_ants=5, seed=0, symmetric=symmetric)
+    routes = optimizer.construct_solutions()
+    distances = optimizer.calculate_route_distances(routes)
+    expected = optimizer.pheromone * (1 - optimizer.evaporation_rate)
+    for route, distance in zip(routes.tolist(), distances):
+        for i in range(len(route)):
+            a, b = route[i], route[(i + 1) % len(route)]
+            expected[a, b] += optimizer.Q / distance
+            if symmetric:
+                expected[b, a] += optimizer.Q / distance
+    
+    optimizer.update_pheromones(routes, distances)
+    
+    np.testing.assert_allclose(optimizer.pheromone, expected)
+
+
+def nearest_neighbour_tour(matrix):
+    route = [0]
+    while len(route) < len(matrix):
+        distances = np.array(matrix[route[-1]], dtype=float)
+        distances[route] = np.inf
+        route.append(int(np.argmin(distances)))
+    return route
+
+
+def test_optimizer_improves_on_nearest_neighbour_tour():
+    matrix = euclidean_matrix(30, seed=5)
+    optimizer = AntColonyOptimizer(matrix, n_ants=20, n_iterations=60, seed=0, beta=3.0)
+    
+    _, distance = optimizer.optimize()
+    
+    nn_distance = optimizer.calculate_route_distance(nearest_neighbour_tour(matrix))
+    assert distance <= nn_distance * 1.05
+    assert optimizer.best_distance_history == sorted(optimizer.best_distance_history,
+                                                     reverse=True)
+
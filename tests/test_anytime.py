@@ -0,0 +1,50 @@
+"""
+iterate() / optimize() anytime API testleri
+"""
+
+import threading
+
+from core.ant_algorithm import AntColonyOptimizer
+
+
+def test_cancel_before_first_iteration(matrix):
+    cancel = threading.Event()
+    cancel.set()
+    optimizer = AntColonyOptimizer(matrix, n_ants=5, n_iterations=10, seed=0)
+    
+    route, distance = optimizer.optimize(cancel_token=cancel)
+    
+    assert route is None
+    assert distance == float('inf')
+    assert optimizer.stop_reason == 'cancelled'
+
+
+def test_iterate_stops_at_target(matrix):
+    optimizer = AntColonyOptimizer(matrix, n_ants=5, n_iterations=50, seed=0)
+    
+    snapshots = list(optimizer.iterate(target_distance=float('inf')))
+    
+    assert len(snapshots) == 1
+    assert optimizer.stop_reason == 'target'
+    assert snapshots[0]['best_route'][0] == snapshots[0]['best_route'][-1] == 0
+
+
+def test_stop_reasons(matrix):
+    completed = AntColonyOptimizer(matrix, n_ants=5, n_iterations=3, seed=0)
+    converged = AntColonyOptimizer(matrix, n_ants=5, n_iterations=200, seed=0, patience=3)
+    
+    completed.optimize()
+    converged.optimize()
+    
+    assert completed.stop_reason == 'iterations'
+    assert converged.stop_reason == 'converged'
+
+
+def test_time_budget_runs_at_least_one_iteration(matrix):
+    optimizer = AntColonyOptimizer(matrix, n_ants=5, n_iterations=50, seed=0)
+    
+    route, _ = optimizer.optimize(time_budget=0.0)
+    
+    assert len(route) == len(matrix) + 1
+    assert len(optimizer.best_distance_history) >= 1
+
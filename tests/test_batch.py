@@ -0,0 +1,107 @@
+"""
+Toplu CLI (batch.py) ve core.pipeline testleri
+"""
+
+import json
+
+import pytest
+
+import batch
+from core import pipeline
+from tests.conftest import euclidean_matrix, random_coordinates
+
+
+def write_locations(path, n, seed=0):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('name,lat,lng\n')
+        for index, (lat, lng) in enumerate(random_coordinates(n, seed)):
+            f.write(f'st{index},{lat},{lng}\n')
+    return path
+
+
+def write_manifest(tmp_path, instances, defaults=None):
+    write_locations(tmp_path / 'a.csv', 12)
+    path = tmp_path / 'manifest.json'
+    path.write_text(json.dumps({'defaults': defaults or {}, 'instances': instances}))
+    return str(path)
+
+
+@pytest.mark.parametrize('key', ['seed', 'instrumentation'])
+def test_manifest_rejects_reserved_params(tmp_path, key):
+    path = write_manifest(tmp_path, [{'name': 'a', 'locations': 'a.csv', 'start': None,
+                                      'params': [{'n_ants': 5}, {key: 3}]}])
+    
+    with pytest.raises(ValueError, match=key):
+        batch.load_manifest(path)
+
+
+def test_manifest_rejects_reserved_default_params(tmp_path):
+    path = write_manifest(tmp_path, [{'name': 'a', 'locations': 'a.csv', 'start': None}],
+                          defaults={'params': {'seed': 1}})
+    
+    with pytest.raises(ValueError, match='seed'):
+        batch.load_manifest(path)
+
+
+def test_solve_rejects_duplicate_seed():
+    matrix = euclidean_matrix(6)
+    
+    with pytest.raises(ValueError, match='seed'):
+        pipeline.solve(matrix, matrix, [f'st{i}' for i in range(6)], params={'seed': 1}, seed=2)
+
+
+def test_manifest_defaults_and_expansion(tmp_path):
+    path = write_manifest(tmp_path, [{'name': 'a', 'locations': 'a.csv', 'start': None,
+                                      'params': [{'n_ants': 5}, {'n_ants': 8}],
+                                      'seeds': [0, 1, 2]}])
+    
+    instance, = batch.load_manifest(path)
+    jobs = batch.expand_jobs(instance)
+    
+    assert instance['locations'] == str(tmp_path / 'a.csv')
+    assert instance['params'][0]['strategy'] == batch.DEFAULT_PARAMS['strategy']
+    assert len(jobs) == 6
+    assert {job['params']['n_ants'] for job in jobs} == {5, 8}
+
+
+@pytest.mark.parametrize('options', [{}, {'compact': True}, {'knn': 4}])
+def test_solve_job_loads_matrices_by_key(tmp_path, options):
+    path = write_manifest(tmp_path, [{'name': 'a', 'locations': 'a.csv', 'start': None,
+                                      'params': {'n_ants': 5, 'n_iterations': 5},
+                                      'seeds': [0], 'matrix': options}])
+    instance, = batch.load_manifest(path)
+    job, = batch.expand_jobs(instance)
+    batch._init_worker(None, str(tmp_path / 'cache'), spill_dir=str(tmp_path / 'spill'))
+    
+    prepared = batch.prepare_instance(instance)
+    local = batch.solve_job(prepared, job)
+    # Başka bir işçi: süreç içi önbellek boş, matrisler çalıştırma dizininden gelir
+    batch._worker['prepared'].clear()
+    shared = batch.solve_job(prepared, job)
+    
+    assert 'distance_matrix' not in prepared
+    assert shared['total_distance'] == pytest.approx(local['total_distance'])
+    assert shared['route'] == local['route']
+
+
+def test_parallel_batch_matches_serial(tmp_path):
+    path = write_manifest(tmp_path, [
+        {'name': 'a', 'locations': 'a.csv', 'start': None},
+        {'name': 'b', 'locations': 'a.csv', 'start': None, 'matrix': {'compact': True}}
+    ], defaults={'params': {'n_ants': 5, 'n_iterations': 5}, 'seeds': [0, 1]})
+    instances = batch.load_manifest(path)
+    cache_dir = str(tmp_path / 'cache')
+    
+    results = {}
+    for workers in (1, 2):
+        output = tmp_path / f'results-{workers}.jsonl'
+        summary = batch.run_batch(instances, str(output), workers=workers,
+                                  cache_dir=cache_dir, verbose=False)
+        assert summary == {'jobs': 4, 'failed': 0, 'wall_time': summary['wall_time']}, output.read_text()
+        records = [json.loads(line) for line in output.read_text().splitlines()]
+        results[workers] = {(r['instance'], r['seed']): r['total_distance'] for r in records}
+    
+    assert results[1] == results[2]
+    assert (tmp_path / 'cache').exists()
+    assert not [name for name in (tmp_path / 'cache').iterdir() if name.name.startswith('batch-')]
+
@@ -0,0 +1,68 @@
+"""
+Benchmark paketi testleri
+"""
+
+import tracemalloc
+
+from benchmarks import run
+from benchmarks.instances import generate_instance
+from core.ant_algorithm import AntColonyOptimizer
+
+
+class TracingProbe(AntColonyOptimizer):
+    """Her iterasyonda tracemalloc durumunu kaydeden optimizer"""
+    
+    tracing = []
+    
+    def run_iteration(self, start_city=0):
+        TracingProbe.tracing.append(tracemalloc.is_tracing())
+        return super().run_iteration(start_city)
+
+
+def test_timed_run_is_not_traced(monkeypatch):
+    monkeypatch.setattr(run, 'AntColonyOptimizer', TracingProbe)
+    TracingProbe.tracing = []
+    instance = generate_instance('uniform', 15, seed=0)
+    
+    record = run.run_case(instance, 'mmas', n_iterations=6)
+    
+    timed = TracingProbe.tracing[:record['iterations']]
+    memory = TracingProbe.tracing[record['iterations']:]
+    assert record['iterations'] == 6 and not any(timed)
+    assert len(memory) == run.MEMORY_ITERATIONS and all(memory)
+    assert record['peak_memory_mb'] > 0
+    assert not tracemalloc.is_tracing()
+
+
+def test_generated_instances_are_reproducible():
+    first = generate_instance('clustered', 20, seed=3)
+    second = generate_instance('clustered', 20, seed=3)
+    
+    assert (first['distance_matrix'] == second['distance_matrix']).all()
+    assert first['name'] == second['name']
+
+
+def test_compare_flags_regressions():
+    record = {'instance': 'x', 'config': 'as', 'seed': 0, 'wall_time': 2.0,
+              'time_to_target': 1.0, 'iterations_per_second': 50.0, 'gap': 0.01,
+              'peak_memory_mb': 10.0}
+    slower = {**record, 'wall_time': 3.0, 'gap': 0.05}
+    
+    regressions = run.compare({'results': [slower]}, {'results': [record]})
+    
+    assert {item['metric'] for item in regressions} == {'wall_time', 'gap'}
+    assert run.compare({'results': [record]}, {'results': [record]}) == []
+
+
+def test_missing_baseline_fails(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    missing = str(tmp_path / 'baseline.json')
+    options = ['--kinds', 'uniform', '--sizes', '8', '--configs', 'as', '--baseline', missing]
+    
+    assert run.main(options) == 1
+    assert not (tmp_path / 'benchmark_results.json').exists()
+    
+    assert run.main(options + ['--no-baseline']) == 0
+    assert run.main(options + ['--save-baseline']) == 0
+    assert run.main(options) == 0
+
@@ -0,0 +1,92 @@
+"""
+Lokasyon kataloğu testleri
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from data.catalog import LocationCatalog, iter_locations
+from data.coordinates import baslangic_noktasi, get_catalog, goletler
+
+
+def test_csv_rows_are_validated_and_deduplicated(tmp_path):
+    path = tmp_path / 'goletler.csv'
+    path.write_text(
+        'Ad,Enlem,Boylam\n'
+        + 'Eymir Gölü,39.82,32.83\n'
+        + 'eymir  gölü,39.82,32.83\n'
+        + 'Mogan Gölü,"39,77","32,79"\n'
+        + ',39.0,32.0\n'
+        + 'Çubuk Barajı,,\n'
+        + 'Bozuk,abc,32.0\n'
+        + 'Yarım,39.0,\n'
+        + 'Uzak,95.0,32.0\n',
+        encoding='utf-8'
+    )
+    invalid = []
+    
+    rows = list(iter_locations(str(path), on_invalid=lambda n, reason: invalid.append((n, reason))))
+    
+    assert rows == [('Eymir Gölü', 39.82, 32.83), ('Mogan Gölü', 39.77, 32.79),
+                    ('Çubuk Barajı', None, None)]
+    assert invalid == [(5, "ad boş"), (7, "sayısal olmayan koordinat"),
+                       (8, "eksik koordinat"), (9, "aralık dışı koordinat")]
+
+
+def test_geojson_collection_and_sequence(tmp_path):
+    features = [
+        {'type': 'Feature', 'properties': {'name': 'Eymir Gölü'},
+         'geometry': {'type': 'Point', 'coordinates': [32.83, 39.82]}},
+        {'type': 'Feature', 'properties': {'isim': 'Mogan Gölü', 'lat': 39.77, 'lng': 32.79},
+         'geometry': None}
+    ]
+    collection = tmp_path / 'goletler.geojson'
+    collection.write_text(json.dumps({'type': 'FeatureCollection', 'features': features}),
+                          encoding='utf-8')
+    sequence = tmp_path / 'goletler.geojsonl'
+    sequence.write_text(''.join('\x1e' + json.dumps(f) + '\n' for f in features),
+                        encoding='utf-8')
+    expected = [('Eymir Gölü', 39.82, 32.83), ('Mogan Gölü', 39.77, 32.79)]
+    
+    assert list(iter_locations(str(collection))) == expected
+    assert list(iter_locations(str(sequence))) == expected
+
+
+def test_catalog_is_columnar(tmp_path):
+    path = tmp_path / 'goletler.csv'
+    path.write_text('name,lat,lng\nEymir Gölü,39.82,32.83\nÇubuk Barajı,,\n', encoding='utf-8')
+    
+    catalog = LocationCatalog.from_file(str(path), start=('Bakanlık', 39.9, 32.8))
+    
+    assert len(catalog) == 3
+    assert catalog.name(0) == 'Bakanlık'
+    assert catalog.coordinates.shape == (3, 2)
+    np.testing.assert_array_equal(catalog.missing(), [2])
+    with pytest.raises(ValueError):
+        catalog.coordinate_list()
+
+
+def test_fill_coordinates_only_requests_missing(tmp_path):
+    class FakeClient:
+        def __init__(self):
+            self.addresses = []
+        
+        def geocode(self, address):
+            self.addresses.append(address)
+            return [{'geometry': {'location': {'lat': 40.1, 'lng': 33.0}}}]
+    
+    catalog = LocationCatalog(['A', 'B'], [(39.9, 32.8), (np.nan, np.nan)])
+    client = FakeClient()
+    
+    assert catalog.fill_coordinates(client) == [(39.9, 32.8), (40.1, 33.0)]
+    assert client.addresses == ['B']
+
+
+def test_default_catalog():
+    catalog = get_catalog()
+    
+    assert catalog.names.tolist() == [baslangic_noktasi] + goletler
+    assert catalog.missing().size == len(goletler) + 1
+
@@ -0,0 +1,103 @@
+"""
+Kompakt (paketlenmiş üst üçgen) matris testleri
+"""
+
+import numpy as np
+import pytest
+
+from core.ant_algorithm import AntColonyOptimizer
+from core.compact import (TriangularMatrix, add_at, compact_matrix, elementwise, is_packed,
+                          row_blocks)
+from tests.conftest import euclidean_matrix
+
+
+@pytest.fixture
+def dense():
+    return euclidean_matrix(9, seed=2)
+
+
+def test_indexing_matches_dense(dense):
+    packed = TriangularMatrix.from_dense(dense, dtype=np.float64)
+    rows = np.array([0, 8, 3, 5, 5])
+    cols = np.array([8, 0, 5, 3, 5])
+    
+    assert packed.data.shape == (9 * 10 // 2,)
+    assert packed[2, 7] == packed[7, 2] == dense[2, 7]
+    np.testing.assert_array_equal(packed[rows, cols], dense[rows, cols])
+    np.testing.assert_array_equal(packed[4], dense[4])
+    np.testing.assert_array_equal(packed[[1, 6]], dense[[1, 6]])
+    np.testing.assert_array_equal(np.asarray(packed), dense)
+
+
+def test_writes_are_symmetric(dense):
+    packed = TriangularMatrix.from_dense(dense, dtype=np.float64)
+    
+    packed[1, 4] = 10.0
+    add_at(packed, np.array([2, 6, 2]), np.array([6, 2, 6]), 1.0)
+    
+    assert packed[4, 1] == 10.0
+    assert packed[6, 2] == pytest.approx(dense[2, 6] + 3.0)
+    packed[...] = dense
+    np.testing.assert_array_equal(np.asarray(packed), dense)
+
+
+def test_arithmetic_keeps_representation(dense):
+    packed = TriangularMatrix.from_dense(dense)
+    
+    packed *= 0.5
+    scaled = elementwise(packed, lambda values: values + 1)
+    clipped = packed.clip(0.1, 0.2)
+    
+    assert is_packed(scaled) and scaled.dtype == np.float32
+    np.testing.assert_allclose(np.asarray(scaled), dense * 0.5 + 1, rtol=1e-6)
+    assert clipped.data.min() >= 0.1 and clipped.data.max() <= np.float32(0.2)
+    np.testing.assert_allclose(np.asarray(packed ** 2), (dense * 0.5) ** 2, rtol=1e-5)
+
+
+def test_compact_matrix_keeps_asymmetric_dense(dense):
+    asymmetric = dense + np.triu(np.ones_like(dense))
+    
+    result = compact_matrix(asymmetric, symmetric=False)
+    
+    assert isinstance(result, np.ndarray) and result.dtype == np.float32
+    assert is_packed(compact_matrix(dense))
+
+
+def test_row_blocks_cover_all_rows(dense):
+    packed = TriangularMatrix.from_dense(dense, dtype=np.float64)
+    
+    for matrix in (dense, packed):
+        blocks = list(row_blocks(matrix, max_elements=20))
+        assert [start for start, _ in blocks] == [0, 2, 4, 6, 8]
+        np.testing.assert_array_equal(np.vstack([block for _, block in blocks]), dense)
+
+
+def test_compact_optimizer_uses_packed_storage():
+    dense = euclidean_matrix(15, seed=4)
+    
+    optimizer = AntColonyOptimizer(dense, n_ants=6, n_iterations=10, seed=0, compact=True)
+    route, distance = optimizer.optimize()
+    
+    assert is_packed(optimizer.distance_matrix) and is_packed(optimizer.pheromone)
+    assert optimizer.pheromone.nbytes < np.zeros((15, 15), dtype=np.float32).nbytes
+    assert sorted(route[:-1]) == list(range(15))
+    exact = sum(dense[a, b] for a, b in zip(route, route[1:]))
+    assert distance == pytest.approx(exact, rel=1e-5)
+
+
+
+@pytest.mark.parametrize('strategy', ['as', 'mmas', 'acs'])
+def test_compact_optimizer_handles_asymmetric_matrix(strategy):
+    rng = np.random.default_rng(5)
+    asymmetric = euclidean_matrix(12, seed=5) * rng.uniform(1.0, 1.5, (12, 12))
+    
+    optimizer = AntColonyOptimizer(asymmetric, n_ants=5, n_iterations=5, strategy=strategy,
+                                   seed=0, compact=True)
+    route, distance = optimizer.optimize()
+    
+    assert not is_packed(optimizer.distance_matrix) and not is_packed(optimizer.pheromone)
+    assert optimizer.pheromone.dtype == np.float32
+    assert route[0] == route[-1] == 0 and sorted(route[:-1]) == list(range(12))
+    exact = sum(asymmetric[a, b] for a, b in zip(route, route[1:]))
+    assert distance == pytest.approx(exact, rel=1e-5)
+
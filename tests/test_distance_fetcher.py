@@ -0,0 +1,111 @@
+"""
+Döşemeli Distance Matrix istemcisi testleri
+"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from core.distance_fetcher import DistanceMatrixFetcher, TokenBucket, tile_ranges
+from core.haversine import haversine_matrix
+from tests.conftest import random_coordinates
+
+
+class FakeClient:
+    """Mesafeyi koordinat indekslerinden üreten Distance Matrix taslağı"""
+    
+    def __init__(self, coords, fail_first=0, status='OK', missing=()):
+        self.index = {coord: i for i, coord in enumerate(coords)}
+        self.fail_first = fail_first
+        self.status = status
+        self.missing = set(missing)
+        self.calls = []
+        self._lock = threading.Lock()
+    
+    def distance_matrix(self, origins, destinations, **kwargs):
+        with self._lock:
+            self.calls.append((len(origins), len(destinations)))
+            if len(self.calls) <= self.fail_first:
+                raise ConnectionError("bağlantı koptu")
+        if self.status != 'OK':
+            return {'status': self.status}
+        
+        rows = []
+        for origin in origins:
+            elements = []
+            for destination in destinations:
+                i, j = self.index[origin], self.index[destination]
+                if (i, j) in self.missing:
+                    elements.append({'status': 'ZERO_RESULTS'})
+                else:
+                    elements.append({'status': 'OK', 'distance': {'value': 1000 * (i + j)},
+                                     'duration': {'value': 60 * i * j}})
+            rows.append({'elements': elements})
+        return {'status': 'OK', 'rows': rows}
+
+
+def expected(n):
+    i, j = np.indices((n, n))
+    return (i + j).astype(float), (i * j).astype(float)
+
+
+def test_tiles_cover_matrix_within_limits():
+    tiles = tile_ranges(30, 70, max_origins=25, max_destinations=25, max_elements=100)
+    covered = np.zeros((30, 70), dtype=int)
+    
+    for rows, columns in tiles:
+        covered[rows, columns] += 1
+        assert (rows.stop - rows.start) * (columns.stop - columns.start) <= 100
+    assert np.all(covered == 1)
+
+
+def test_fetch_assembles_tiles():
+    coords = random_coordinates(23, seed=1)
+    client = FakeClient(coords)
+    fetcher = DistanceMatrixFetcher(client, max_workers=4, elements_per_second=10 ** 6)
+    
+    distances, times = fetcher.fetch(coords)
+    
+    np.testing.assert_array_equal(distances, expected(23)[0])
+    np.testing.assert_array_equal(times, expected(23)[1])
+    assert fetcher.stats['requests'] == fetcher.stats['tiles'] == len(client.calls)
+    assert max(rows * columns for rows, columns in client.calls) <= 100
+
+
+def test_failed_requests_are_retried():
+    coords = random_coordinates(6, seed=2)
+    client = FakeClient(coords, fail_first=2)
+    fetcher = DistanceMatrixFetcher(client, max_workers=1, backoff=0.0)
+    
+    distances, _ = fetcher.fetch(coords)
+    
+    np.testing.assert_array_equal(distances, expected(6)[0])
+    assert fetcher.stats['retries'] == 2
+    assert fetcher.stats['failed_tiles'] == 0
+
+
+def test_haversine_fallback_for_failed_tiles_and_elements():
+    coords = random_coordinates(5, seed=3)
+    fetcher = DistanceMatrixFetcher(FakeClient(coords, status='REQUEST_DENIED'), backoff=0.0)
+    
+    distances, times = fetcher.fetch(coords)
+    
+    np.testing.assert_allclose(distances, haversine_matrix(coords), atol=1e-9)
+    np.testing.assert_allclose(times, distances * fetcher.time_factor)
+    assert fetcher.stats['requests'] == 1
+    assert fetcher.stats['fallback_elements'] == 25
+    
+    fetcher = DistanceMatrixFetcher(FakeClient(coords, missing=[(1, 3)]))
+    distances, _ = fetcher.fetch(coords)
+    assert distances[1, 3] == pytest.approx(haversine_matrix(coords)[1, 3])
+    assert distances[3, 1] == 4.0
+    assert fetcher.stats['fallback_elements'] == 1
+
+
+def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=100, capacity=100)
+    
+    assert bucket.acquire(100) == 0.0
+    assert bucket.acquire(20) > 0.0
+
@@ -0,0 +1,80 @@
+"""
+Kalıcı geocoding önbelleği testleri
+"""
+
+import pytest
+
+from core import geocache
+from core.geocache import GeocodeCache
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+    
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(geocache.time, 'time', clock)
+    return clock
+
+
+def test_expired_entries_are_misses(clock):
+    with GeocodeCache(':memory:', ttl=60) as cache:
+        cache.set('Mogan Gölü', (39.77, 32.79))
+        clock.now += 30
+        assert cache.get('Mogan Gölü') == (39.77, 32.79)
+        
+        clock.now += 31
+        assert 'Mogan Gölü' not in cache
+        assert cache.get('Mogan Gölü') is None
+        assert len(cache) == 0
+
+
+def test_least_recently_used_entries_are_evicted(clock):
+    with GeocodeCache(':memory:', max_entries=2, memory_size=0) as cache:
+        cache.set('a', (1.0, 1.0))
+        clock.now += 1
+        cache.set('b', (2.0, 2.0))
+        clock.now += 1
+        assert cache.get('a') == (1.0, 1.0)
+        clock.now += 1
+        cache.set('c', (3.0, 3.0))
+        
+        assert len(cache) == 2
+        assert cache.get('b') is None
+        assert cache.get('a') == (1.0, 1.0)
+        assert cache.get('c') == (3.0, 3.0)
+        assert cache.stats()['evictions'] == 1
+
+
+def test_stats_count_memory_and_disk_hits(tmp_path):
+    with GeocodeCache(str(tmp_path)) as cache:
+        cache.set('Eymir Gölü', (39.82, 32.83))
+        cache.get('Eymir Gölü')
+        cache.get('Gölbaşı')
+    
+    with GeocodeCache(str(tmp_path)) as cache:
+        cache.get('Eymir Gölü')
+        cache.get('Eymir Gölü')
+        stats = cache.stats()
+    
+    assert stats['disk_hits'] == 1
+    assert stats['memory_hits'] == 1
+    assert stats['misses'] == 0
+    assert stats['hit_rate'] == 1.0
+    assert stats['entries'] == 1
+
+
+def test_cache_persists_between_instances(tmp_path):
+    with GeocodeCache(str(tmp_path)) as cache:
+        cache.set('Eymir Gölü', (39.82, 32.83))
+    
+    with GeocodeCache(str(tmp_path)) as cache:
+        assert cache.get('eymir gölü') == (39.82, 32.83)
+        assert 'Eymir Gölü' in cache
+
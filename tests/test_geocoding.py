@@ -0,0 +1,74 @@
+"""
+Geocoding önbelleği ve eşzamanlı geocoding testleri
+"""
+
+import threading
+import time
+
+import pytest
+
+from core.geocache import GeocodeCache, normalize_address
+from core.geocoding import geocode_addresses, get_coordinates_batch, _run
+
+
+class FakeClient:
+    """Bilinen adresleri yavaşça çözen Google Maps istemcisi taklidi"""
+    
+    def __init__(self, known, delay=0.02):
+        self.known = known
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+    
+    def geocode(self, address):
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        if address not in self.known:
+            return []
+        lat, lng = self.known[address]
+        return [{'geometry': {'location': {'lat': lat, 'lng': lng}}}]
+
+
+def test_batch_keeps_input_order_and_limits_concurrency():
+    known = {f'göl {i}': (39.0 + i, 32.0 + i) for i in range(12)}
+    client = FakeClient(known)
+    
+    coordinates = get_coordinates_batch(client, list(known), max_in_flight=4)
+    
+    assert coordinates == list(known.values())
+    assert 1 < client.max_in_flight <= 4
+
+
+def test_failures_are_keyed_by_index():
+    client = FakeClient({'a': (1.0, 2.0)})
+    
+    coordinates, failures = _run(geocode_addresses(client, ['x', 'a', 'x']))
+    
+    assert coordinates == [None, (1.0, 2.0), None]
+    assert set(failures) == {0, 2}
+    
+    with pytest.raises(ValueError, match=r'x \(#0\), x \(#2\)'):
+        get_coordinates_batch(client, ['x', 'a', 'x'])
+    assert get_coordinates_batch(client, ['x', 'a'], raise_on_error=False) == [None, (1.0, 2.0)]
+
+
+def test_cache_is_filled_and_used_offline(tmp_path):
+    cache = GeocodeCache(str(tmp_path))
+    client = FakeClient({'Mogan Gölü, Gölbaşı': (39.77, 32.79)})
+    
+    get_coordinates_batch(client, ['Mogan Gölü, Gölbaşı'], cache)
+    offline = get_coordinates_batch(None, ['mogan gölü,  gölbaşı'], cache)
+    
+    assert offline == [(39.77, 32.79)]
+    assert normalize_address('Mogan Gölü,  Gölbaşı') == 'mogan gölü, gölbaşı'
+    with pytest.raises(ValueError):
+        get_coordinates_batch(None, ['Eymir Gölü'], cache)
+    cache.close()
+
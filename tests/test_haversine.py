@@ -0,0 +1,67 @@
+"""
+Vektörize haversine mesafe testleri
+"""
+
+import numpy as np
+import pytest
+
+from core.compact import TriangularMatrix
+from core.haversine import (calculate_total_route_distance, haversine_distance,
+                            haversine_matrix, haversine_pairs)
+from tests.conftest import random_coordinates
+
+
+def scalar_matrix(coords_a, coords_b):
+    return np.array([[haversine_distance(a, b) for b in coords_b] for a in coords_a])
+
+
+def test_matrix_matches_scalar_formula():
+    coords = random_coordinates(12, seed=3)
+    matrix = haversine_matrix(coords)
+    
+    np.testing.assert_allclose(matrix, scalar_matrix(coords, coords), rtol=1e-9, atol=1e-9)
+    np.testing.assert_array_equal(matrix, matrix.T)
+    assert np.all(np.diag(matrix) == 0.0)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 5, 64])
+def test_chunking_does_not_change_result(chunk_size):
+    coords = random_coordinates(17, seed=4)
+    others = random_coordinates(6, seed=5)
+    
+    np.testing.assert_array_equal(haversine_matrix(coords, chunk_size=chunk_size),
+                                  haversine_matrix(coords))
+    np.testing.assert_allclose(haversine_matrix(coords, others, chunk_size=chunk_size),
+                               scalar_matrix(coords, others), rtol=1e-9, atol=1e-9)
+
+
+def test_packed_and_dtype():
+    coords = random_coordinates(11, seed=6)
+    dense = haversine_matrix(coords)
+    packed = haversine_matrix(coords, chunk_size=4, packed=True, dtype=np.float32)
+    
+    assert isinstance(packed, TriangularMatrix)
+    assert packed.dtype == np.float32
+    np.testing.assert_allclose(np.asarray(packed), dense, rtol=1e-6)
+    assert haversine_matrix(coords, dtype=np.float32).dtype == np.float32
+    
+    with pytest.raises(ValueError):
+        haversine_matrix(coords, random_coordinates(3), packed=True)
+
+
+def test_pairs_and_route_distance():
+    coords = random_coordinates(8, seed=7)
+    matrix = haversine_matrix(coords)
+    
+    np.testing.assert_allclose(haversine_pairs(coords[:-1], coords[1:]),
+                               [matrix[i, i + 1] for i in range(7)], rtol=1e-12)
+    assert calculate_total_route_distance(coords) == pytest.approx(
+        sum(matrix[i, i + 1] for i in range(7)))
+    assert calculate_total_route_distance(coords[:1]) == 0.0
+
+
+def test_known_distance():
+    matrix = haversine_matrix([(39.9334, 32.8597), (41.0082, 28.9784)])
+    
+    assert matrix[0, 1] == pytest.approx(349.36, abs=0.01)
+
@@ -0,0 +1,87 @@
+"""
+Ölçümleme (Instrumentation) testleri
+"""
+
+import numpy as np
+import pytest
+
+from core.ant_algorithm import AntColonyOptimizer
+from core.compact import TriangularMatrix
+from core.instrumentation import Hook, Instrumentation, pheromone_entropy
+from core.local_search import LocalSearch
+
+
+def naive_entropy(pheromone):
+    trails = np.array(pheromone, dtype=float)
+    np.fill_diagonal(trails, 0.0)
+    probabilities = trails / trails.sum(axis=1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        terms = np.where(probabilities > 0, probabilities * np.log(probabilities), 0.0)
+    return float((-terms.sum(axis=1) / np.log(len(trails) - 1)).mean())
+
+
+def test_entropy_matches_dense_formula_in_blocks():
+    # 1100 satır varsayılan blok boyutunda birden fazla bloğa bölünür
+    pheromone = np.random.default_rng(0).random((1100, 1100))
+    pheromone = pheromone + pheromone.T
+    packed = TriangularMatrix.from_dense(pheromone, dtype=np.float64)
+    
+    assert pheromone_entropy(pheromone) == pytest.approx(naive_entropy(pheromone))
+    assert pheromone_entropy(packed) == pytest.approx(naive_entropy(pheromone))
+    assert pheromone_entropy(np.ones((5, 5))) == pytest.approx(1.0)
+
+
+def test_entropy_is_sparse_by_default(matrix):
+    instrumentation = Instrumentation()
+    optimizer = AntColonyOptimizer(matrix, n_ants=4, n_iterations=20, seed=0,
+                                   instrumentation=instrumentation)
+    
+    optimizer.optimize()
+    
+    computed = [record['iteration'] for record in instrumentation.iterations
+                if record['entropy'] is not None]
+    assert computed == [10, 20]
+    assert instrumentation.phases['entropy'][1] == 2
+
+
+def test_reused_instrumentation_starts_fresh(matrix):
+    instrumentation = Instrumentation(entropy_interval=1)
+    optimizer = AntColonyOptimizer(matrix, n_ants=4, n_iterations=5, seed=0,
+                                   local_search=LocalSearch(matrix),
+                                   instrumentation=instrumentation)
+    
+    optimizer.optimize()
+    first = dict(instrumentation.counters)
+    optimizer.optimize()
+    
+    assert len(instrumentation.iterations) == 5
+    assert instrumentation.counters['ants_built'] == 20
+    assert instrumentation.counters['local_search_calls'] == first['local_search_calls']
+    assert instrumentation.phases['construct'][1] == 5
+
+
+def test_hooks_and_exports(matrix):
+    class Recorder(Hook):
+        def __init__(self):
+            self.phases, self.iterations, self.finished = set(), 0, False
+        
+        def on_phase(self, name, seconds):
+            self.phases.add(name)
+        
+        def on_iteration(self, record):
+            self.iterations += 1
+        
+        def on_run_end(self, instrumentation):
+            self.finished = True
+    
+    hook = Recorder()
+    instrumentation = Instrumentation(hooks=[hook])
+    AntColonyOptimizer(matrix, n_ants=4, n_iterations=3, seed=0,
+                       instrumentation=instrumentation).optimize()
+    
+    assert {'construct', 'pheromone'} <= hook.phases
+    assert hook.iterations == 3 and hook.finished
+    assert 'aco_ants_built_total{run="t"} 12' in instrumentation.to_prometheus(
+        labels={'run': 't'})
+    assert sum(row['share'] for row in instrumentation.breakdown()) <= 1.0 + 1e-9
+
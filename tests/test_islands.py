@@ -0,0 +1,66 @@
+"""
+Ada modeli (island model) testleri
+"""
+
+import pytest
+
+from core.islands import _Island, run_islands
+
+
+@pytest.mark.parametrize('migration', ['best', 'pheromone'])
+def test_processes_match_sequential(matrix, migration):
+    params = dict(n_islands=3, migration_interval=4, migration=migration, seed=5,
+                  n_ants=4, n_iterations=10)
+    
+    parallel = run_islands(matrix, processes=True, **params)
+    sequential = run_islands(matrix, processes=False, **params)
+    
+    assert parallel['best_distance'] == sequential['best_distance']
+    assert parallel['best_route'] == sequential['best_route']
+    assert [island['history'] for island in parallel['islands']] == \
+        [island['history'] for island in sequential['islands']]
+
+
+def test_shorter_migrant_tour_is_adopted(matrix):
+    donor = _Island(matrix, {'n_ants': 10, 'seed': 0}, start_city=0)
+    receiver = _Island(matrix, {'n_ants': 2, 'seed': 1}, start_city=0)
+    donor.run_epoch(3)
+    receiver.run_epoch(1)
+    message = {'route': donor.optimizer.best_route,
+               'distance': receiver.optimizer.best_distance / 2}
+    before = receiver.optimizer.pheromone.copy()
+    
+    receiver.migrate(message, blend_rate=0.1)
+    
+    assert receiver.optimizer.best_distance == message['distance']
+    assert receiver.optimizer.best_route == message['route']
+    assert (receiver.optimizer.pheromone >= before).all()
+    assert (receiver.optimizer.pheromone > before).any()
+
+
+def test_pheromone_migration_blends_trails(matrix):
+    island = _Island(matrix, {'n_ants': 2, 'seed': 0}, start_city=0)
+    island.run_epoch(1)
+    before = island.optimizer.pheromone.copy()
+    neighbour = {'route': None, 'distance': float('inf'), 'pheromone': before * 3}
+    
+    island.migrate(neighbour, blend_rate=0.25)
+    
+    assert island.optimizer.pheromone == pytest.approx(before * 1.5)
+
+
+def test_global_best_is_reported(matrix):
+    result = run_islands(matrix, n_islands=3, migration_interval=2, seed=0, n_ants=3,
+                         n_iterations=6, processes=False)
+    
+    route = result['best_route']
+    assert route[0] == route[-1] == 0 and sorted(route[:-1]) == list(range(len(matrix)))
+    assert result['best_distance'] == min(island['distance'] for island in result['islands'])
+
+
+def test_island_parameters_are_validated(matrix):
+    with pytest.raises(ValueError):
+        run_islands(matrix, n_islands=2, island_params=[{'beta': 5.0}], processes=False)
+    with pytest.raises(ValueError):
+        run_islands(matrix, migration='unknown', processes=False)
+
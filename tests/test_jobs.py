@@ -0,0 +1,78 @@
+"""
+Arka plan optimizasyon işi testleri
+"""
+
+import time
+
+import pytest
+
+from core.jobs import JobRunner, OptimizationJob
+
+
+TIMEOUT = 30.0
+
+
+def wait(poll, timeout=TIMEOUT):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = poll()
+        if status in ('done', 'cancelled', 'error'):
+            return status
+        time.sleep(0.01)
+    pytest.fail("İş zaman aşımına uğradı")
+
+
+def is_tour(route, n):
+    return route[0] == route[-1] == 0 and sorted(route[:-1]) == list(range(n))
+
+
+def test_job_runs_to_completion(matrix):
+    job = OptimizationJob(matrix, {'n_ants': 5, 'n_iterations': 15, 'seed': 1}, profile=True)
+    assert job.status == 'queued' and job.progress == 0.0
+    
+    job.start()
+    
+    assert wait(job.poll) == 'done'
+    assert is_tour(job.best_route, 20)
+    assert job.iteration == 15 and job.progress == 1.0
+    assert len(job.best_distance_history) == 15
+    assert job.best_distance == pytest.approx(job.best_distance_history[-1])
+    assert job.instrumentation is not None
+    assert job.distance_matrix is None
+
+
+def test_cancel_running_job_keeps_best_route(matrix):
+    job = OptimizationJob(matrix, {'n_ants': 5, 'n_iterations': 100000})
+    job.start()
+    while not job.best_distance_history and job.poll() == 'running':
+        time.sleep(0.01)
+    
+    job.cancel()
+    
+    assert wait(job.poll) == 'cancelled'
+    assert job.stop_reason == 'cancelled'
+    assert is_tour(job.best_route, 20)
+
+
+def test_worker_errors_are_reported(matrix):
+    job = OptimizationJob(matrix, {'unknown_parameter': 1})
+    job.start()
+    
+    assert wait(job.poll) == 'error'
+    assert 'unknown_parameter' in job.error
+
+
+def test_runner_limits_concurrent_jobs(matrix):
+    runner = JobRunner(max_running=1)
+    jobs = [runner.submit(OptimizationJob(matrix, {'n_ants': 5, 'n_iterations': 10}))
+            for _ in range(3)]
+    
+    assert [job.status for job in jobs] == ['running', 'queued', 'queued']
+    assert [runner.position(job) for job in jobs] == [None, 1, 2]
+    
+    jobs[2].cancel()
+    for job in jobs[:2]:
+        assert wait(lambda: runner.poll(job)) == 'done'
+    assert jobs[2].status == 'cancelled'
+    assert runner.position(jobs[2]) is None
+
@@ -0,0 +1,107 @@
+"""
+2-opt / Or-opt yerel arama testleri
+"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from core.ant_algorithm import AntColonyOptimizer
+from core.local_search import LocalSearch, _Tour
+from tests.conftest import euclidean_matrix
+
+
+def test_gain_equals_length_reduction(matrix):
+    local_search = LocalSearch(matrix)
+    route = list(np.random.default_rng(0).permutation(len(matrix)))
+    
+    improved, gain = local_search.improve(route)
+    
+    assert gain > 0
+    assert gain == pytest.approx(local_search.route_length(route)
+                                 - local_search.route_length(improved))
+    assert improved[0] == route[0] and sorted(improved) == sorted(route)
+    assert local_search.stats()['moves'] > 0
+
+
+def test_closed_route_format_is_kept(matrix):
+    route = list(range(len(matrix))) + [0]
+    
+    improved, _ = LocalSearch(matrix).improve(route)
+    
+    assert improved[0] == improved[-1] == 0
+    assert sorted(improved[:-1]) == list(range(len(matrix)))
+
+
+def test_two_opt_removes_crossing():
+    # Kare üzerinde kesişen tur: 0-2-1-3
+    points = np.array([[0, 0], [1, 0], [1, 1], [0, 1]], dtype=float)
+    matrix = np.linalg.norm(points[:, None] - points[None], axis=-1)
+    
+    improved, gain = LocalSearch(matrix, or_opt=False).improve([0, 2, 1, 3])
+    
+    assert gain == pytest.approx(2 * np.sqrt(2) - 2)
+    assert improved in ([0, 1, 2, 3], [0, 3, 2, 1])
+
+
+def test_reaches_optimum_on_small_instance():
+    matrix = euclidean_matrix(7, seed=3)
+    local_search = LocalSearch(matrix)
+    best = min(local_search.route_length((0,) + order)
+               for order in itertools.permutations(range(1, 7)))
+    
+    lengths = [local_search.route_length(local_search.improve(list(route))[0])
+               for route in (np.random.default_rng(seed).permutation(7) for seed in range(10))]
+    
+    assert min(lengths) == pytest.approx(best)
+
+
+def test_asymmetric_gain_is_exact():
+    matrix = np.random.default_rng(1).random((12, 12))
+    np.fill_diagonal(matrix, 0.0)
+    local_search = LocalSearch(matrix)
+    route = list(range(12))
+    
+    improved, gain = local_search.improve(route)
+    
+    assert not local_search.symmetric
+    assert gain == pytest.approx(local_search.route_length(route)
+                                 - local_search.route_length(improved))
+
+
+def test_optimizer_applies_local_search(matrix):
+    local_search = LocalSearch(matrix)
+    optimizer = AntColonyOptimizer(matrix, n_ants=5, n_iterations=5, seed=0,
+                                   local_search=local_search)
+    
+    route, _ = optimizer.optimize()
+    
+    assert local_search.stats()['calls'] == 5
+    # En iyi rota zaten yerel optimumdadır
+    assert local_search.improve(route)[1] == pytest.approx(0.0)
+
+
+@pytest.mark.parametrize('symmetric', [True, False])
+def test_move_segment_matches_rebuilt_tour(symmetric):
+    matrix = euclidean_matrix(15, seed=2)
+    rng = np.random.default_rng(0)
+    
+    for _ in range(200):
+        tour = _Tour(rng.permutation(15).tolist(), matrix, symmetric)
+        start, length = int(rng.integers(15)), int(rng.integers(1, 4))
+        segment = [tour.cities[(start + i) % 15] for i in range(length)]
+        rest = [tour.cities[(start + length + i) % 15] for i in range(15 - length)]
+        after = rest[int(rng.integers(len(rest)))]
+        reverse = bool(rng.integers(2))
+        
+        tour.move_segment(segment, after, reverse)
+        
+        index = rest.index(after) + 1
+        expected = rest[:index] + (segment[::-1] if reverse else segment) + rest[index:]
+        shift = tour.cities.index(expected[0])
+        assert tour.cities[shift:] + tour.cities[:shift] == expected
+        assert all(tour.cities[position] == city for city, position in tour.pos.items())
+        if not symmetric:
+            assert tour.forward[-1] == pytest.approx(LocalSearch(matrix).route_length(tour.cities))
+
@@ -0,0 +1,70 @@
+"""
+MatrixStore testleri
+"""
+
+import os
+
+import numpy as np
+
+from core.compact import TriangularMatrix
+from core.matrix_store import MatrixStore, matrix_key
+from tests.conftest import euclidean_matrix, random_coordinates
+
+
+def test_round_trip_is_memory_mapped(tmp_path):
+    store = MatrixStore(str(tmp_path))
+    distance = euclidean_matrix(8)
+    key = matrix_key(random_coordinates(8))
+    
+    store.put(key, distance, distance * 2)
+    loaded_distance, loaded_time = store.get(key)
+    
+    assert isinstance(loaded_distance, np.memmap)
+    np.testing.assert_array_equal(loaded_distance, distance)
+    np.testing.assert_array_equal(loaded_time, distance * 2)
+
+
+def test_packed_round_trip(tmp_path):
+    store = MatrixStore(str(tmp_path))
+    packed = TriangularMatrix.from_dense(euclidean_matrix(7))
+    
+    store.put('packed', packed, packed)
+    loaded, _ = store.get('packed')
+    
+    assert isinstance(loaded, TriangularMatrix)
+    np.testing.assert_array_equal(np.asarray(loaded), np.asarray(packed))
+
+
+def test_key_depends_on_content():
+    coordinates = random_coordinates(5)
+    
+    assert matrix_key(coordinates) == matrix_key(list(coordinates))
+    assert matrix_key(coordinates) != matrix_key(coordinates[::-1])
+    assert matrix_key(coordinates) != matrix_key(coordinates, compact=True)
+
+
+def test_eviction_keeps_pairs_being_written(tmp_path):
+    store = MatrixStore(str(tmp_path), max_entries=1)
+    matrix = euclidean_matrix(4)
+    # Başka bir süreç çiftin yalnızca mesafe dosyasını yazmış durumda
+    np.save(os.path.join(str(tmp_path), 'writing.distance.npy'), matrix)
+    
+    store.put('a', matrix, matrix)
+    store.put('b', matrix, matrix)
+    
+    assert os.path.exists(os.path.join(str(tmp_path), 'writing.distance.npy'))
+    assert store.get('writing') is None
+    assert os.path.exists(os.path.join(str(tmp_path), 'writing.distance.npy'))
+    assert 'a' not in store and 'b' in store
+
+
+def test_expired_entries_are_removed(tmp_path):
+    store = MatrixStore(str(tmp_path), ttl=60)
+    matrix = euclidean_matrix(4)
+    store.put('old', matrix, matrix)
+    for path in store._paths('old'):
+        os.utime(path, (0, 0))
+    
+    assert store.get('old') is None
+    assert store.keys() == []
+
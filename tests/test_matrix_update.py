@@ -0,0 +1,83 @@
+"""
+Artımlı mesafe matrisi güncelleme testleri
+"""
+
+import numpy as np
+import pytest
+
+from core.compact import is_packed
+from core.haversine import haversine_matrix
+from core.matrix_store import MatrixStore, matrix_key
+from core.matrix_utils import create_distance_matrix, update_distance_matrix
+from tests.conftest import random_coordinates
+
+
+class CountingFetcher:
+    """Haversine ile yanıt veren ve istenen eleman sayısını sayan fetcher taslağı"""
+    
+    def __init__(self):
+        self.elements = 0
+        self.stats = {'fallback_elements': 0}
+    
+    def fetch(self, origins, destinations=None):
+        distances = haversine_matrix(origins, destinations if destinations is not None
+                                     else origins)
+        self.elements += distances.size
+        return distances, distances * 2
+
+
+def test_update_matches_full_rebuild():
+    coords = random_coordinates(10, seed=1)
+    added = random_coordinates(3, seed=2)
+    distance, time = create_distance_matrix(coords, use_api=False)
+    
+    new_distance, new_time, new_coords, index_map = update_distance_matrix(
+        distance, time, coords, add=added, remove=[0, 4]
+    )
+    expected, _ = create_distance_matrix(new_coords, use_api=False)
+    
+    assert new_coords == [coords[i] for i in range(10) if i not in (0, 4)] + added
+    np.testing.assert_array_equal(index_map, [1, 2, 3, 5, 6, 7, 8, 9, -1, -1, -1])
+    np.testing.assert_allclose(new_distance, expected, atol=1e-9)
+    np.testing.assert_allclose(new_time, expected * 1.5, atol=1e-9)
+
+
+def test_update_keeps_packed_representation():
+    coords = random_coordinates(7, seed=3)
+    distance, time = create_distance_matrix(coords, use_api=False, compact=True)
+    
+    new_distance, new_time, new_coords, _ = update_distance_matrix(
+        distance, time, coords, add=random_coordinates(2, seed=4), remove=[6]
+    )
+    
+    assert is_packed(new_distance) and is_packed(new_time)
+    assert new_distance.dtype == np.float32
+    np.testing.assert_allclose(np.asarray(new_distance), haversine_matrix(new_coords),
+                               rtol=1e-5)
+
+
+def test_api_update_fetches_only_new_rows_and_columns(tmp_path):
+    coords = random_coordinates(12, seed=5)
+    added = random_coordinates(2, seed=6)
+    distance, time = create_distance_matrix(coords, use_api=False)
+    fetcher = CountingFetcher()
+    store = MatrixStore(str(tmp_path))
+    
+    new_distance, new_time, new_coords, _ = update_distance_matrix(
+        distance, time, coords, add=added, fetcher=fetcher, store=store
+    )
+    
+    assert fetcher.elements == 2 * 14 + 12 * 2
+    np.testing.assert_allclose(new_time[12:], new_distance[12:] * 2)
+    np.testing.assert_allclose(new_time[:12, :12], time)
+    stored = store.get(matrix_key(new_coords, source='api'))
+    np.testing.assert_array_equal(stored[0], new_distance)
+
+
+def test_invalid_indices_are_rejected():
+    coords = random_coordinates(4)
+    distance, time = create_distance_matrix(coords, use_api=False)
+    
+    with pytest.raises(IndexError):
+        update_distance_matrix(distance, time, coords, remove=[4])
+
@@ -0,0 +1,56 @@
+"""
+Çok süreçli rota oluşturma testleri
+"""
+
+import numpy as np
+import pytest
+
+from core.parallel import ParallelAntColonyOptimizer, ant_random_values
+
+
+def test_random_values_depend_only_on_seed_iteration_and_ant():
+    entropy = np.random.SeedSequence(7).entropy
+    
+    together = ant_random_values(entropy, 2, [0, 1, 2, 3], 5)
+    split = np.vstack([ant_random_values(entropy, 2, [0, 1], 5),
+                       ant_random_values(entropy, 2, [2, 3], 5)])
+    
+    np.testing.assert_array_equal(together, split)
+    assert not np.array_equal(together, ant_random_values(entropy, 3, [0, 1, 2, 3], 5))
+
+
+def assert_independent_of_worker_count(matrix, **options):
+    results = []
+    for n_workers in (1, 3):
+        optimizer = ParallelAntColonyOptimizer(matrix, n_workers=n_workers, n_ants=7,
+                                               n_iterations=5, seed=11, **options)
+        results.append(optimizer.optimize())
+        assert optimizer._pool is None and optimizer._segments == []
+    
+    assert results[0] == results[1]
+    route, _ = results[0]
+    assert sorted(route[:-1]) == list(range(len(matrix)))
+
+
+def test_seeded_result_is_independent_of_worker_count(matrix):
+    assert_independent_of_worker_count(matrix)
+
+
+def test_compact_result_is_independent_of_worker_count(matrix):
+    assert_independent_of_worker_count(matrix, compact=True)
+
+
+def test_pheromone_updates_survive_close(matrix):
+    optimizer = ParallelAntColonyOptimizer(matrix, n_workers=2, n_ants=4, n_iterations=3, seed=0)
+    initial = np.array(optimizer.pheromone)
+    
+    optimizer.optimize()
+    
+    assert isinstance(optimizer.pheromone, np.ndarray)
+    assert not np.array_equal(optimizer.pheromone, initial)
+
+
+def test_acs_is_rejected(matrix):
+    with pytest.raises(ValueError):
+        ParallelAntColonyOptimizer(matrix, strategy='acs')
+
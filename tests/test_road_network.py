@@ -0,0 +1,91 @@
+"""
+Yerel yol ağı üzerinde mesafe testleri
+"""
+
+import numpy as np
+import pytest
+
+from core.haversine import haversine_distance
+from core.road_network import RoadNetwork, RoadNetworkFetcher
+
+
+NODES = [('a', 39.90, 32.80), ('b', 39.90, 32.81), ('c', 39.90, 32.82), ('d', 39.91, 32.82)]
+
+# A-C doğrudan yol daha kısa ama daha yavaş; C-D tek yön
+EDGES = [('a', 'b', 1000, 60, 0), ('b', 'c', 1000, 60, 0), ('a', 'c', 1500, 200, 0),
+         ('c', 'd', 2000, 100, 1)]
+
+COORDINATES = [(lat, lng) for _, lat, lng in NODES]
+
+
+@pytest.fixture
+def network(tmp_path):
+    nodes = tmp_path / 'nodes.csv'
+    edges = tmp_path / 'edges.csv'
+    nodes.write_text('id,lat,lng\n' + ''.join(f'{n},{lat},{lng}\n' for n, lat, lng in NODES))
+    edges.write_text('source,target,length,duration,oneway\n'
+                     + ''.join(','.join(map(str, edge)) + '\n' for edge in EDGES))
+    return RoadNetwork.from_csv(str(nodes), str(edges))
+
+
+def test_csv_loading(network, tmp_path):
+    assert network.n_nodes == 4
+    assert network.n_edges == 7
+    
+    path = str(tmp_path / 'network.npz')
+    network.save(path)
+    loaded = RoadNetwork.load(path)
+    assert loaded.fingerprint == network.fingerprint
+    np.testing.assert_array_equal(loaded.node_ids, ['a', 'b', 'c', 'd'])
+
+
+def test_fastest_and_shortest_paths(network):
+    distances, times = RoadNetworkFetcher(network, max_workers=1).fetch(COORDINATES)
+    
+    assert distances[0, 2] == pytest.approx(2.0)
+    assert times[0, 2] == pytest.approx(2.0)
+    assert distances[0, 3] == pytest.approx(4.0)
+    assert times[0, 3] == pytest.approx(2.0 + 100 / 60)
+    assert np.all(np.diag(distances) == 0.0)
+    
+    distances, times = RoadNetworkFetcher(network, weight='length', max_workers=1).fetch(
+        COORDINATES)
+    assert distances[0, 2] == pytest.approx(1.5)
+    assert times[0, 2] == pytest.approx(200 / 60)
+
+
+def test_unreachable_pairs_fall_back_to_haversine(network):
+    fetcher = RoadNetworkFetcher(network, max_workers=1)
+    distances, times = fetcher.fetch(COORDINATES)
+    
+    assert distances[3, 0] == pytest.approx(haversine_distance(COORDINATES[3], COORDINATES[0]))
+    assert times[3, 0] == pytest.approx(distances[3, 0] * fetcher.time_factor)
+    assert fetcher.stats['fallback_elements'] == 3
+
+
+def test_snap_offset_and_pair_cache(network):
+    fetcher = RoadNetworkFetcher(network, max_workers=1)
+    nearby = (39.9005, 32.80)
+    
+    distances, _ = fetcher.fetch([nearby], [COORDINATES[2]])
+    offset = haversine_distance(nearby, COORDINATES[0])
+    assert distances[0, 0] == pytest.approx(2.0 + offset)
+    
+    fetcher.fetch([COORDINATES[0]], [COORDINATES[2]])
+    assert fetcher.stats['searches'] == 0
+    assert fetcher.stats['cached_pairs'] == 1
+
+
+def test_parallel_search_matches_serial(network):
+    serial = RoadNetworkFetcher(network, max_workers=1).fetch(COORDINATES)
+    parallel = RoadNetworkFetcher(network, max_workers=2, min_parallel_sources=1).fetch(
+        COORDINATES)
+    
+    np.testing.assert_array_equal(serial[0], parallel[0])
+    np.testing.assert_array_equal(serial[1], parallel[1])
+
+
+def test_unknown_weight_is_rejected(network):
+    with pytest.raises(ValueError):
+        RoadNetworkFetcher(network, weight='fuel')
+
@@ -0,0 +1,94 @@
+"""
+Izgara indeksi ve seyrek k-NN grafiği testleri
+"""
+
+import numpy as np
+import pytest
+
+from core.haversine import haversine_matrix
+from core.spatial import CandidatePheromone, GridIndex, KNNGraph, is_graph
+from tests.conftest import random_coordinates
+
+
+def brute_force_knn(coordinates, k):
+    distances = haversine_matrix(coordinates)
+    np.fill_diagonal(distances, np.inf)
+    order = np.argsort(distances, axis=1, kind='stable')[:, :k]
+    return order, np.take_along_axis(distances, order, axis=1)
+
+
+@pytest.mark.parametrize('cell_size_km', [None, 0.5, 50.0])
+def test_knn_matches_brute_force(cell_size_km):
+    coordinates = random_coordinates(150, seed=1)
+    _, expected = brute_force_knn(coordinates, 6)
+    
+    indices, distances = GridIndex(coordinates, cell_size_km=cell_size_km).knn(6)
+    
+    np.testing.assert_allclose(distances, expected, rtol=1e-12)
+    assert not np.any(indices == np.arange(150)[:, None])
+    np.testing.assert_allclose(np.take_along_axis(haversine_matrix(coordinates), indices, 1),
+                               distances, rtol=1e-12)
+
+
+def test_knn_on_clustered_points():
+    rng = np.random.default_rng(2)
+    centers = np.array([[39.9, 32.8], [39.2, 33.5]])
+    points = centers[rng.integers(0, 2, 80)] + rng.normal(0, 0.002, (80, 2))
+    _, expected = brute_force_knn(points, 4)
+    
+    _, distances = GridIndex(points).knn(4)
+    
+    np.testing.assert_allclose(distances, expected, rtol=1e-12)
+
+
+def test_query_caps_k_and_handles_outside_points():
+    coordinates = random_coordinates(5, seed=3)
+    index = GridIndex(coordinates)
+    
+    indices, distances = index.query([(41.0, 29.0)], k=10)
+    
+    assert indices.shape == (1, 5)
+    np.testing.assert_allclose(distances[0], np.sort(haversine_matrix([(41.0, 29.0)],
+                                                                      coordinates)[0]))
+    assert index.knn(10)[0].shape == (5, 4)
+
+
+def test_graph_mimics_dense_matrix():
+    coordinates = random_coordinates(30, seed=4)
+    dense = haversine_matrix(coordinates)
+    graph = KNNGraph.from_coordinates(coordinates, k=5)
+    time = graph.scaled(1.5)
+    
+    assert is_graph(graph) and graph.shape == (30, 30) and graph.k == 5
+    assert graph[3, 17] == pytest.approx(dense[3, 17])
+    assert graph[3, 17] == graph[17, 3]
+    np.testing.assert_allclose(graph[[1, 2], [7, 8]], dense[[1, 2], [7, 8]])
+    np.testing.assert_allclose(graph[4], dense[4])
+    np.testing.assert_allclose(np.asarray(time), dense * 1.5)
+    np.testing.assert_allclose(graph.neighbor_distances,
+                               np.take_along_axis(dense, graph.neighbors.astype(np.intp), 1))
+
+
+def test_graph_counts_distance_cache_hits():
+    graph = KNNGraph.from_coordinates(random_coordinates(10, seed=5), k=3)
+    time = graph.scaled(1.5)
+    
+    graph[2, 7]
+    graph[7, 2]
+    time[2, 7]
+    
+    assert graph.cache_stats == time.cache_stats == {'hits': 2, 'misses': 1}
+
+
+def test_candidate_pheromone_outside_value():
+    candidates = np.array([[1, 2], [0, 2], [0, 1], [2, 1]])
+    pheromone = CandidatePheromone(candidates, 1.0)
+    
+    pheromone.add_at([0, 0, 3], [1, 3, 2], [0.5, 9.0, 0.25])
+    pheromone *= 0.5
+    
+    assert pheromone[0, 1] == 0.75
+    assert pheromone[0, 3] == pheromone.outside == 0.5
+    assert pheromone[3, 2] == 0.625
+    np.testing.assert_array_equal(pheromone[0], [0.5, 0.75, 0.5, 0.5])
+
@@ -0,0 +1,43 @@
+"""
+Açılış benchmark'ı testleri
+"""
+
+import pytest
+
+from benchmarks.startup import BUDGETS_MS, FORBIDDEN, check, measure, parse_importtime
+
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        300 |     numpy.core
+import time:      1500 |       1800 |   numpy
+import time:        40 |       1960 | core.ant_algorithm
+"""
+
+
+def test_parse_importtime():
+    records = parse_importtime(IMPORTTIME + "Traceback yok\n")
+    
+    assert records == [('_io', 120, 120, 1), ('numpy.core', 300, 300, 2),
+                       ('numpy', 1500, 1800, 1), ('core.ant_algorithm', 40, 1960, 0)]
+
+
+def test_check_reports_budget_and_forbidden_packages():
+    result = {'entry': 'core', 'import_ms': BUDGETS_MS['core'] + 1, 'heavy': ['pandas']}
+    
+    violations = check(result)
+    
+    assert len(violations) == 2
+    assert 'pandas' in violations[1]
+    assert check(result, budget_scale=2.0) == [violations[1]]
+    assert check({'entry': 'app', 'import_ms': 0, 'heavy': ['pandas', 'streamlit']}) == []
+
+
+@pytest.mark.parametrize('entry', ['core', 'batch'])
+def test_entry_points_do_not_import_heavy_packages(entry):
+    result = measure(entry, repeat=1)
+    
+    assert result['modules'] > 0
+    assert not set(result['heavy']) & set(FORBIDDEN[entry])
+
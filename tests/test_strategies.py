@@ -0,0 +1,97 @@
+"""
+MMAS / ACS stratejileri ve durağanlık ölçütleri testleri
+"""
+
+import numpy as np
+import pytest
+
+from core.ant_algorithm import AntColonyOptimizer, STRATEGIES
+from tests.conftest import euclidean_matrix
+
+
+def naive_branching_factor(pheromone, lam=0.05):
+    trails = np.array(pheromone, dtype=float)
+    np.fill_diagonal(trails, np.nan)
+    row_min, row_max = np.nanmin(trails, axis=1), np.nanmax(trails, axis=1)
+    with np.errstate(invalid='ignore'):
+        return float((trails >= (row_min + lam * (row_max - row_min))[:, None]).sum(axis=1).mean())
+
+
+@pytest.mark.parametrize('strategy', STRATEGIES)
+def test_single_city(strategy):
+    optimizer = AntColonyOptimizer(np.zeros((1, 1)), n_ants=3, n_iterations=3,
+                                   strategy=strategy, min_branching_factor=1.5)
+    
+    route, distance = optimizer.optimize()
+    
+    assert route == [0, 0]
+    assert distance == 0.0
+
+
+def assert_branching_factor_matches_dense_formula(matrix, **options):
+    optimizer = AntColonyOptimizer(matrix, n_ants=5, n_iterations=5, strategy='mmas',
+                                   seed=0, **options)
+    optimizer.optimize()
+    
+    assert optimizer.branching_factor() == pytest.approx(
+        naive_branching_factor(optimizer.pheromone))
+
+
+def test_branching_factor_matches_dense_formula(matrix):
+    assert_branching_factor_matches_dense_formula(matrix)
+
+
+def test_packed_branching_factor_matches_dense_formula(matrix):
+    assert_branching_factor_matches_dense_formula(matrix, compact=True)
+
+
+def test_mmas_branching_check_waits_for_warmup(matrix):
+    optimizer = AntColonyOptimizer(matrix, n_ants=5, n_iterations=100, strategy='mmas',
+                                   seed=0, evaporation_rate=0.2, min_branching_factor=2.5)
+    optimizer.run_iteration()
+    
+    # İlk en iyi birikimden sonra faktör ~2'ye düşer; ısınma bitmeden durulmaz
+    assert optimizer.branching_factor() < 2.5
+    assert not optimizer.converged
+    assert optimizer.branching_warmup == 14
+    
+    optimizer.optimize()
+    assert len(optimizer.best_distance_history) >= optimizer.branching_warmup
+
+
+def test_mmas_vectorized_construction_matches_per_ant_loop(matrix):
+    batched = AntColonyOptimizer(matrix, n_ants=8, strategy='mmas', seed=0)
+    looped = AntColonyOptimizer(matrix, n_ants=8, strategy='mmas', seed=0, vectorized=False)
+    random_values = np.random.default_rng(1).random((8, len(matrix) - 1))
+    
+    np.testing.assert_array_equal(batched.construct_solutions(3, random_values),
+                                  looped.construct_solutions(3, random_values))
+
+
+def test_mmas_trails_stay_within_limits(matrix):
+    optimizer = AntColonyOptimizer(matrix, n_ants=5, n_iterations=20, strategy='mmas', seed=0)
+    optimizer.optimize()
+    
+    off_diagonal = optimizer.pheromone[~np.eye(len(matrix), dtype=bool)]
+    assert off_diagonal.min() >= optimizer.tau_min - 1e-12
+    assert off_diagonal.max() <= optimizer.tau_max + 1e-12
+
+
+def test_patience_stops_early():
+    optimizer = AntColonyOptimizer(euclidean_matrix(8), n_ants=10, n_iterations=200,
+                                   seed=0, patience=5)
+    
+    optimizer.optimize()
+    
+    assert len(optimizer.best_distance_history) < 200
+
+
+@pytest.mark.parametrize('strategy', STRATEGIES)
+def test_strategies_find_valid_tours(matrix, strategy):
+    optimizer = AntColonyOptimizer(matrix, n_ants=10, n_iterations=30, strategy=strategy, seed=0)
+    
+    route, distance = optimizer.optimize()
+    
+    assert sorted(route[:-1]) == list(range(len(matrix)))
+    assert distance == pytest.approx(optimizer.calculate_route_distance(route[:-1]))
+
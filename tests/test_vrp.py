@@ -0,0 +1,82 @@
+"""
+Çok ekipli rota bölme (VRP) testleri
+"""
+
+import itertools
+
+import pytest
+
+from core.vrp import FleetPlanner, split_tour
+from tests.conftest import euclidean_matrix
+
+
+@pytest.fixture
+def times():
+    return euclidean_matrix(13, seed=3) * 30
+
+
+def tour_duration(stops, times, service_time):
+    path = [0] + list(stops) + [0]
+    return sum(times[a, b] for a, b in zip(path, path[1:])) + service_time * len(stops)
+
+
+def brute_force_split(tour, times, max_duration, service_time):
+    best = None
+    for n_cuts in range(len(tour)):
+        for cuts in itertools.combinations(range(1, len(tour)), n_cuts):
+            bounds = (0,) + cuts + (len(tour),)
+            routes = [tour[a:b] for a, b in zip(bounds, bounds[1:])]
+            durations = [tour_duration(route, times, service_time) for route in routes]
+            if max(durations) <= max_duration and (best is None or sum(durations) < best):
+                best = sum(durations)
+    return best
+
+
+@pytest.mark.parametrize('max_duration', [80.0, 120.0, 200.0])
+def test_split_is_optimal_and_feasible(times, max_duration):
+    tour = list(range(1, 11))
+    
+    routes = split_tour(tour, times, max_duration, service_time=5.0)
+    durations = [tour_duration(route, times, 5.0) for route in routes]
+    
+    assert [city for route in routes for city in route] == tour
+    assert max(durations) <= max_duration
+    assert sum(durations) == pytest.approx(brute_force_split(tour, times, max_duration, 5.0))
+
+
+def test_split_rejects_unreachable_stop(times):
+    with pytest.raises(ValueError):
+        split_tour([1, 2, 3], times, max_duration=1.0)
+
+
+def test_improve_keeps_durations_in_sync(times):
+    planner = FleetPlanner(times, shift_duration=150.0, service_time=5.0, n_workers=1, seed=1)
+    routes = [[1, 5, 9], [2, 6, 10], [3, 7, 11], [4, 8, 12]]
+    durations = [planner.route_duration(route) for route in routes]
+    
+    assert planner.improve(routes, durations) > 0
+    assert sorted(city for route in routes for city in route) == list(range(1, 13))
+    for route, duration in zip(routes, durations):
+        assert duration == pytest.approx(planner.route_duration(route))
+        assert duration <= 150.0 + 1e-9
+
+
+def test_plan_respects_shift_and_assigns_teams(times):
+    planner = FleetPlanner(times, distance_matrix=times / 30, n_teams=2, shift_duration=120.0,
+                           service_time=5.0, n_workers=1, seed=2,
+                           route_params={'n_iterations': 10}, tour_params={'n_iterations': 10})
+    
+    plan = planner.plan()
+    visited = [city for item in plan['routes'] for city in item['route'][1:-1]]
+    
+    assert sorted(visited) == list(range(1, 13))
+    assert all(item['route'][0] == item['route'][-1] == 0 for item in plan['routes'])
+    assert all(item['duration'] <= 120.0 + 1e-9 for item in plan['routes'])
+    assert [(item['day'], item['team']) for item in plan['routes']] == [
+        (index // 2 + 1, index % 2 + 1) for index in range(len(plan['routes']))]
+    assert plan['n_days'] == (len(plan['routes']) + 1) // 2
+    assert plan['total_duration'] == pytest.approx(sum(item['duration']
+                                                       for item in plan['routes']))
+    assert plan['total_distance'] == pytest.approx(plan['total_duration'] / 30
+                                                   - 5.0 * 12 / 30)
+
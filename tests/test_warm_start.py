@@ -0,0 +1,107 @@
+"""
+Isıtılmış (warm-start) yeniden optimizasyon testleri
+"""
+
+import numpy as np
+import pytest
+
+from core.ant_algorithm import AntColonyOptimizer
+from core.compact import TriangularMatrix
+from core.haversine import haversine_matrix
+from core.spatial import CandidatePheromone, KNNGraph
+from core.warm_start import build_index_map, remap_pheromone, warm_start
+from tests.conftest import random_coordinates
+
+
+def test_build_index_map():
+    index_map = build_index_map(['a', 'b', 'c'], ['c', 'x', 'a'])
+    
+    assert index_map.tolist() == [2, -1, 0]
+
+
+def symmetric_pheromone():
+    pheromone = np.arange(16, dtype=float).reshape(4, 4)
+    return pheromone + pheromone.T
+
+
+def assert_kept_edges_carried(source, pheromone):
+    remapped = remap_pheromone(source, [2, -1, 0], fill_value=-1.0)
+    
+    assert remapped[0, 2] == pheromone[2, 0]
+    assert remapped[2, 0] == pheromone[0, 2]
+    assert remapped[0, 0] == pheromone[2, 2]
+    assert (remapped[1] == -1.0).all() and (remapped[:, 1] == -1.0).all()
+
+
+def test_remap_carries_kept_edges():
+    pheromone = symmetric_pheromone()
+    assert_kept_edges_carried(pheromone, pheromone)
+
+
+def test_remap_carries_kept_packed_edges():
+    pheromone = symmetric_pheromone()
+    assert_kept_edges_carried(TriangularMatrix.from_dense(pheromone, dtype=np.float64), pheromone)
+
+
+def test_remap_onto_candidate_edges():
+    pheromone = np.arange(25, dtype=float).reshape(5, 5)
+    candidates = np.array([[1, 2], [0, 2], [0, 1]])
+    
+    remapped = remap_pheromone(pheromone, [4, -1, 0], fill_value=-1.0, candidates=candidates)
+    
+    assert isinstance(remapped, CandidatePheromone)
+    assert remapped.data.tolist() == [[-1.0, pheromone[4, 0]], [-1.0, -1.0],
+                                      [pheromone[0, 4], -1.0]]
+
+
+def test_closed_route_is_not_duplicated(matrix):
+    previous = AntColonyOptimizer(matrix, n_ants=5, n_iterations=5, seed=0)
+    route, _ = previous.optimize()
+    state = previous.get_state()
+    state['best_route'] = route  # başlangıca dönen kapalı rota
+    
+    optimizer = warm_start(state, matrix, np.arange(len(matrix)), n_ants=5, n_iterations=5)
+    
+    assert optimizer.best_route == route[:-1]
+    assert sorted(optimizer.best_route) == list(range(len(matrix)))
+
+
+def test_added_and_removed_points_are_remapped(matrix):
+    previous = AntColonyOptimizer(matrix, n_ants=5, n_iterations=10, seed=0)
+    previous.optimize()
+    # 3. nokta silindi, sona yeni bir nokta eklendi
+    keep = [i for i in range(len(matrix)) if i != 3]
+    new_matrix = np.pad(matrix[np.ix_(keep, keep)], (0, 1), constant_values=0.5)
+    np.fill_diagonal(new_matrix, 0.0)
+    index_map = np.array(keep + [-1])
+    
+    optimizer = warm_start(previous, new_matrix, index_map, n_ants=5, n_iterations=5)
+    route, distance = optimizer.optimize()
+    
+    assert sorted(optimizer.best_route) == list(range(len(new_matrix)))
+    assert sorted(route[:-1]) == list(range(len(new_matrix)))
+    assert distance <= optimizer.calculate_route_distance(optimizer.best_route) + 1e-9
+
+
+@pytest.mark.parametrize('source', ['dense', 'compact', 'graph'])
+def test_sparse_warm_start(source):
+    coordinates = random_coordinates(40)
+    if source == 'graph':
+        previous = AntColonyOptimizer(KNNGraph.from_coordinates(coordinates, k=8), n_ants=5,
+                                      n_iterations=5, seed=0, strategy='mmas')
+    else:
+        previous = AntColonyOptimizer(haversine_matrix(coordinates), n_ants=5, n_iterations=5,
+                                      seed=0, strategy='mmas', compact=source == 'compact')
+    previous.optimize()
+    new_coordinates = coordinates[1:] + random_coordinates(2, seed=1)
+    graph = KNNGraph.from_coordinates(new_coordinates, k=8)
+    index_map = np.array(list(range(1, 40)) + [-1, -1])
+    
+    optimizer = warm_start(previous, graph, index_map, start_city=0, n_ants=5,
+                           n_iterations=5, strategy='mmas')
+    route, _ = optimizer.optimize()
+    
+    assert isinstance(optimizer.pheromone, CandidatePheromone)
+    assert sorted(route[:-1]) == list(range(41))
+    assert route[0] == route[-1] == 0
+
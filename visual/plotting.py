@@ -1,9 +1,10 @@
 """
 Yol ve Yakınsama Grafiklerinin Görselleştirilmesi
+
+matplotlib ve folium ağır bağımlılıklardır; ilk kullanıldıkları fonksiyonda
+yüklenirler, böylece modülü içe aktarmak uygulama açılışını yavaşlatmaz.
 """
 
-import matplotlib.pyplot as plt
-import folium
 from config import VisualizationConfig
 
 
@@ -17,6 +18,8 @@ def plot_convergence(aco_optimizer):
     Returns:
         matplotlib.figure.Figure: Grafik objesi
     """
+    import matplotlib.pyplot as plt
+    
     history = aco_optimizer.best_distance_history
     
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=VisualizationConfig.FIGURE_SIZE)
@@ -63,6 +66,7 @@ def create_interactive_map(optimal_route, coordinates, distance_matrix, time_mat
     Returns:
         folium.Map: Harita objesi
     """
+    import folium
     from config import ACOConfig
     
     # Harita oluştur
@@ -106,8 +110,8 @@ def create_interactive_map(optimal_route, coordinates, distance_matrix, time_mat
             # Önceki noktadan mesafe bilgisi
             if i > 0:
                 prev_idx = optimal_route[i-1]
-                distance = distance_matrix[prev_idx][idx]
-                time = time_matrix[prev_idx][idx]
+                distance = distance_matrix[prev_idx, idx]
+                time = time_matrix[prev_idx, idx]
                 distance_info = f"<br><b>Mesafe:</b> {distance:.2f} km<br><b>Süre:</b> {time:.0f} dk"
             else:
                 distance_info = ""